@@ -1,28 +1,98 @@
 """FastAPI dependency functions for authentication and authorization."""
 
-from fastapi import Depends, HTTPException, status
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from motor.motor_asyncio import AsyncIOMotorCollection
 
-from src.database.connection import Database
-from src.database.models import UserModel, UserRole
+from src.database.models import UserRole
 from app.auth.jwt_handler import decode_access_token
+from app.utils.ttl_cache import TTLCache
 
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Cache of authenticated users keyed by username
+USER_CACHE_MAXSIZE = 5000
+USER_CACHE_TTL_SECONDS = 30
+_user_cache = TTLCache(maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+# Only the fields needed for authorization decisions
+AUTH_USER_PROJECTION = {"_id": 1, "username": 1, "is_active": 1, "role": 1}
+
+
+@dataclass(slots=True)
+class AuthUser:
+    """Lightweight authenticated user carrying only what authorization needs."""
+
+    id: Any
+    username: str
+    role: UserRole
+    is_active: bool
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserModel:
+
+def invalidate_cached_user(username: str) -> None:
     """
-    Get the current authenticated user from JWT token.
+    Drop a user from the authentication cache.
 
-    Decodes the JWT token, extracts the username, and queries MongoDB
-    to retrieve the user information.
+    Must be called by any endpoint that mutates a user document.
 
     Args:
-        token: JWT token string extracted from Authorization header
+        username: Username whose cached entry should be removed
+    """
+    _user_cache.pop(username)
+
+
+async def _get_user_cached(
+    username: str, users_collection: AsyncIOMotorCollection
+) -> Optional[AuthUser]:
+    """
+    Get a user by username, using the in-process user cache.
+
+    Only the fields needed for authorization are fetched from MongoDB.
+
+    Args:
+        username: Username to look up
+        users_collection: Users collection to query on a cache miss
 
     Returns:
-        UserModel: The authenticated user model
+        Optional[AuthUser]: The authenticated user, or None if the user does not exist
+    """
+    user = _user_cache.get(username)
+    if user is not None:
+        return user
+
+    user_doc = await users_collection.find_one(
+        {"username": username}, projection=AUTH_USER_PROJECTION
+    )
+    if not user_doc:
+        return None
+
+    user = AuthUser(
+        id=user_doc["_id"],
+        username=user_doc["username"],
+        role=UserRole(user_doc.get("role", UserRole.VIEWER)),
+        is_active=user_doc.get("is_active", True),
+    )
+    _user_cache.set(username, user)
+    return user
+
+
+async def _authenticate(token: str, users_collection: AsyncIOMotorCollection) -> AuthUser:
+    """
+    Resolve the authenticated user for a JWT token.
+
+    Decodes the JWT token, extracts the username, and retrieves the user
+    from the user cache, querying MongoDB on a miss.
+
+    Args:
+        token: JWT token string
+        users_collection: Users collection to query on a cache miss
+
+    Returns:
+        AuthUser: The authenticated user
 
     Raises:
         HTTPException: With 401 status code if:
@@ -47,25 +117,17 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserModel:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Query MongoDB users collection
+    # Look up the user (cached)
     try:
-        database = Database.get_database()
-        users_collection = database["users"]
+        user = await _get_user_cached(username, users_collection)
 
-        # Find user by username
-        user_doc = await users_collection.find_one({"username": username})
-
-        if not user_doc:
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Convert MongoDB document to UserModel
-        # Pydantic will handle _id -> id conversion via alias
-        user = UserModel(**user_doc)
-
         return user
 
     except HTTPException:
@@ -77,94 +139,118 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserModel:
         )
 
 
-async def get_current_active_user(
-    current_user: UserModel = Depends(get_current_user),
-) -> UserModel:
+async def get_current_user(
+    request: Request, token: str = Depends(oauth2_scheme)
+) -> AuthUser:
     """
-    Get the current active user.
-
-    Checks if the user account is active before allowing access.
+    Get the current authenticated user from JWT token.
 
     Args:
-        current_user: The current authenticated user from get_current_user
+        request: Incoming request (provides the users collection via app state)
+        token: JWT token string extracted from Authorization header
 
     Returns:
-        UserModel: The active user model
+        AuthUser: The authenticated user
 
     Raises:
-        HTTPException: With 400 status code if user is inactive
+        HTTPException: With 401 status code if the token or user is invalid
     """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user account",
-        )
-    return current_user
+    return await _authenticate(token, request.app.state.users_collection)
 
 
-async def require_admin(
-    current_user: UserModel = Depends(get_current_active_user),
-) -> UserModel:
+async def get_current_active_user(
+    current_user: AuthUser = Depends(get_current_user),
+) -> AuthUser:
     """
-    Require admin role for access.
+    Get the current active user.
 
-    Checks if the user has ADMIN role before allowing access.
+    Checks if the user account is active before allowing access.
 
     Args:
-        current_user: The current active user from get_current_active_user
+        current_user: The current authenticated user from get_current_user
 
     Returns:
-        UserModel: The admin user model
+        AuthUser: The active user
 
     Raises:
-        HTTPException: With 403 status code if user is not an admin
+        HTTPException: With 400 status code if user is inactive
     """
-    if current_user.role != UserRole.ADMIN:
+    if not current_user.is_active:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions: Admin role required",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user account",
         )
     return current_user
 
 
-async def require_operator(
-    current_user: UserModel = Depends(get_current_active_user),
-) -> UserModel:
+class RequireRole:
     """
-    Require operator or admin role for access.
+    Dependency that authenticates the user and enforces a role requirement.
 
-    Checks if the user has OPERATOR or ADMIN role before allowing access.
-
-    Args:
-        current_user: The current active user from get_current_active_user
-
-    Returns:
-        UserModel: The operator or admin user model
-
-    Raises:
-        HTTPException: With 403 status code if user is neither operator nor admin
+    Token decoding, user lookup, the active-account check and the role check
+    all run in a single dependency call. Instances are created once at import
+    time and reused, so FastAPI's per-request dependency cache keys on the
+    same object across endpoints.
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.OPERATOR]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions: Operator or Admin role required",
-        )
-    return current_user
 
+    def __init__(self, *roles: UserRole, detail: str = "Insufficient permissions"):
+        """
+        Initialize the role requirement.
+
+        Args:
+            *roles: Roles allowed to access the resource (any role if empty)
+            detail: Error detail returned when the role check fails
+        """
+        self.roles = frozenset(roles)
+        self.detail = detail
+
+    async def __call__(
+        self, request: Request, token: str = Depends(oauth2_scheme)
+    ) -> AuthUser:
+        """
+        Authenticate the request and check the user's role.
+
+        Args:
+            request: Incoming request (provides the users collection via app state)
+            token: JWT token string extracted from Authorization header
+
+        Returns:
+            AuthUser: The authenticated active user
+
+        Raises:
+            HTTPException: 401 if authentication fails, 400 if the user is
+                inactive, 403 if the user's role is not allowed
+        """
+        current_user = await _authenticate(token, request.app.state.users_collection)
+
+        if not current_user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Inactive user account",
+            )
 
-async def require_viewer(
-    current_user: UserModel = Depends(get_current_active_user),
-) -> UserModel:
-    """
-    Require any authenticated active user (all roles allowed).
+        if self.roles and current_user.role not in self.roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=self.detail,
+            )
+        return current_user
 
-    Any authenticated and active user can access resources protected by this dependency.
 
-    Args:
-        current_user: The current active user from get_current_active_user
+# Require admin role for access
+require_admin = RequireRole(
+    UserRole.ADMIN,
+    detail="Insufficient permissions: Admin role required",
+)
 
-    Returns:
-        UserModel: The authenticated active user model
-    """
-    return current_user
+# Roles allowed on operator-level endpoints
+_OPERATOR_ROLES = frozenset({UserRole.ADMIN, UserRole.OPERATOR})
+
+# Require operator or admin role for access
+require_operator = RequireRole(
+    *_OPERATOR_ROLES,
+    detail="Insufficient permissions: Operator or Admin role required",
+)
 
+# Require any authenticated active user (all roles allowed)
+require_viewer = RequireRole()
@@ -1,38 +1,45 @@
 """JWT token management for authentication."""
 
+import hashlib
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional
 
+import jwt
 from fastapi import HTTPException, status
-from jose import JWTError, ExpiredSignatureError, jwt
+from jwt import ExpiredSignatureError, InvalidTokenError
 from dotenv import load_dotenv
 
+from app.utils.ttl_cache import TTLCache
+
 # Load environment variables from .env file
 load_dotenv()
 
-# JWT configuration
+# JWT configuration (fail fast at import if the secret is missing)
+SECRET_KEY = os.getenv("SECRET_KEY")
+if not SECRET_KEY:
+    raise ValueError(
+        "SECRET_KEY environment variable is not set. "
+        "Please set it in your .env file or environment."
+    )
+
+# HMAC key bytes, encoded once rather than on every sign/verify
+_SIGNING_KEY = SECRET_KEY.encode("utf-8")
+
 ALGORITHM = "HS256"
 DEFAULT_EXPIRATION_HOURS = 24
 
+# Cache of successfully decoded tokens, keyed by a digest of the raw token.
+# Entries never outlive the token's own "exp" claim.
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache = TTLCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
 
-def get_secret_key() -> str:
-    """
-    Get JWT secret key from environment variable.
-
-    Returns:
-        str: JWT secret key
 
-    Raises:
-        ValueError: If SECRET_KEY is not set in environment variables
-    """
-    secret_key = os.getenv("SECRET_KEY")
-    if not secret_key:
-        raise ValueError(
-            "SECRET_KEY environment variable is not set. "
-            "Please set it in your .env file or environment."
-        )
-    return secret_key
+def _token_cache_key(token: str) -> bytes:
+    """Build a short cache key (16 raw digest bytes) for a raw JWT string."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -46,26 +53,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
     Returns:
         str: Encoded JWT token string
-
-    Raises:
-        ValueError: If SECRET_KEY is not set in environment variables
     """
-    try:
-        secret_key = get_secret_key()
-    except ValueError as e:
-        raise ValueError(str(e))
-
     # Create a copy of the data to avoid modifying the original
     to_encode = data.copy()
 
-    # Set expiration time
+    # Set expiration time as a numeric epoch claim
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime_seconds = expires_delta.total_seconds()
     else:
-        expire = datetime.utcnow() + timedelta(hours=DEFAULT_EXPIRATION_HOURS)
-
-    # Add expiration claim
-    to_encode.update({"exp": expire})
+        lifetime_seconds = DEFAULT_EXPIRATION_HOURS * 3600
+    to_encode["exp"] = int(time.time() + lifetime_seconds)
 
     # Add subject claim if not already present
     if "sub" not in to_encode:
@@ -73,7 +70,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         to_encode.update({"sub": str(data.get("user_id", data.get("username", "unknown")))})
 
     # Encode the token
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -81,6 +78,10 @@ def decode_access_token(token: str) -> dict:
     """
     Decode and validate a JWT access token.
 
+    Successfully decoded payloads are cached for up to 60 seconds (never past
+    the token's expiry), so repeated requests with the same bearer token skip
+    signature verification. Failed validations are never cached.
+
     Args:
         token: JWT token string to decode
 
@@ -92,20 +93,17 @@ def decode_access_token(token: str) -> dict:
             - Token is expired
             - Token is invalid
             - Token cannot be decoded
-            - SECRET_KEY is missing
     """
-    try:
-        secret_key = get_secret_key()
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Server configuration error: SECRET_KEY is not set",
-        )
+    cache_key = _token_cache_key(token)
+    cached_payload = _token_cache.get(cache_key)
+    if cached_payload is not None:
+        if cached_payload.get("exp", 0) > time.time():
+            return cached_payload
+        _token_cache.pop(cache_key)
 
     try:
         # Decode and verify the token
-        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
     except ExpiredSignatureError:
         # Handle expired tokens
         raise HTTPException(
@@ -113,7 +111,7 @@ def decode_access_token(token: str) -> dict:
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except JWTError:
+    except InvalidTokenError:
         # Handle invalid tokens (malformed, invalid signature, etc.)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -128,3 +126,9 @@ def decode_access_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Cache the verified payload, bounded by the token's remaining lifetime
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _token_cache.set(cache_key, payload, ttl=min(exp - time.time(), TOKEN_CACHE_TTL_SECONDS))
+
+    return payload
@@ -6,7 +6,6 @@ and automatically closes those that meet auto-close conditions.
 """
 
 import logging
-import traceback
 from typing import Dict, List
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -79,15 +78,9 @@ async def auto_close_scanner(db: AsyncIOMotorDatabase) -> Dict[str, int]:
             )
             
         except Exception as e:
-            # Log error with stack trace
-            error_msg = f"Error evaluating pending alerts: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            errors.append(error_msg)
-            
-            # Log full traceback for debugging
-            traceback_str = traceback.format_exc()
-            logger.debug(f"Full traceback:\n{traceback_str}")
-            errors.append(f"Traceback: {traceback_str[:500]}")  # Limit traceback length
+            # Log error with stack trace; the traceback stays in the log sink only
+            logger.exception("Error evaluating pending alerts")
+            errors.append(f"Error evaluating pending alerts: {type(e).__name__}: {e}")
             
             # Set job status to failed
             status = "failed"
@@ -0,0 +1,49 @@
+"""
+Alert event log backfill job.
+
+This module implements the job that copies alert state history into the
+alert event log read by the dashboard activity feed: once over every alert
+at startup, then hourly over recent transitions, to restore events whose
+insert failed.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.services.event_service import backfill_alert_events
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Transitions re-checked by each periodic run; longer than the run interval
+# so runs overlap
+EVENT_REPAIR_LOOKBACK_HOURS = 2
+
+
+async def alert_events_backfiller(
+    db: AsyncIOMotorDatabase, lookback_hours: Optional[int] = None
+) -> None:
+    """
+    Copy alert state history into the alert event log.
+    
+    Safe to run repeatedly: events already in the log are kept as they
+    are. Errors are logged and do not propagate to the scheduler.
+    
+    Args:
+        db: MongoDB database instance
+        lookback_hours: Only copy transitions from the last this many hours;
+            None copies every transition
+    """
+    since = None
+    if lookback_hours is not None:
+        since = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
+
+    try:
+        await backfill_alert_events(db, since=since)
+        logger.info("Alert event log backfill completed")
+    except Exception:
+        logger.exception("Error backfilling alert event log")
@@ -0,0 +1,33 @@
+"""
+Alert counters rebuild job.
+
+This module implements the periodic job that recounts alerts into the
+counters document behind the dashboard summary, correcting drift from TTL
+deletions and failed counter writes.
+"""
+
+import logging
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.services.counter_service import rebuild_alert_counters
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+async def alert_counters_rebuilder(db: AsyncIOMotorDatabase) -> None:
+    """
+    Recount alerts into the dashboard summary counters.
+    
+    Errors are logged and do not propagate to the scheduler.
+    
+    Args:
+        db: MongoDB database instance
+    """
+    try:
+        counters = await rebuild_alert_counters(db)
+        logger.info(f"Alert counters rebuilt - {counters['total']} alert(s)")
+    except Exception:
+        logger.exception("Error rebuilding alert counters")
@@ -0,0 +1,38 @@
+"""
+Daily rollup refresher job for dashboard trends.
+
+This module implements the background job that keeps the per-day alert
+counts read by the /trends endpoint up to date.
+"""
+
+import logging
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.services.dashboard_service import DAILY_ROLLUP_COLLECTION, refresh_daily_rollup
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+async def daily_rollup_refresher(db: AsyncIOMotorDatabase) -> None:
+    """
+    Periodic job to refresh the daily alert rollup.
+    
+    Recomputes the most recent days from raw alerts. When the rollup
+    collection is empty (first run), every day is rebuilt instead.
+    Errors are logged and do not propagate to the scheduler.
+    
+    Args:
+        db: MongoDB database instance
+    """
+    try:
+        is_empty = await db[DAILY_ROLLUP_COLLECTION].estimated_document_count() == 0
+        if is_empty:
+            logger.info("Daily rollup is empty - rebuilding from all alerts")
+            await refresh_daily_rollup(db, days=None)
+        else:
+            await refresh_daily_rollup(db)
+    except Exception:
+        logger.exception("Error refreshing daily rollup")
@@ -2,53 +2,36 @@
 Background scheduler setup using APScheduler.
 
 This module configures and manages the APScheduler instance for running
-periodic background jobs, specifically the auto-close scanner.
+periodic background jobs: the auto-close scanner, the daily rollup
+refresher behind the dashboard trends, the alert counters rebuild behind
+the dashboard summary, and the alert event log backfill and repair.
 """
 
-import asyncio
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.jobs.auto_close_job import auto_close_scanner
+from app.jobs.backfill_job import EVENT_REPAIR_LOOKBACK_HOURS, alert_events_backfiller
+from app.jobs.counters_job import alert_counters_rebuilder
+from app.jobs.rollup_job import daily_rollup_refresher
 
 # Configure logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # Global scheduler instance
-scheduler: Optional[BackgroundScheduler] = None
+scheduler: Optional[AsyncIOScheduler] = None
 
+# Static (id, name) metadata of scheduled jobs, captured when the scheduler starts
+_jobs_snapshot: Tuple[Tuple[str, str], ...] = ()
 
-def _run_async_job(db: AsyncIOMotorDatabase) -> None:
-    """
-    Wrapper function to run async job in scheduler.
-    
-    APScheduler runs jobs in threads, so we need to create a new event loop
-    for each execution of the async function.
-    
-    Args:
-        db: MongoDB database instance
-    """
-    try:
-        # Create new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        # Run the async function
-        loop.run_until_complete(auto_close_scanner(db))
-        
-    except Exception as e:
-        logger.error(f"Error running async job in scheduler: {str(e)}", exc_info=True)
-    finally:
-        # Clean up event loop
-        try:
-            loop.close()
-        except Exception:
-            pass
+# Last status built by get_scheduler_status, keyed by the jobs' next run times
+_status_cache: Optional[Tuple[tuple, dict]] = None
 
 
 def start_scheduler(db: AsyncIOMotorDatabase) -> None:
@@ -56,7 +39,11 @@ def start_scheduler(db: AsyncIOMotorDatabase) -> None:
     Start the background scheduler.
     
     Initializes APScheduler and adds the auto-close scanner job
-    that runs every 5 minutes.
+    that runs every 5 minutes, the daily rollup refresher and the alert
+    counters rebuild that run at startup and then hourly, a one-off alert
+    event log backfill and an hourly repair of recent events. Must
+    be called from within the running event loop; jobs are awaited on that
+    loop and share its Motor client.
     
     Args:
         db: MongoDB database instance
@@ -64,7 +51,7 @@ def start_scheduler(db: AsyncIOMotorDatabase) -> None:
     Raises:
         RuntimeError: If scheduler fails to start
     """
-    global scheduler
+    global scheduler, _jobs_snapshot, _status_cache
     
     if scheduler is not None and scheduler.running:
         logger.warning("Scheduler already running - skipping start")
@@ -72,21 +59,74 @@ def start_scheduler(db: AsyncIOMotorDatabase) -> None:
     
     try:
         # Create new scheduler instance
-        scheduler = BackgroundScheduler()
+        scheduler = AsyncIOScheduler()
         
         # Add auto-close job - runs every 5 minutes
         scheduler.add_job(
-            func=lambda: _run_async_job(db),
+            func=auto_close_scanner,
             trigger=IntervalTrigger(minutes=5),
+            args=[db],
             id='auto_close_scanner',
             name='Auto-close alert scanner',
             replace_existing=True,
             max_instances=1,  # Prevent overlapping executions
             coalesce=True,    # Combine multiple pending executions
         )
+
+        # Add daily rollup refresh - runs now, then every hour
+        scheduler.add_job(
+            func=daily_rollup_refresher,
+            trigger=IntervalTrigger(hours=1),
+            args=[db],
+            id='daily_rollup_refresher',
+            name='Daily alert rollup refresher',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now(),
+        )
+
+        # Add alert counters rebuild - runs now, then every hour
+        scheduler.add_job(
+            func=alert_counters_rebuilder,
+            trigger=IntervalTrigger(hours=1),
+            args=[db],
+            id='alert_counters_rebuilder',
+            name='Alert counters rebuild',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now(),
+        )
+
+        # Backfill the alert event log once at startup
+        scheduler.add_job(
+            func=alert_events_backfiller,
+            args=[db],
+            id='alert_events_backfiller',
+            name='Alert event log backfill',
+            replace_existing=True,
+        )
+
+        # Re-copy recent transitions whose event insert failed - runs every hour
+        scheduler.add_job(
+            func=alert_events_backfiller,
+            trigger=IntervalTrigger(hours=1),
+            args=[db],
+            kwargs={"lookback_hours": EVENT_REPAIR_LOOKBACK_HOURS},
+            id='alert_events_repairer',
+            name='Alert event log repair',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
         
         # Start the scheduler
         scheduler.start()
+
+        # Snapshot static job metadata for status reporting
+        _jobs_snapshot = tuple((job.id, job.name) for job in scheduler.get_jobs())
+        _status_cache = None
         
         logger.info("✅ Background scheduler started - auto-close runs every 5 mins")
         
@@ -108,8 +148,11 @@ def shutdown_scheduler() -> None:
     
     Stops all scheduled jobs and shuts down the scheduler instance.
     """
-    global scheduler
+    global scheduler, _jobs_snapshot, _status_cache
     
+    _jobs_snapshot = ()
+    _status_cache = None
+
     if scheduler is None:
         logger.debug("Scheduler not running - nothing to shutdown")
         return
@@ -141,28 +184,43 @@ def is_scheduler_running() -> bool:
 def get_scheduler_status() -> dict:
     """
     Get current scheduler status information.
+
+    Job ids and names come from a snapshot taken at startup, and the result
+    is reused until one of the jobs' next run times changes.
     
     Returns:
         dict: Status information including:
             - running: Whether scheduler is running
             - jobs: List of scheduled jobs with next run times
     """
+    global _status_cache
+
     if scheduler is None or not scheduler.running:
         return {
             "running": False,
             "jobs": [],
         }
-    
-    jobs = []
-    for job in scheduler.get_jobs():
-        jobs.append({
-            "id": job.id,
-            "name": job.name,
-            "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
-        })
-    
-    return {
+
+    # Only next_run_time changes between calls; rebuild the status when it does
+    next_run_times = tuple(
+        job.next_run_time if job else None
+        for job in (scheduler.get_job(job_id) for job_id, _ in _jobs_snapshot)
+    )
+    if _status_cache is not None and _status_cache[0] == next_run_times:
+        return _status_cache[1]
+
+    jobs = [
+        {
+            "id": job_id,
+            "name": job_name,
+            "next_run_time": next_run.isoformat() if next_run else None,
+        }
+        for (job_id, job_name), next_run in zip(_jobs_snapshot, next_run_times)
+    ]
+
+    status = {
         "running": True,
         "jobs": jobs,
     }
-
+    _status_cache = (next_run_times, status)
+    return status
@@ -1,13 +1,20 @@
 """FastAPI application main module."""
 
+import asyncio
 import logging
+import time
+
 import uvicorn
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from src.database.connection import Database
+from app.auth.jwt_handler import create_access_token, decode_access_token
 from app.routes import auth_routes, alert_routes, rule_routes, dashboard_routes
+from app.utils.http_cache import ETagMiddleware
+from app.utils.responses import ORJSONResponse
 from app.jobs.scheduler import start_scheduler, shutdown_scheduler
 
 # Configure logging
@@ -17,6 +24,26 @@ logging.basicConfig(
 )
 
 
+# Health check: reuse a successful ping for this long, and bound each ping
+HEALTH_CACHE_SECONDS = 1.0
+HEALTH_PING_TIMEOUT_SECONDS = 0.5
+_last_ok_ts = 0.0
+
+
+def _warm_up(app: FastAPI) -> None:
+    """
+    Pay one-time initialization costs at startup instead of on the first request.
+
+    Mints and decodes a throwaway JWT to exercise the token code path and
+    pre-generates the OpenAPI schema (which also walks every route model).
+
+    Args:
+        app: FastAPI application instance
+    """
+    decode_access_token(create_access_token({"sub": "warmup"}))
+    app.openapi()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -30,9 +57,16 @@ async def lifespan(app: FastAPI):
     await Database.connect()
     logging.info("✅ Database connected successfully")
     
-    # Start background scheduler for auto-close jobs
+    # Bind the database handle and users collection for request dependencies
     db = Database.get_database()
+    app.state.db = db
+    app.state.users_collection = db["users"]
+
+    # Start background scheduler for auto-close jobs
     start_scheduler(db)
+
+    # Warm up token handling and the OpenAPI schema
+    _warm_up(app)
     
     # Log startup completion
     logging.info("🚀 Application started successfully")
@@ -44,6 +78,7 @@ async def lifespan(app: FastAPI):
     # Shutdown: Stop scheduler and disconnect from database
     logging.info("🔄 Shutting down application...")
     shutdown_scheduler()
+    app.state.db = None
     await Database.disconnect()
     logging.info("👋 Application shutdown complete")
 
@@ -53,15 +88,23 @@ app = FastAPI(
     description="API with MongoDB database connection",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Tag dashboard reads with ETag/Cache-Control (added before CORS so CORS stays outermost)
+app.add_middleware(ETagMiddleware, path_prefix="/api/dashboard/")
+
+# Compress JSON bodies over 512 bytes; wraps ETag so tags and 304s use the raw body
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Include routes
@@ -71,6 +114,48 @@ app.include_router(rule_routes.router, tags=["Rules"])
 app.include_router(dashboard_routes.router, tags=["Dashboard"])
 
 
+@app.exception_handler(RuntimeError)
+async def runtime_error_handler(request: Request, exc: RuntimeError) -> ORJSONResponse:
+    """
+    Return a 500 response for service failures.
+
+    Services wrap database and unexpected errors in RuntimeError with a
+    message naming the failed operation, so routes let it propagate here.
+
+    Args:
+        request: Request that raised the exception
+        exc: Service error
+
+    Returns:
+        ORJSONResponse: 500 error response
+    """
+    return ORJSONResponse(
+        {"detail": str(exc)},
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Return a 500 response for exceptions not handled by a route.
+
+    Routes only map expected errors (404/400) themselves; anything else
+    reaches this handler instead of per-route catch-all blocks.
+
+    Args:
+        request: Request that raised the exception
+        exc: Unhandled exception
+
+    Returns:
+        ORJSONResponse: 500 error response
+    """
+    return ORJSONResponse(
+        {"detail": f"Internal server error: {exc}"},
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
 @app.get("/dummy")
 async def dummy_endpoint():
     """Dummy endpoint for testing."""
@@ -82,17 +167,38 @@ async def health_check():
     """
     Health check endpoint that verifies database connection.
 
+    A successful ping is reused for one second so frequent probes do not
+    each cost a database round trip; failures are never cached.
+
     Returns:
         dict: Health status of the application and database
     """
+    global _last_ok_ts
+
+    healthy = {
+        "status": "healthy",
+        "database": "connected",
+    }
+
+    # Serve recent successful pings from cache
+    if time.monotonic() - _last_ok_ts < HEALTH_CACHE_SECONDS:
+        return healthy
+
     try:
         # Verify database connection
         Database.get_database()
-        # Ping the database to check connection
-        await Database.get_client().admin.command("ping")
+        # Ping the database to check connection, failing fast if it is unreachable
+        await asyncio.wait_for(
+            Database.get_client().admin.command("ping"),
+            timeout=HEALTH_PING_TIMEOUT_SECONDS,
+        )
+        _last_ok_ts = time.monotonic()
+        return healthy
+    except asyncio.TimeoutError:
         return {
-            "status": "healthy",
-            "database": "connected",
+            "status": "unhealthy",
+            "database": "disconnected",
+            "error": "Database ping timed out",
         }
     except Exception as e:
         return {
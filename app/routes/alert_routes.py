@@ -1,12 +1,15 @@
 """Alert management routes for creating, listing, and managing alerts."""
 
+import asyncio
+import logging
+import operator
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.database.connection import Database
 from src.database.models import (
     AlertModel,
     AlertMetadata,
@@ -18,13 +21,89 @@ from src.database.models import (
 from app.services.alert_service import (
     add_resolution,
     create_alert,
+    create_alerts_bulk,
     get_alert_by_id,
-    list_alerts,
+    list_alert_documents,
     update_alert_status,
 )
+from app.services.rule_engine import check_and_escalate
+from app.routes.dependencies import get_database
+from app.utils.responses import ORJSONResponse
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 router = APIRouter(prefix="/api/alerts", tags=["Alerts"])
 
+# Maximum number of alerts accepted by one bulk create request
+MAX_BULK_ALERTS = 500
+
+# Pydantic v2 exposes model_dump(); v1 only dict(). Resolved once at import.
+_dump = operator.methodcaller("model_dump" if hasattr(BaseModel, "model_dump") else "dict")
+
+# Strong references to in-flight escalation tasks so they are not garbage
+# collected before completion
+_BG_TASKS: Set[asyncio.Task] = set()
+
+
+async def _escalate_in_background(alert: AlertModel, db: AsyncIOMotorDatabase) -> None:
+    """
+    Run rule engine escalation for a newly created alert, logging failures.
+
+    Args:
+        alert: Newly created alert
+        db: MongoDB database instance
+    """
+    try:
+        await check_and_escalate(alert, db)
+    except Exception as e:
+        # Log error but don't fail the alert creation
+        # The escalation can be retried later
+        logger.warning(
+            f"Failed to check escalation for alert {alert.alert_id}: {str(e)}"
+        )
+
+
+# ============================================================================
+# SCHEMA EXAMPLES
+# ============================================================================
+
+_CREATE_ALERT_EXAMPLE = {
+    "example": {
+        "source_type": "OVERSPEEDING",
+        "metadata": {
+            "driver_id": "DRV001",
+            "vehicle_id": "VEH123",
+            "speed": 85.5,
+            "speed_limit": 60.0,
+            "location": "MG Road, Bangalore",
+        },
+    }
+}
+
+_ALERT_LIST_EXAMPLE = {
+    "example": {
+        "alerts": [],
+        "total": 0,
+        "skip": 0,
+        "limit": 50,
+    }
+}
+
+_UPDATE_STATUS_EXAMPLE = {
+    "example": {
+        "new_status": "ESCALATED",
+        "reason": "Multiple incidents detected within time window",
+    }
+}
+
+_RESOLVE_ALERT_EXAMPLE = {
+    "example": {
+        "resolution_notes": "Issue resolved by contacting driver and updating route",
+    }
+}
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -37,21 +116,7 @@ class CreateAlertRequest(BaseModel):
     source_type: SourceType = Field(..., description="Source type of the alert")
     metadata: AlertMetadata = Field(..., description="Alert metadata")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "source_type": "OVERSPEEDING",
-                "metadata": {
-                    "driver_id": "DRV001",
-                    "vehicle_id": "VEH123",
-                    "speed": 85.5,
-                    "speed_limit": 60.0,
-                    "location": "MG Road, Bangalore",
-                },
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_CREATE_ALERT_EXAMPLE)
 
 
 class AlertResponse(BaseModel):
@@ -77,10 +142,13 @@ class AlertResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
 
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(from_attributes=True)
 
-        from_attributes = True
+    def model_dump(self, **kwargs):
+        """Dump the response, omitting fields that are None unless asked otherwise."""
+        kwargs.setdefault("exclude_none", True)
+        kwargs.setdefault("by_alias", True)
+        return super().model_dump(**kwargs)
 
 
 class AlertListResponse(BaseModel):
@@ -91,17 +159,7 @@ class AlertListResponse(BaseModel):
     skip: int = Field(..., description="Number of alerts skipped")
     limit: int = Field(..., description="Maximum number of alerts returned")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "alerts": [],
-                "total": 0,
-                "skip": 0,
-                "limit": 50,
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_ALERT_LIST_EXAMPLE)
 
 
 class UpdateStatusRequest(BaseModel):
@@ -110,15 +168,7 @@ class UpdateStatusRequest(BaseModel):
     new_status: AlertStatus = Field(..., description="New status to transition to")
     reason: str = Field(..., min_length=1, description="Reason for status change")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "new_status": "ESCALATED",
-                "reason": "Multiple incidents detected within time window",
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_UPDATE_STATUS_EXAMPLE)
 
 
 class ResolveAlertRequest(BaseModel):
@@ -126,14 +176,7 @@ class ResolveAlertRequest(BaseModel):
 
     resolution_notes: str = Field(..., min_length=1, description="Resolution notes")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "resolution_notes": "Issue resolved by contacting driver and updating route",
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_RESOLVE_ALERT_EXAMPLE)
 
 
 class StateHistoryResponse(BaseModel):
@@ -143,46 +186,129 @@ class StateHistoryResponse(BaseModel):
         ..., description="History of state transitions"
     )
 
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(from_attributes=True)
 
-        from_attributes = True
+
+# ============================================================================
+# QUERY FILTER LOOKUPS
+# ============================================================================
+
+# Enum lookup tables for list filters, built once instead of validating
+# each query parameter through pydantic
+_STATUS_MAP = {s.value: s for s in AlertStatus}
+_SOURCE_TYPE_MAP = {s.value: s for s in SourceType}
+_SEVERITY_MAP = {s.value: s for s in AlertSeverity}
+
+_STATUS_CHOICES = ", ".join(_STATUS_MAP)
+_SOURCE_TYPE_CHOICES = ", ".join(_SOURCE_TYPE_MAP)
+_SEVERITY_CHOICES = ", ".join(_SEVERITY_MAP)
+
+
+def _lookup_filter(table: dict, value: str, name: str):
+    """
+    Resolve a query filter value to its enum member.
+
+    Args:
+        table: Mapping of enum values to members
+        value: Raw query parameter value
+        name: Query parameter name, used in the error message
+
+    Returns:
+        Enum member matching value
+
+    Raises:
+        HTTPException: 400 if value is not a valid choice
+    """
+    member = table.get(value)
+    if member is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {name} '{value}'. Must be one of: {', '.join(table)}",
+        )
+    return member
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Optional alert fields; list responses leave them out when unset
+_OPTIONAL_ALERT_FIELDS = (
+    "escalated_at",
+    "closed_at",
+    "resolved_at",
+    "auto_close_reason",
+    "expires_at",
+    "resolved_by",
+    "resolution_notes",
+    "updated_at",
+)
+
+# Projects alert documents straight into the list-response JSON shape: a
+# dumped AlertResponse with None fields (and None metadata entries) left out
+# and state_history omitted (not empty: it is left to the detail endpoint)
+ALERT_LIST_PROJECTION = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "alert_id": 1,
+    "source_type": 1,
+    "severity": 1,
+    "status": 1,
+    "timestamp": 1,
+    "metadata": {
+        "$arrayToObject": {
+            "$filter": {
+                "input": {"$objectToArray": {"$ifNull": ["$metadata", {}]}},
+                "cond": {"$ne": ["$$this.v", None]},
+            }
+        }
+    },
+    "created_at": 1,
+    **{field: {"$ifNull": [f"${field}", "$$REMOVE"]} for field in _OPTIONAL_ALERT_FIELDS},
+}
+
+# AlertModel fields copied verbatim into AlertResponse
+_ALERT_FIELDS = (
+    "alert_id",
+    "source_type",
+    "severity",
+    "status",
+    "timestamp",
+    "metadata",
+    "state_history",
+    "escalated_at",
+    "closed_at",
+    "resolved_at",
+    "auto_close_reason",
+    "expires_at",
+    "resolved_by",
+    "resolution_notes",
+    "created_at",
+    "updated_at",
+)
+
 
 def alert_model_to_response(alert: AlertModel) -> AlertResponse:
     """
     Convert AlertModel to AlertResponse.
 
+    The alert data is trusted, so the response (and any raw state history
+    entries) is built with model_construct instead of being validated again.
+
     Args:
         alert: AlertModel instance
 
     Returns:
         AlertResponse: Alert response model
     """
-    return AlertResponse(
-        id=str(alert.id) if alert.id else None,
-        alert_id=alert.alert_id,
-        source_type=alert.source_type,
-        severity=alert.severity,
-        status=alert.status,
-        timestamp=alert.timestamp,
-        metadata=alert.metadata,
-        state_history=alert.state_history,
-        escalated_at=alert.escalated_at,
-        closed_at=alert.closed_at,
-        resolved_at=alert.resolved_at,
-        auto_close_reason=alert.auto_close_reason,
-        expires_at=alert.expires_at,
-        resolved_by=alert.resolved_by,
-        resolution_notes=alert.resolution_notes,
-        created_at=alert.created_at,
-        updated_at=alert.updated_at,
-    )
+    fields = {field: getattr(alert, field) for field in _ALERT_FIELDS}
+    fields["state_history"] = [
+        transition
+        if isinstance(transition, AlertStateTransition)
+        else AlertStateTransition.model_construct(**transition)
+        for transition in alert.state_history
+    ]
+    return AlertResponse.model_construct(id=str(alert.id) if alert.id else None, **fields)
 
 
 # ============================================================================
@@ -199,133 +325,171 @@ def alert_model_to_response(alert: AlertModel) -> AlertResponse:
 )
 async def create_new_alert(
     request: CreateAlertRequest,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Create a new alert.
 
-    Validates source_type, creates alert using alert_service, and optionally
-    triggers rule engine for real-time escalation.
+    Validates source_type, creates alert using alert_service, and schedules
+    the rule engine escalation check as a background task.
 
     Args:
         request: Alert creation request data
+        db: MongoDB database instance (from dependency)
 
     Returns:
         AlertResponse: Created alert information
 
     Raises:
-        HTTPException: 400 if validation fails, 500 if creation fails
+        HTTPException: 400 if validation fails
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Prepare alert data - convert metadata to dict
-        # Use model_dump() for Pydantic v2, with fallback to dict() for v1
-        if hasattr(request.metadata, 'model_dump'):
-            metadata_dict = request.metadata.model_dump()
-        else:
-            # Fallback for Pydantic v1
-            metadata_dict = request.metadata.dict()
-
-        alert_data = {
-            "source_type": request.source_type,
-            "metadata": metadata_dict,
-        }
+    # Prepare alert data - convert metadata to dict
+    alert_data = {
+        "source_type": request.source_type,
+        "metadata": _dump(request.metadata),
+    }
 
-        # Create alert
+    # Create alert
+    try:
         created_alert = await create_alert(alert_data, db)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
-        # Call rule engine for real-time escalation
-        try:
-            from app.services.rule_engine import check_and_escalate
+    # Run rule engine escalation off the request path
+    task = asyncio.create_task(_escalate_in_background(created_alert, db))
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
 
-            await check_and_escalate(created_alert, db)
-        except Exception as e:
-            # Log error but don't fail the alert creation
-            # The escalation can be retried later
-            import logging
+    return ORJSONResponse(
+        alert_model_to_response(created_alert).model_dump(mode="json"),
+        status_code=status.HTTP_201_CREATED,
+    )
 
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                f"Failed to check escalation for alert {created_alert.alert_id}: {str(e)}"
-            )
 
-        return alert_model_to_response(created_alert)
+@router.post(
+    "/bulk",
+    response_model=List[AlertResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several alerts",
+    description=(
+        f"Create up to {MAX_BULK_ALERTS} alerts in one request. "
+        "No authentication required."
+    ),
+)
+async def create_new_alerts_bulk(
+    requests: List[CreateAlertRequest],
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """
+    Create several alerts with a single database write.
 
-    except ValueError as e:
+    Meant for ingestion bursts; each alert still gets its rule engine
+    escalation check as a background task.
+
+    Args:
+        requests: Alert creation request data, one entry per alert
+        db: MongoDB database instance (from dependency)
+
+    Returns:
+        List[AlertResponse]: Created alerts, in request order
+
+    Raises:
+        HTTPException: 400 if validation fails or too many alerts are sent
+    """
+    if len(requests) > MAX_BULK_ALERTS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create alert: {str(e)}",
+            detail=f"At most {MAX_BULK_ALERTS} alerts can be created per request",
         )
 
+    alerts_data = [
+        {"source_type": request.source_type, "metadata": _dump(request.metadata)}
+        for request in requests
+    ]
+    created_alerts = await create_alerts_bulk(alerts_data, db)
+
+    # Run rule engine escalation off the request path
+    for created_alert in created_alerts:
+        task = asyncio.create_task(_escalate_in_background(created_alert, db))
+        _BG_TASKS.add(task)
+        task.add_done_callback(_BG_TASKS.discard)
+
+    return ORJSONResponse(
+        [alert_model_to_response(alert).model_dump(mode="json") for alert in created_alerts],
+        status_code=status.HTTP_201_CREATED,
+    )
+
 
 @router.get(
     "",
     response_model=AlertListResponse,
     status_code=status.HTTP_200_OK,
     summary="List alerts",
-    description="List alerts with filtering and pagination. No authentication required.",
+    description=(
+        "List alerts with filtering and pagination. State history is omitted; "
+        "fetch a single alert for it. No authentication required."
+    ),
 )
 async def list_alerts_endpoint(
-    status: Optional[AlertStatus] = Query(None, description="Filter by alert status"),
-    source_type: Optional[SourceType] = Query(None, description="Filter by source type"),
-    severity: Optional[AlertSeverity] = Query(None, description="Filter by severity"),
+    status_filter: Optional[str] = Query(
+        None, alias="status", description=f"Filter by alert status ({_STATUS_CHOICES})"
+    ),
+    source_type: Optional[str] = Query(
+        None, description=f"Filter by source type ({_SOURCE_TYPE_CHOICES})"
+    ),
+    severity: Optional[str] = Query(
+        None, description=f"Filter by severity ({_SEVERITY_CHOICES})"
+    ),
     driver_id: Optional[str] = Query(None, description="Filter by driver ID"),
     skip: int = Query(0, ge=0, description="Number of alerts to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of alerts to return"),
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     List alerts with filtering and pagination.
 
     Args:
-        status: Optional status filter
+        status_filter: Optional status filter (``status`` query parameter)
         source_type: Optional source type filter
         severity: Optional severity filter
         driver_id: Optional driver ID filter
         skip: Number of alerts to skip (pagination)
         limit: Maximum number of alerts to return
+        db: MongoDB database instance (from dependency)
 
     Returns:
         AlertListResponse: List of alerts with pagination info
+
+    Raises:
+        HTTPException: 400 if an enum filter value is invalid
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Build filters dict
-        filters = {}
-        if status:
-            filters["status"] = status
-        if source_type:
-            filters["source_type"] = source_type
-        if severity:
-            filters["severity"] = severity
-        if driver_id:
-            filters["driver_id"] = driver_id
-
-        # Call alert service
-        alerts, total_count = await list_alerts(filters, skip, limit, db)
-
-        # Convert to response models
-        alert_responses = [alert_model_to_response(alert) for alert in alerts]
-
-        return AlertListResponse(
-            alerts=alert_responses,
-            total=total_count,
-            skip=skip,
-            limit=limit,
-        )
+    # Build filters dict
+    filters = {}
+    if status_filter:
+        filters["status"] = _lookup_filter(_STATUS_MAP, status_filter, "status")
+    if source_type:
+        filters["source_type"] = _lookup_filter(_SOURCE_TYPE_MAP, source_type, "source_type")
+    if severity:
+        filters["severity"] = _lookup_filter(_SEVERITY_MAP, severity, "severity")
+    if driver_id:
+        filters["driver_id"] = driver_id
+
+    # Call alert service
+    alerts, total_count = await list_alert_documents(
+        filters, skip, limit, ALERT_LIST_PROJECTION, db
+    )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list alerts: {str(e)}",
-        )
+    # Documents arrive in response shape; serialize them as they are
+    payload = {
+        "alerts": alerts,
+        "total": total_count,
+        "skip": skip,
+        "limit": limit,
+    }
+    return ORJSONResponse(payload)
 
 
 @router.patch(
@@ -338,6 +502,7 @@ async def list_alerts_endpoint(
 async def update_status(
     alert_id: str,
     request: UpdateStatusRequest,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Update alert status.
@@ -345,6 +510,7 @@ async def update_status(
     Args:
         alert_id: Alert ID to update
         request: Status update request data
+        db: MongoDB database instance (from dependency)
 
     Returns:
         AlertResponse: Updated alert information
@@ -352,29 +518,17 @@ async def update_status(
     Raises:
         HTTPException: 400 if transition is invalid, 404 if alert not found
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Update alert status
-        updated_alert = await update_alert_status(
-            alert_id=alert_id,
-            new_status=request.new_status,
-            reason=request.reason,
-            triggered_by="system",
-            rule_id=None,
-            db=db,
-        )
-
-        return alert_model_to_response(updated_alert)
+    # Update alert status
+    updated_alert = await update_alert_status(
+        alert_id=alert_id,
+        new_status=request.new_status,
+        reason=request.reason,
+        triggered_by="system",
+        rule_id=None,
+        db=db,
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update alert status: {str(e)}",
-        )
+    return ORJSONResponse(alert_model_to_response(updated_alert).model_dump(mode="json"))
 
 
 @router.post(
@@ -387,6 +541,7 @@ async def update_status(
 async def resolve_alert(
     alert_id: str,
     request: ResolveAlertRequest,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Resolve an alert.
@@ -394,6 +549,7 @@ async def resolve_alert(
     Args:
         alert_id: Alert ID to resolve
         request: Resolution request data
+        db: MongoDB database instance (from dependency)
 
     Returns:
         AlertResponse: Updated alert information
@@ -401,27 +557,15 @@ async def resolve_alert(
     Raises:
         HTTPException: 400 if alert cannot be resolved, 404 if alert not found
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Add resolution
-        updated_alert = await add_resolution(
-            alert_id=alert_id,
-            notes=request.resolution_notes,
-            user_id="system",
-            db=db,
-        )
+    # Add resolution
+    updated_alert = await add_resolution(
+        alert_id=alert_id,
+        notes=request.resolution_notes,
+        user_id="system",
+        db=db,
+    )
 
-        return alert_model_to_response(updated_alert)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to resolve alert: {str(e)}",
-        )
+    return ORJSONResponse(alert_model_to_response(updated_alert).model_dump(mode="json"))
 
 
 @router.get(
@@ -432,13 +576,15 @@ async def resolve_alert(
     description="Get the state transition history of an alert. No authentication required.",
 )
 async def get_alert_history(
-    alert_id: str
+    alert_id: str,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Get alert state history.
 
     Args:
         alert_id: Alert ID to get history for
+        db: MongoDB database instance (from dependency)
 
     Returns:
         StateHistoryResponse: Alert state history
@@ -446,29 +592,23 @@ async def get_alert_history(
     Raises:
         HTTPException: 404 if alert not found
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Get alert
-        alert = await get_alert_by_id(alert_id, db)
-
-        if not alert:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Alert with ID {alert_id} not found",
-            )
-
-        return StateHistoryResponse(state_history=alert.state_history)
+    # Get alert
+    alert = await get_alert_by_id(alert_id, db)
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not alert:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve alert history: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Alert with ID {alert_id} not found",
         )
 
+    return ORJSONResponse(
+        {
+            "state_history": [
+                transition.model_dump(mode="json") for transition in alert.state_history
+            ]
+        }
+    )
+
 
 @router.get(
     "/{alert_id}",
@@ -477,12 +617,16 @@ async def get_alert_history(
     summary="Get alert by ID",
     description="Get a specific alert by its ID. No authentication required.",
 )
-async def get_alert(alert_id: str):
+async def get_alert(
+    alert_id: str,
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
     """
     Get an alert by its ID.
 
     Args:
         alert_id: Alert ID to retrieve
+        db: MongoDB database instance (from dependency)
 
     Returns:
         AlertResponse: Alert information with full state history
@@ -490,26 +634,13 @@ async def get_alert(alert_id: str):
     Raises:
         HTTPException: 404 if alert not found
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Get alert
-        alert = await get_alert_by_id(alert_id, db)
+    # Get alert
+    alert = await get_alert_by_id(alert_id, db)
 
-        if not alert:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Alert with ID {alert_id} not found",
-            )
-
-        return alert_model_to_response(alert)
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not alert:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve alert: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Alert with ID {alert_id} not found",
         )
 
+    return ORJSONResponse(alert_model_to_response(alert).model_dump(mode="json"))
@@ -1,13 +1,16 @@
 """Authentication routes for user registration, login, and password management."""
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel, EmailStr, Field
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from src.database.connection import Database
-from src.database.models import UserModel, UserRole
+from src.database.models import UserRole
 from app.auth.password_utils import (
     hash_password,
     verify_password,
@@ -15,11 +18,32 @@ from app.auth.password_utils import (
 )
 from app.auth.jwt_handler import create_access_token
 from app.auth.dependencies import (
+    AuthUser,
     get_current_active_user,
+    invalidate_cached_user,
 )
+from app.routes.dependencies import get_database
+from app.utils.responses import ORJSONResponse
 
 router = APIRouter()
 
+# Profile fields returned by /me (never the password hash)
+USER_PROFILE_FIELDS = (
+    "username",
+    "email",
+    "full_name",
+    "role",
+    "is_active",
+    "is_verified",
+    "created_at",
+    "updated_at",
+    "last_login",
+)
+USER_PROFILE_PROJECTION = {field: 1 for field in USER_PROFILE_FIELDS}
+
+# Fields login needs to check the account and issue a token
+LOGIN_PROJECTION = {"username": 1, "hashed_password": 1, "is_active": 1}
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -148,28 +172,56 @@ class MessageResponse(BaseModel):
 # ============================================================================
 
 
-def user_model_to_response(user: UserModel) -> UserResponse:
+def user_doc_to_dict(user_doc: dict) -> dict:
     """
-    Convert UserModel to UserResponse (excludes hashed_password).
+    Convert a user document to the UserResponse shape (excludes hashed_password).
+
+    Builds a plain dict for ORJSONResponse instead of a validated UserResponse.
 
     Args:
-        user: UserModel instance
+        user_doc: User document from MongoDB (must include _id)
 
     Returns:
-        UserResponse: User response without sensitive data
+        dict: User data without sensitive fields
     """
-    return UserResponse(
-        id=str(user.id) if user.id else None,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_verified=user.is_verified,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        last_login=user.last_login,
-    )
+    return {
+        "id": str(user_doc["_id"]),
+        **{field: user_doc.get(field) for field in USER_PROFILE_FIELDS},
+    }
+
+
+def _utcnow() -> datetime:
+    """
+    Get the current time as a timezone-aware UTC datetime.
+
+    Avoids datetime.utcnow(), which is deprecated and warns on every call
+    on Python 3.12+.
+
+    Returns:
+        datetime: Current UTC time
+    """
+    return datetime.now(timezone.utc)
+
+
+def _verify_and_issue_token(
+    plain_password: str, hashed_password: str, token_data: dict
+) -> Optional[str]:
+    """
+    Verify a password and, if it matches, create an access token.
+
+    Both steps are CPU-bound, so login runs this in a worker thread.
+
+    Args:
+        plain_password: Password submitted by the user
+        hashed_password: Stored bcrypt hash
+        token_data: Claims to encode in the token
+
+    Returns:
+        Optional[str]: Encoded JWT, or None if the password does not match
+    """
+    if not verify_password(plain_password, hashed_password):
+        return None
+    return create_access_token(data=token_data)
 
 
 # ============================================================================
@@ -186,15 +238,18 @@ def user_model_to_response(user: UserModel) -> UserResponse:
 )
 async def register(
     user_data: UserRegisterRequest,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Register a new user account.
 
-    Public endpoint - no authentication required. Validates password strength,
-    checks for duplicate username/email, and creates the user in MongoDB.
+    Public endpoint - no authentication required. Validates password strength
+    and creates the user in MongoDB; duplicate username/email are rejected by
+    the collection's unique indexes.
 
     Args:
         user_data: User registration data
+        db: MongoDB database instance (from dependency)
 
     Returns:
         UserResponse: Created user information (without password)
@@ -210,28 +265,10 @@ async def register(
             detail=error_message,
         )
 
-    # Get database and users collection
-    database = Database.get_database()
-    users_collection = database["users"]
-
-    # Check if username already exists
-    existing_user = await users_collection.find_one({"username": user_data.username})
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already exists",
-        )
-
-    # Check if email already exists
-    existing_email = await users_collection.find_one({"email": user_data.email})
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already exists",
-        )
+    users_collection = db["users"]
 
     # Hash password
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await asyncio.to_thread(hash_password, user_data.password)
 
     # Create user document for MongoDB
     # Let MongoDB generate the _id automatically
@@ -243,20 +280,26 @@ async def register(
         "role": user_data.role.value,  # Convert enum to string
         "is_active": True,
         "is_verified": False,
-        "created_at": datetime.utcnow(),
+        "created_at": _utcnow(),
         "updated_at": None,
         "last_login": None,
     }
 
-    # Insert into MongoDB
-    result = await users_collection.insert_one(user_dict)
+    # Insert into MongoDB; the unique username/email indexes reject duplicates
+    try:
+        result = await users_collection.insert_one(user_dict)
+    except DuplicateKeyError as e:
+        key_pattern = (e.details or {}).get("keyPattern", {})
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already exists" if "email" in key_pattern else "Username already exists",
+        )
 
-    # Fetch the created user
-    created_user_doc = await users_collection.find_one({"_id": result.inserted_id})
-    created_user = UserModel(**created_user_doc)
+    # Build the response from the inserted document instead of re-reading it
+    user_dict["_id"] = result.inserted_id
 
     # Return user response (exclude password)
-    return user_model_to_response(created_user)
+    return ORJSONResponse(user_doc_to_dict(user_dict), status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -266,12 +309,16 @@ async def register(
     summary="User login",
     description="Authenticate user and return JWT access token. Accepts JSON format.",
 )
-async def login(login_data: LoginRequest):
+async def login(
+    login_data: LoginRequest,
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
     """
     Authenticate user and return JWT access token.
 
     Args:
         login_data: Login credentials (username and password) in JSON format
+        db: MongoDB database instance (from dependency)
 
     Returns:
         TokenResponse: JWT access token and token type
@@ -279,12 +326,15 @@ async def login(login_data: LoginRequest):
     Raises:
         HTTPException: 401 if credentials are invalid
     """
-    # Get database and users collection
-    database = Database.get_database()
-    users_collection = database["users"]
+    users_collection = db["users"]
 
-    # Find user by username
-    user_doc = await users_collection.find_one({"username": login_data.username})
+    # Find user by username and stamp last_login in the same round trip
+    user_doc = await users_collection.find_one_and_update(
+        {"username": login_data.username},
+        {"$set": {"last_login": _utcnow()}},
+        projection=LOGIN_PROJECTION,
+        return_document=ReturnDocument.BEFORE,
+    )
     if not user_doc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -292,40 +342,31 @@ async def login(login_data: LoginRequest):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Convert to UserModel
-    user = UserModel(**user_doc)
-
     # Check if user is active
-    if not user.is_active:
+    if not user_doc.get("is_active", True):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Inactive user account",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify password
-    if not verify_password(login_data.password, user.hashed_password):
+    # Verify password and sign the token in a single worker-thread hop
+    token_data = {
+        "sub": user_doc["username"],
+        "username": user_doc["username"],
+        "user_id": str(user_doc["_id"]),
+    }
+    access_token = await asyncio.to_thread(
+        _verify_and_issue_token, login_data.password, user_doc["hashed_password"], token_data
+    )
+    if access_token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last_login timestamp
-    await users_collection.update_one(
-        {"username": login_data.username},
-        {"$set": {"last_login": datetime.utcnow()}},
-    )
-
-    # Create access token
-    token_data = {
-        "sub": user.username,
-        "username": user.username,
-        "user_id": str(user.id) if user.id else None,
-    }
-    access_token = create_access_token(data=token_data)
-
-    return TokenResponse(access_token=access_token, token_type="bearer")
+    return ORJSONResponse({"access_token": access_token, "token_type": "bearer"})
 
 
 @router.get(
@@ -336,18 +377,34 @@ async def login(login_data: LoginRequest):
     description="Get details of the currently authenticated user",
 )
 async def get_current_user_info(
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: AuthUser = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Get current authenticated user information.
 
     Args:
         current_user: Current active user (from dependency)
+        db: MongoDB database instance (from dependency)
 
     Returns:
         UserResponse: Current user information (without password)
+
+    Raises:
+        HTTPException: 401 if the user no longer exists
     """
-    return user_model_to_response(current_user)
+    # The auth dependency only carries authorization fields; load the full profile
+    user_doc = await db["users"].find_one(
+        {"username": current_user.username}, projection=USER_PROFILE_PROJECTION
+    )
+    if not user_doc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return ORJSONResponse(user_doc_to_dict(user_doc))
 
 
 @router.put(
@@ -359,7 +416,8 @@ async def get_current_user_info(
 )
 async def change_password(
     password_data: ChangePasswordRequest,
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: AuthUser = Depends(get_current_active_user),
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Change password for the current user.
@@ -367,6 +425,7 @@ async def change_password(
     Args:
         password_data: Old and new password
         current_user: Current active user (from dependency)
+        db: MongoDB database instance (from dependency)
 
     Returns:
         MessageResponse: Success message
@@ -374,27 +433,47 @@ async def change_password(
     Raises:
         HTTPException: 400 if old password is incorrect or new password is weak
     """
-    # Get database and users collection
-    database = Database.get_database()
-    users_collection = database["users"]
+    # Validate new password strength
+    is_valid, error_message = validate_password_strength(password_data.new_password)
+    if not is_valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_message,
+        )
 
-    # Verify old password
-    if not verify_password(password_data.old_password, current_user.hashed_password):
+    # Reject no-op changes before paying for a lookup and bcrypt
+    if password_data.new_password == password_data.old_password:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Incorrect old password",
+            detail="New password must differ from old password",
         )
 
-    # Validate new password strength
-    is_valid, error_message = validate_password_strength(password_data.new_password)
-    if not is_valid:
+    users_collection = db["users"]
+
+    # Load the stored password hash
+    user_doc = await users_collection.find_one(
+        {"username": current_user.username}, projection={"hashed_password": 1}
+    )
+    if not user_doc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Verify old password
+    if not await asyncio.to_thread(
+        verify_password, password_data.old_password, user_doc["hashed_password"]
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error_message,
+            detail="Incorrect old password",
         )
 
     # Hash new password
-    new_hashed_password = hash_password(password_data.new_password)
+    new_hashed_password = await asyncio.to_thread(
+        hash_password, password_data.new_password
+    )
 
     # Update password in MongoDB
     await users_collection.update_one(
@@ -402,10 +481,11 @@ async def change_password(
         {
             "$set": {
                 "hashed_password": new_hashed_password,
-                "updated_at": datetime.utcnow(),
+                "updated_at": _utcnow(),
             }
         },
     )
+    invalidate_cached_user(current_user.username)
 
-    return MessageResponse(message="Password changed successfully")
+    return ORJSONResponse({"message": "Password changed successfully"})
 
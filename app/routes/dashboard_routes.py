@@ -7,46 +7,24 @@ trends, top offenders, and activity feeds.
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 
-from src.database.connection import Database
 from src.database.models import (
     AlertModel,
     AlertSummary,
+    DashboardBundle,
     RecentActivity,
     TopOffender,
     TrendDataPoint,
 )
 from app.auth.dependencies import require_viewer
+from app.routes.dependencies import get_database
 from app.services import dashboard_service
+from app.utils.responses import ORJSONResponse, model_response, ndjson_response
 
 router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
 
-# ============================================================================
-# DEPENDENCIES
-# ============================================================================
-
-
-async def get_database():
-    """
-    Dependency function to get database instance.
-    
-    Returns:
-        AsyncIOMotorDatabase: MongoDB database instance
-        
-    Raises:
-        HTTPException: If database is not connected
-    """
-    try:
-        return Database.get_database()
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Database not available: {str(e)}",
-        )
-
-
 # ============================================================================
 # DASHBOARD ENDPOINTS
 # ============================================================================
@@ -79,20 +57,9 @@ async def get_summary(
         AlertSummary: Summary statistics
         
     Raises:
-        HTTPException: 500 if aggregation fails, 503 if database unavailable
+        HTTPException: 503 if database unavailable or the query times out
     """
-    try:
-        return await dashboard_service.get_alert_summary(db)
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get alert summary: {str(e)}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error getting alert summary: {str(e)}",
-        )
+    return model_response(await dashboard_service.get_alert_summary(db))
 
 
 @router.get(
@@ -130,20 +97,9 @@ async def get_top_offenders(
         List[TopOffender]: List of top offenders with alert counts
         
     Raises:
-        HTTPException: 500 if aggregation fails, 503 if database unavailable
+        HTTPException: 503 if database unavailable or the query times out
     """
-    try:
-        return await dashboard_service.get_top_offenders(limit, db)
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get top offenders: {str(e)}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error getting top offenders: {str(e)}",
-        )
+    return model_response(await dashboard_service.get_top_offenders(limit, db))
 
 
 @router.get(
@@ -160,6 +116,10 @@ async def get_recent_activities(
         le=100,
         description="Maximum number of activities to return",
     ),
+    stream: bool = Query(
+        default=False,
+        description="Stream results as newline-delimited JSON",
+    ),
     db=Depends(get_database),
     current_user=Depends(require_viewer),
 ):
@@ -171,6 +131,7 @@ async def get_recent_activities(
     
     Args:
         limit: Maximum number of activities to return (1-100)
+        stream: Stream results as NDJSON instead of one JSON list
         db: MongoDB database instance (from dependency)
         current_user: Current authenticated user (from dependency)
         
@@ -178,20 +139,11 @@ async def get_recent_activities(
         List[RecentActivity]: List of recent state transitions
         
     Raises:
-        HTTPException: 500 if aggregation fails, 503 if database unavailable
+        HTTPException: 503 if database unavailable or the query times out
     """
-    try:
-        return await dashboard_service.get_recent_activities(limit, db)
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get recent activities: {str(e)}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error getting recent activities: {str(e)}",
-        )
+    if stream:
+        return ndjson_response(dashboard_service.iter_recent_activities(limit, db))
+    return model_response(await dashboard_service.get_recent_activities(limit, db))
 
 
 @router.get(
@@ -208,6 +160,10 @@ async def get_auto_closed(
         le=168,
         description="Number of hours to look back (1-168, default: 24)",
     ),
+    stream: bool = Query(
+        default=False,
+        description="Stream results as newline-delimited JSON",
+    ),
     db=Depends(get_database),
     current_user=Depends(require_viewer),
 ):
@@ -219,6 +175,7 @@ async def get_auto_closed(
     
     Args:
         hours: Number of hours to look back (1-168, default: 24)
+        stream: Stream results as NDJSON instead of one JSON list
         db: MongoDB database instance (from dependency)
         current_user: Current authenticated user (from dependency)
         
@@ -226,20 +183,11 @@ async def get_auto_closed(
         List[AlertModel]: List of auto-closed alerts
         
     Raises:
-        HTTPException: 500 if query fails, 503 if database unavailable
+        HTTPException: 503 if database unavailable or the query times out
     """
-    try:
-        return await dashboard_service.get_auto_closed_alerts(hours, db)
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get auto-closed alerts: {str(e)}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error getting auto-closed alerts: {str(e)}",
-        )
+    if stream:
+        return ndjson_response(dashboard_service.iter_auto_closed_alerts(hours, db))
+    return model_response(await dashboard_service.get_auto_closed_alerts(hours, db))
 
 
 @router.get(
@@ -277,24 +225,14 @@ async def get_trends(
         List[TrendDataPoint]: List of daily trend data points
         
     Raises:
-        HTTPException: 500 if aggregation fails, 503 if database unavailable
+        HTTPException: 503 if database unavailable or the query times out
     """
-    try:
-        return await dashboard_service.get_trend_data(days, db)
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get trend data: {str(e)}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error getting trend data: {str(e)}",
-        )
+    return model_response(await dashboard_service.get_trend_data(days, db))
 
 
 @router.get(
     "/source-distribution",
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="Get source distribution",
     description="Get alert counts grouped by source type.",
@@ -317,18 +255,72 @@ async def get_source_distribution(
         Dict[str, int]: Dictionary mapping source_type to count
         
     Raises:
-        HTTPException: 500 if aggregation fails, 503 if database unavailable
+        HTTPException: 503 if database unavailable or the query times out
     """
-    try:
-        return await dashboard_service.get_source_distribution(db)
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get source distribution: {str(e)}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error getting source distribution: {str(e)}",
-        )
+    return ORJSONResponse(await dashboard_service.get_source_distribution(db))
+
 
+@router.get(
+    "/bundle",
+    response_model=DashboardBundle,
+    status_code=status.HTTP_200_OK,
+    summary="Get all dashboard data",
+    description=(
+        "Get every dashboard widget's data in a single request, served by "
+        "concurrent per-widget queries."
+    ),
+)
+async def get_dashboard_bundle(
+    offenders_limit: int = Query(
+        default=5,
+        ge=1,
+        le=20,
+        description="Maximum number of top offenders to return",
+    ),
+    activities_limit: int = Query(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum number of recent activities to return",
+    ),
+    auto_closed_hours: int = Query(
+        default=24,
+        ge=1,
+        le=168,
+        description="Number of hours to look back for auto-closed alerts (1-168, default: 24)",
+    ),
+    trend_days: int = Query(
+        default=7,
+        ge=1,
+        le=90,
+        description="Number of days of trend data (1-90, default: 7)",
+    ),
+    db=Depends(get_database),
+    current_user=Depends(require_viewer),
+):
+    """
+    Get all dashboard data at once.
+    
+    Combines summary, top offenders, recent activities, auto-closed alerts,
+    trends, and source distribution, fetched with concurrent indexed queries
+    in one request.
+    The individual dashboard endpoints remain available.
+    
+    Args:
+        offenders_limit: Maximum number of top offenders to return (1-20)
+        activities_limit: Maximum number of recent activities to return (1-100)
+        auto_closed_hours: Number of hours to look back for auto-closed alerts (1-168)
+        trend_days: Number of days of trend data (1-90)
+        db: MongoDB database instance (from dependency)
+        current_user: Current authenticated user (from dependency)
+        
+    Returns:
+        DashboardBundle: Data for every dashboard widget
+        
+    Raises:
+        HTTPException: 503 if database unavailable or the query times out
+    """
+    bundle = await dashboard_service.get_dashboard_bundle(
+        offenders_limit, activities_limit, auto_closed_hours, trend_days, db
+    )
+    return model_response(bundle)
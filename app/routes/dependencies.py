@@ -0,0 +1,29 @@
+"""Shared FastAPI dependencies for API routes."""
+
+from fastapi import HTTPException, Request, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+
+async def get_database(request: Request) -> AsyncIOMotorDatabase:
+    """
+    Dependency function to get database instance.
+
+    Returns the handle bound to app.state at startup, so requests do not
+    re-resolve it through Database.get_database().
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        AsyncIOMotorDatabase: MongoDB database instance
+
+    Raises:
+        HTTPException: 503 if database is not connected
+    """
+    db = getattr(request.app.state, "db", None)
+    if db is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not available: Database is not connected.",
+        )
+    return db
@@ -1,27 +1,43 @@
 """Rule management routes for creating, listing, and managing rules."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel, Field
 
-from src.database.connection import Database
 from src.database.models import (
     EscalationCondition,
     RuleModel,
     SourceType,
 )
+from app.routes.dependencies import get_database
 from app.services.rule_service import (
     create_rule,
     delete_rule,
-    get_active_rules_for_source,
     load_default_rules,
     update_rule,
 )
+from app.utils.responses import ORJSONResponse, model_response
 
 router = APIRouter(prefix="/api/rules", tags=["Rules"])
 
+# Projects rule documents straight into the RuleResponse JSON shape
+RULE_RESPONSE_PROJECTION = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "rule_id": 1,
+    "source_type": 1,
+    "name": 1,
+    "description": 1,
+    "conditions": 1,
+    "is_active": 1,
+    "priority": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -145,6 +161,26 @@ def rule_model_to_response(rule: RuleModel) -> RuleResponse:
     )
 
 
+def rule_list_pipeline(query: dict) -> List[dict]:
+    """
+    Build the pipeline listing matching rules in RuleResponse shape.
+
+    Documents come back ready to serialize, so list endpoints return them
+    without building a model per rule.
+
+    Args:
+        query: Rule filter
+
+    Returns:
+        List[dict]: Aggregation pipeline sorted by priority descending
+    """
+    return [
+        {"$match": query},
+        {"$sort": {"priority": -1}},
+        {"$project": RULE_RESPONSE_PROJECTION},
+    ]
+
+
 # ============================================================================
 # RULE ENDPOINTS
 # ============================================================================
@@ -157,10 +193,15 @@ def rule_model_to_response(rule: RuleModel) -> RuleResponse:
     summary="Load default rules",
     description="Load default rules from JSON file. No authentication required.",
 )
-async def load_default_rules_endpoint():
+async def load_default_rules_endpoint(
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
     """
     Load default rules from JSON file.
 
+    Args:
+        db: MongoDB database instance (from dependency)
+
     Returns:
         LoadDefaultsResponse: Response with count of loaded rules
 
@@ -168,9 +209,6 @@ async def load_default_rules_endpoint():
         HTTPException: 500 if loading fails
     """
     try:
-        # Get database
-        db = Database.get_database()
-
         # Load default rules
         count = await load_default_rules(db)
 
@@ -189,11 +227,6 @@ async def load_default_rules_endpoint():
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to load default rules: {str(e)}",
-        )
 
 
 @router.get(
@@ -206,6 +239,7 @@ async def load_default_rules_endpoint():
 async def list_rules(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     source_type: Optional[SourceType] = Query(None, description="Filter by source type"),
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     List rules with optional filtering.
@@ -213,37 +247,65 @@ async def list_rules(
     Args:
         is_active: Optional filter for active status
         source_type: Optional filter for source type
+        db: MongoDB database instance (from dependency)
 
     Returns:
         List[RuleResponse]: List of rules
     """
-    try:
-        # Get database
-        db = Database.get_database()
-        rules_collection = db["rules"]
+    rules_collection = db["rules"]
 
-        # Build query
-        query = {}
-        if is_active is not None:
-            query["is_active"] = is_active
-        if source_type:
-            query["source_type"] = source_type.value
+    # Build query
+    query = {}
+    if is_active is not None:
+        query["is_active"] = is_active
+    if source_type:
+        query["source_type"] = source_type.value
 
-        # Query rules
-        cursor = rules_collection.find(query).sort("priority", -1)
-        rule_docs = await cursor.to_list(length=None)
+    cursor = rules_collection.aggregate(rule_list_pipeline(query))
+    rule_docs = await cursor.to_list(length=None)
 
-        # Convert to RuleModel and then to RuleResponse
-        rules = [RuleModel(**doc) for doc in rule_docs]
-        rule_responses = [rule_model_to_response(rule) for rule in rules]
+    return ORJSONResponse(rule_docs)
 
-        return rule_responses
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list rules: {str(e)}",
-        )
+# Declared before "/{rule_id}" so "active" is not taken as a rule ID
+@router.get(
+    "/active",
+    response_model=Dict[SourceType, List[RuleResponse]],
+    status_code=status.HTTP_200_OK,
+    summary="Get active rules for several source types",
+    description="Get active rules for every requested source type in one query. "
+    "Repeat the source_types parameter per type. No authentication required.",
+)
+async def get_active_rules_for_sources_endpoint(
+    source_types: List[SourceType] = Query(..., description="Source types to fetch rules for"),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """
+    Get active rules for several source types with a single $in query.
+
+    Args:
+        source_types: Source types to fetch rules for
+        db: MongoDB database instance (from dependency)
+
+    Returns:
+        Dict[SourceType, List[RuleResponse]]: Active rules per requested source
+            type, sorted by priority descending; types without rules map to []
+    """
+    rules_collection = db["rules"]
+
+    query = {
+        "is_active": True,
+        "source_type": {"$in": [source_type.value for source_type in source_types]},
+    }
+    cursor = rules_collection.aggregate(rule_list_pipeline(query))
+    rule_docs = await cursor.to_list(length=None)
+
+    # Group by source type; documents arrive sorted by priority
+    grouped: Dict[str, List[dict]] = {source_type.value: [] for source_type in source_types}
+    for doc in rule_docs:
+        grouped[doc["source_type"]].append(doc)
+
+    return ORJSONResponse(grouped)
 
 
 @router.get(
@@ -253,12 +315,16 @@ async def list_rules(
     summary="Get rule by ID",
     description="Get a specific rule by its ID. No authentication required.",
 )
-async def get_rule(rule_id: str):
+async def get_rule(
+    rule_id: str,
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
     """
     Get a rule by its ID.
 
     Args:
         rule_id: Rule ID to retrieve
+        db: MongoDB database instance (from dependency)
 
     Returns:
         RuleResponse: Rule information
@@ -266,31 +332,20 @@ async def get_rule(rule_id: str):
     Raises:
         HTTPException: 404 if rule not found
     """
-    try:
-        # Get database
-        db = Database.get_database()
-        rules_collection = db["rules"]
+    rules_collection = db["rules"]
 
-        # Find rule by rule_id
-        rule_doc = await rules_collection.find_one({"rule_id": rule_id})
+    # Find rule by rule_id
+    rule_doc = await rules_collection.find_one({"rule_id": rule_id})
 
-        if not rule_doc:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Rule with ID {rule_id} not found",
-            )
-
-        rule = RuleModel(**rule_doc)
-        return rule_model_to_response(rule)
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not rule_doc:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve rule: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Rule with ID {rule_id} not found",
         )
 
+    rule = RuleModel(**rule_doc)
+    return model_response(rule_model_to_response(rule))
+
 
 @router.post(
     "",
@@ -301,12 +356,14 @@ async def get_rule(rule_id: str):
 )
 async def create_rule_endpoint(
     request: CreateRuleRequest,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Create a new rule.
 
     Args:
         request: Rule creation request data
+        db: MongoDB database instance (from dependency)
 
     Returns:
         RuleResponse: Created rule information
@@ -314,33 +371,23 @@ async def create_rule_endpoint(
     Raises:
         HTTPException: 400 if rule_id already exists, 500 if creation fails
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Create RuleModel from request
-        rule_data = RuleModel(
-            rule_id=request.rule_id,
-            source_type=request.source_type,
-            name=request.name,
-            description=request.description,
-            conditions=request.conditions,
-            is_active=request.is_active,
-            priority=request.priority,
-        )
-
-        # Create rule
-        created_rule = await create_rule(rule_data, db)
+    # Request fields are already validated; build RuleModel without re-validating
+    rule_data = RuleModel.model_construct(
+        rule_id=request.rule_id,
+        source_type=request.source_type,
+        name=request.name,
+        description=request.description,
+        conditions=request.conditions,
+        is_active=request.is_active,
+        priority=request.priority,
+    )
 
-        return rule_model_to_response(created_rule)
+    # Create rule
+    created_rule = await create_rule(rule_data, db)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create rule: {str(e)}",
-        )
+    return model_response(
+        rule_model_to_response(created_rule), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.put(
@@ -353,6 +400,7 @@ async def create_rule_endpoint(
 async def update_rule_endpoint(
     rule_id: str,
     request: UpdateRuleRequest,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Update an existing rule.
@@ -360,6 +408,7 @@ async def update_rule_endpoint(
     Args:
         rule_id: Rule ID to update
         request: Rule update request data
+        db: MongoDB database instance (from dependency)
 
     Returns:
         RuleResponse: Updated rule information
@@ -367,44 +416,32 @@ async def update_rule_endpoint(
     Raises:
         HTTPException: 404 if rule not found, 400 if update data is invalid
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Build updates dict (exclude None values)
-        updates = {}
-        if request.name is not None:
-            updates["name"] = request.name
-        if request.description is not None:
-            updates["description"] = request.description
-        if request.conditions is not None:
-            updates["conditions"] = request.conditions.model_dump()
-        if request.is_active is not None:
-            updates["is_active"] = request.is_active
-        if request.priority is not None:
-            updates["priority"] = request.priority
-        if request.source_type is not None:
-            updates["source_type"] = request.source_type
-
-        if not updates:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No fields to update",
-            )
-
-        # Update rule
-        updated_rule = await update_rule(rule_id, updates, db)
-
-        return rule_model_to_response(updated_rule)
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Build updates dict (exclude None values)
+    updates = {}
+    if request.name is not None:
+        updates["name"] = request.name
+    if request.description is not None:
+        updates["description"] = request.description
+    if request.conditions is not None:
+        updates["conditions"] = request.conditions.model_dump()
+    if request.is_active is not None:
+        updates["is_active"] = request.is_active
+    if request.priority is not None:
+        updates["priority"] = request.priority
+    if request.source_type is not None:
+        updates["source_type"] = request.source_type
+
+    if not updates:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update rule: {str(e)}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update",
         )
 
+    # Update rule
+    updated_rule = await update_rule(rule_id, updates, db)
+
+    return model_response(rule_model_to_response(updated_rule))
+
 
 @router.delete(
     "/{rule_id}",
@@ -413,13 +450,15 @@ async def update_rule_endpoint(
     description="Delete a rule by its ID. No authentication required.",
 )
 async def delete_rule_endpoint(
-    rule_id: str
+    rule_id: str,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Delete a rule.
 
     Args:
         rule_id: Rule ID to delete
+        db: MongoDB database instance (from dependency)
 
     Returns:
         None (204 No Content)
@@ -427,29 +466,17 @@ async def delete_rule_endpoint(
     Raises:
         HTTPException: 500 if deletion fails
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Delete rule
-        deleted = await delete_rule(rule_id, db)
-
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Rule with ID {rule_id} not found",
-            )
-
-        return None
+    # Delete rule
+    deleted = await delete_rule(rule_id, db)
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not deleted:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete rule: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Rule with ID {rule_id} not found",
         )
 
+    return None
+
 
 @router.get(
     "/active/{source_type}",
@@ -460,31 +487,26 @@ async def delete_rule_endpoint(
 )
 async def get_active_rules_for_source_endpoint(
     source_type: SourceType,
+    db: AsyncIOMotorDatabase = Depends(get_database),
 ):
     """
     Get all active rules for a specific source type.
 
     Args:
         source_type: Source type to filter by
+        db: MongoDB database instance (from dependency)
 
     Returns:
         List[RuleResponse]: List of active rules for the source type
     """
-    try:
-        # Get database
-        db = Database.get_database()
-
-        # Get active rules for source type
-        rules = await get_active_rules_for_source(source_type, db)
+    rules_collection = db["rules"]
 
-        # Convert to response models
-        rule_responses = [rule_model_to_response(rule) for rule in rules]
+    # Query active rules for source type
+    cursor = rules_collection.aggregate(
+        rule_list_pipeline({"source_type": source_type.value, "is_active": True})
+    )
+    rule_docs = await cursor.to_list(length=None)
 
-        return rule_responses
+    return ORJSONResponse(rule_docs)
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve active rules: {str(e)}",
-        )
 
@@ -1,10 +1,20 @@
-"""Alert service for MongoDB operations on alerts collection."""
+"""
+Alert service for MongoDB operations on alerts collection.
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+Every function takes the database handle from its caller (the get_database
+dependency in routes, Database.get_database() in jobs). Both resolve to the
+single client opened at startup, so calls share one connection pool and no
+function opens its own client.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Dict, FrozenSet, List, Optional, Tuple
 
 from fastapi import HTTPException, status
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
 from pymongo.errors import PyMongoError
 
 from src.database.models import (
@@ -15,7 +25,22 @@ from src.database.models import (
     AlertStatus,
     SourceType,
 )
-from app.utils.alert_id_generator import generate_alert_id
+from app.services.counter_service import (
+    apply_counter_delta,
+    apply_trend_deltas,
+    change_delta,
+    creation_delta,
+    trend_change_deltas,
+    trend_creation_deltas,
+)
+from app.services.event_service import build_alert_event, record_alert_events
+from app.utils.alert_id_generator import alert_id_allocator
+from app.utils.async_cache import single_flight
+from app.utils.ttl_cache import TTLCache
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 # Default expiration days (configurable)
 DEFAULT_EXPIRATION_DAYS = 7
@@ -30,14 +55,90 @@ DEFAULT_SEVERITY_MAP = {
     SourceType.SAFETY: AlertSeverity.CRITICAL,
 }
 
+# Short-lived cache for get_alert_by_id. Alerts created or transitioned
+# through this module are written through, bulk auto-closes drop their
+# entries, and the TTL bounds staleness otherwise
+ALERT_CACHE_MAXSIZE = 4096
+ALERT_CACHE_TTL_SECONDS = 5
+_alert_cache = TTLCache(maxsize=ALERT_CACHE_MAXSIZE, ttl=ALERT_CACHE_TTL_SECONDS)
+
+def _enum_value(value):
+    """Return an enum member's value, or the value itself if it is not an enum."""
+    return getattr(value, "value", value)
+
+
+def _identity(value):
+    """Return the value unchanged."""
+    return value
+
+
+# list_alert_documents filters: (filters key, alert field, value coercer)
+_FILTER_SPECS = (
+    ("status", "status", _enum_value),
+    ("source_type", "source_type", _enum_value),
+    ("severity", "severity", _enum_value),
+    ("driver_id", "metadata.driver_id", _identity),
+)
+
+
 # State transition rules
-VALID_TRANSITIONS: Dict[AlertStatus, List[AlertStatus]] = {
-    AlertStatus.OPEN: [AlertStatus.ESCALATED, AlertStatus.AUTO_CLOSED, AlertStatus.RESOLVED],
-    AlertStatus.ESCALATED: [AlertStatus.AUTO_CLOSED, AlertStatus.RESOLVED],
-    AlertStatus.AUTO_CLOSED: [],  # Terminal state
-    AlertStatus.RESOLVED: [],  # Terminal state
+VALID_TRANSITIONS: Dict[AlertStatus, FrozenSet[AlertStatus]] = {
+    AlertStatus.OPEN: frozenset(
+        {AlertStatus.ESCALATED, AlertStatus.AUTO_CLOSED, AlertStatus.RESOLVED}
+    ),
+    AlertStatus.ESCALATED: frozenset({AlertStatus.AUTO_CLOSED, AlertStatus.RESOLVED}),
+    AlertStatus.AUTO_CLOSED: frozenset(),  # Terminal state
+    AlertStatus.RESOLVED: frozenset(),  # Terminal state
+}
+
+# Statuses each status may be entered from, for the guarded update filter
+ALLOWED_FROM: Dict[AlertStatus, FrozenSet[AlertStatus]] = {
+    target: frozenset(
+        source for source, targets in VALID_TRANSITIONS.items() if target in targets
+    )
+    for target in AlertStatus
 }
 
+# Enum values resolved once; enum .value goes through a descriptor per access
+_STATUS_VALUES: Dict[AlertStatus, str] = {member: member.value for member in AlertStatus}
+_SEVERITY_VALUES: Dict[AlertSeverity, str] = {member: member.value for member in AlertSeverity}
+_SOURCE_TYPE_VALUES: Dict[SourceType, str] = {member: member.value for member in SourceType}
+_OPEN = AlertStatus.OPEN.value
+_CRITICAL = AlertSeverity.CRITICAL.value
+
+# Stored values back to enum members, without going through Enum.__call__
+_STATUS_BY_VALUE: Dict[str, AlertStatus] = {member.value: member for member in AlertStatus}
+_SEVERITY_BY_VALUE: Dict[str, AlertSeverity] = {member.value: member for member in AlertSeverity}
+_SOURCE_TYPE_BY_VALUE: Dict[str, SourceType] = {member.value: member for member in SourceType}
+
+# Status values each status may be entered from, as used in update filters
+_ALLOWED_FROM_VALUES: Dict[AlertStatus, List[str]] = {
+    target: sorted(source.value for source in sources)
+    for target, sources in ALLOWED_FROM.items()
+}
+
+
+# Resolved once instead of per call
+_UTC = timezone.utc
+
+# Pydantic v2 serializes with model_dump(), v1 with dict(); resolved once
+_DUMP_METHOD = "model_dump" if hasattr(AlertStateTransition, "model_dump") else "dict"
+_HAS_MODEL_CONSTRUCT = hasattr(AlertModel, "model_construct")
+
+
+def _utcnow() -> datetime:
+    """
+    Get the current UTC time as a naive datetime.
+
+    Avoids datetime.utcnow(), which is deprecated and warns on every call
+    on Python 3.12+. The result stays naive to match the datetimes Motor
+    returns for stored alerts, which the rule engine compares against.
+
+    Returns:
+        datetime: Current UTC time
+    """
+    return datetime.now(_UTC).replace(tzinfo=None)
+
 
 def _pydantic_to_dict(obj) -> dict:
     """
@@ -50,13 +151,9 @@ def _pydantic_to_dict(obj) -> dict:
     Returns:
         dict: Dictionary representation of the model
     """
-    if hasattr(obj, 'model_dump'):
-        return obj.model_dump()
-    elif hasattr(obj, 'dict'):
-        return obj.dict()
-    else:
-        # Fallback: if it's already a dict, return it
-        return dict(obj) if isinstance(obj, dict) else {}
+    if isinstance(obj, dict):
+        return obj
+    return getattr(obj, _DUMP_METHOD)()
 
 
 def _validate_state_transition(current_status: AlertStatus, new_status: AlertStatus) -> None:
@@ -76,15 +173,369 @@ def _validate_state_transition(current_status: AlertStatus, new_status: AlertSta
             detail=f"Alert is already in {new_status.value} status",
         )
 
-    allowed_transitions = VALID_TRANSITIONS.get(current_status, [])
+    allowed_transitions = VALID_TRANSITIONS.get(current_status, frozenset())
     if new_status not in allowed_transitions:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid state transition: {current_status.value} → {new_status.value}. "
-            f"Allowed transitions: {[t.value for t in allowed_transitions]}",
+            f"Allowed transitions: {sorted(t.value for t in allowed_transitions)}",
         )
 
 
+def _status_set_fields(new_status: AlertStatus, now: datetime, reason: str) -> Dict:
+    """
+    Build the $set fields for a status transition.
+
+    Args:
+        new_status: Status to transition to
+        now: Transition timestamp
+        reason: Reason for the status change
+
+    Returns:
+        Dict: Fields to set on the alert
+    """
+    set_fields: Dict = {
+        "status": _STATUS_VALUES[new_status],
+        "updated_at": now,
+    }
+
+    # Update timestamps based on status
+    if new_status == AlertStatus.ESCALATED:
+        set_fields["escalated_at"] = now
+        set_fields["severity"] = _CRITICAL
+    elif new_status == AlertStatus.AUTO_CLOSED:
+        set_fields["closed_at"] = now
+        if reason:
+            set_fields["auto_close_reason"] = reason
+    elif new_status == AlertStatus.RESOLVED:
+        set_fields["resolved_at"] = now
+
+    return set_fields
+
+
+def _build_status_update(
+    current_status: AlertStatus,
+    new_status: AlertStatus,
+    now: datetime,
+    reason: str,
+    triggered_by: str,
+    rule_id: Optional[str],
+) -> Dict:
+    """
+    Build the MongoDB update document for a status transition.
+
+    Args:
+        current_status: Current alert status
+        new_status: Status to transition to
+        now: Transition timestamp
+        reason: Reason for the status change
+        triggered_by: User or system that triggered the change
+        rule_id: Optional rule ID that triggered the transition
+
+    Returns:
+        Dict: Update document with $set and $push operators
+    """
+    # Create state transition entry
+    transition = AlertStateTransition(
+        from_status=current_status,
+        to_status=new_status,
+        timestamp=now,
+        reason=reason,
+        triggered_by=triggered_by,
+        rule_triggered=rule_id,
+    )
+
+    return {
+        "$set": _status_set_fields(new_status, now, reason),
+        "$push": {"state_history": _pydantic_to_dict(transition)},
+    }
+
+
+async def _transition_alert(
+    alert_id: str,
+    new_status: AlertStatus,
+    set_fields: Dict,
+    reason: str,
+    triggered_by: str,
+    rule_id: Optional[str],
+    now: datetime,
+    db: AsyncIOMotorDatabase,
+) -> Tuple[dict, dict]:
+    """
+    Validate and apply a status transition in one server operation.
+
+    The filter only matches alerts whose current status may transition to
+    new_status, and the pipeline update records the status it replaced as
+    the history entry's from_status, so the check and the write are atomic.
+    The alert is only read again when the update matched nothing, to tell
+    the caller why. The document before the update is returned along with
+    the updated one, which is derived from it by applying the same update.
+
+    Args:
+        alert_id: Alert ID to update
+        new_status: Status to transition to
+        set_fields: Fields to set, including the new status
+        reason: Reason for the status change
+        triggered_by: User or system that triggered the change
+        rule_id: Optional rule ID that triggered the transition
+        now: Transition timestamp
+        db: MongoDB database instance
+
+    Returns:
+        Tuple of (alert document before, alert document after the update)
+
+    Raises:
+        HTTPException: 400 if transition is invalid, 404 if alert not found,
+            409 if the alert changed status concurrently
+    """
+    transition = {
+        "from_status": "$status",
+        "to_status": {"$literal": _STATUS_VALUES[new_status]},
+        "timestamp": {"$literal": now},
+        "reason": {"$literal": reason},
+        "triggered_by": {"$literal": triggered_by},
+        "rule_triggered": {"$literal": rule_id},
+    }
+    # Values are wrapped in $literal so user text starting with "$" is not
+    # read as a field path. Every field in one $set stage sees the document
+    # as it was before the stage, so "$status" is the status being replaced.
+    pipeline = [
+        {
+            "$set": {
+                **{field: {"$literal": value} for field, value in set_fields.items()},
+                "state_history": {
+                    "$concatArrays": [{"$ifNull": ["$state_history", []]}, [transition]]
+                },
+            }
+        }
+    ]
+
+    alerts_collection = db["alerts"]
+    previous_doc = await alerts_collection.find_one_and_update(
+        {
+            "alert_id": alert_id,
+            "status": {"$in": _ALLOWED_FROM_VALUES[new_status]},
+        },
+        pipeline,
+        return_document=ReturnDocument.BEFORE,
+    )
+    _alert_cache.pop(alert_id)
+    if previous_doc is not None:
+        applied_transition = {
+            "from_status": previous_doc["status"],
+            "to_status": _STATUS_VALUES[new_status],
+            "timestamp": now,
+            "reason": reason,
+            "triggered_by": triggered_by,
+            "rule_triggered": rule_id,
+        }
+        updated_doc = {
+            **previous_doc,
+            **set_fields,
+            "state_history": [*(previous_doc.get("state_history") or []), applied_transition],
+        }
+        return previous_doc, updated_doc
+
+    # Nothing matched: report a missing alert or an invalid transition
+    alert_doc = await alerts_collection.find_one({"alert_id": alert_id}, {"status": 1})
+    if not alert_doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Alert with ID {alert_id} not found",
+        )
+    _validate_state_transition(AlertStatus(alert_doc["status"]), new_status)
+
+    # The transition is valid now, so the status changed between the two reads
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Alert {alert_id} changed status concurrently, please retry",
+    )
+
+
+async def _apply_follow_up_writes(*writes: Awaitable[None]) -> None:
+    """
+    Run the event log, counter and rollup writes that follow an alert write.
+
+    The writes are independent, so they run concurrently instead of adding
+    a round trip each. Each one logs its own database errors; anything else
+    is logged here, so a failed write neither fails the alert operation nor
+    cancels the others. Counter drift is corrected by the hourly
+    alert_counters_rebuilder job, and rollup drift for recent days by the
+    hourly daily_rollup_refresher.
+
+    Args:
+        *writes: Follow-up write coroutines
+    """
+    results = await asyncio.gather(*writes, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning(f"Alert follow-up write failed: {str(result)}")
+
+
+def _status_update_event(alert_doc: dict, update_doc: Dict) -> dict:
+    """
+    Build the alert event for an update built by _build_status_update.
+
+    Args:
+        alert_doc: Alert document before the update
+        update_doc: Update document with $set and $push operators
+
+    Returns:
+        dict: Event document
+    """
+    return build_alert_event(
+        alert_doc,
+        update_doc["$push"]["state_history"],
+        severity=update_doc["$set"].get("severity"),
+    )
+
+
+def _alert_from_doc(alert_doc: dict) -> AlertModel:
+    """
+    Build an AlertModel from a stored or just-inserted alert document.
+
+    Alert documents are built by this module from validated input, so
+    the model is built with model_construct; only the enums and nested
+    models that callers rely on are rebuilt. Falls back to full
+    validation on Pydantic v1.
+
+    Args:
+        alert_doc: Alert document from MongoDB
+
+    Returns:
+        AlertModel: Alert model
+    """
+    if not _HAS_MODEL_CONSTRUCT:
+        return AlertModel(**alert_doc)
+
+    fields = dict(alert_doc)
+    fields["source_type"] = _SOURCE_TYPE_BY_VALUE[alert_doc["source_type"]]
+    fields["severity"] = _SEVERITY_BY_VALUE[alert_doc["severity"]]
+    fields["status"] = _STATUS_BY_VALUE[alert_doc["status"]]
+    fields["metadata"] = AlertMetadata.model_construct(**(alert_doc.get("metadata") or {}))
+    fields["state_history"] = [
+        AlertStateTransition.model_construct(
+            **{
+                **transition,
+                "from_status": _STATUS_BY_VALUE[transition["from_status"]],
+                "to_status": _STATUS_BY_VALUE[transition["to_status"]],
+            }
+        )
+        for transition in alert_doc.get("state_history", [])
+    ]
+    return AlertModel.model_construct(**fields)
+
+
+def docs_to_alerts(alert_docs: List[dict]) -> List[AlertModel]:
+    """
+    Convert alert documents to AlertModel instances without revalidating them.
+
+    Args:
+        alert_docs: Stored or just-inserted alert documents; state_history
+            may be projected out
+
+    Returns:
+        List[AlertModel]: Alert models, in document order
+    """
+    return [_alert_from_doc(doc) for doc in alert_docs]
+
+
+def _parse_source_type(alert_data: dict) -> SourceType:
+    """
+    Read the source type from alert creation data.
+
+    Args:
+        alert_data: Dictionary containing alert data
+
+    Returns:
+        SourceType: Parsed source type
+
+    Raises:
+        ValueError: If source_type is missing or invalid
+    """
+    source_type = alert_data.get("source_type")
+    if isinstance(source_type, str):
+        source_type = SourceType(source_type)
+    elif not isinstance(source_type, SourceType):
+        raise ValueError("source_type must be a SourceType enum or valid string")
+    return source_type
+
+
+def _build_alert_doc(
+    alert_data: dict,
+    source_type: SourceType,
+    alert_id: str,
+    now: datetime,
+    expiration_days: int,
+) -> dict:
+    """
+    Build the document for a new alert.
+
+    Sets default status and severity, initializes state history, and
+    calculates expiration date.
+
+    Args:
+        alert_data: Dictionary containing alert data (metadata, severity)
+        source_type: Parsed source type of the alert
+        alert_id: Generated alert ID
+        now: Creation timestamp
+        expiration_days: Number of days until alert expires
+
+    Returns:
+        dict: Alert document ready to insert
+
+    Raises:
+        ValueError: If metadata or severity is invalid
+    """
+    # Get default severity based on source_type
+    default_severity = DEFAULT_SEVERITY_MAP.get(
+        source_type, AlertSeverity.INFO
+    )
+
+    # Get severity from alert_data or use default
+    severity = alert_data.get("severity", default_severity)
+    if isinstance(severity, str):
+        severity = AlertSeverity(severity)
+    elif not isinstance(severity, AlertSeverity):
+        severity = default_severity
+
+    # Get metadata; the only caller-supplied structure, so the only part validated
+    metadata_dict = alert_data.get("metadata", {})
+    metadata = AlertMetadata(**metadata_dict)
+
+    # Calculate expires_at
+    expires_at = now + timedelta(days=expiration_days)
+
+    # Create initial state transition; built here, so it needs no validation
+    initial_transition = {
+        "from_status": _OPEN,
+        "to_status": _OPEN,
+        "timestamp": now,
+        "reason": "Alert created",
+        "triggered_by": "system",
+        "rule_triggered": None,
+    }
+
+    return {
+        "alert_id": alert_id,
+        "source_type": _SOURCE_TYPE_VALUES[source_type],
+        "severity": _SEVERITY_VALUES[severity],
+        "status": _OPEN,
+        "timestamp": now,
+        "metadata": _pydantic_to_dict(metadata),
+        "state_history": [initial_transition],
+        "escalated_at": None,
+        "closed_at": None,
+        "resolved_at": None,
+        "auto_close_reason": None,
+        "expires_at": expires_at,
+        "resolved_by": None,
+        "resolution_notes": None,
+        "created_at": now,
+        "updated_at": None,
+    }
+
+
 async def create_alert(
     alert_data: dict,
     db: AsyncIOMotorDatabase,
@@ -108,97 +559,113 @@ async def create_alert(
         RuntimeError: If alert creation fails
     """
     try:
-        # Extract source_type from alert_data
-        source_type = alert_data.get("source_type")
-        if isinstance(source_type, str):
-            source_type = SourceType(source_type)
-        elif not isinstance(source_type, SourceType):
-            raise ValueError("source_type must be a SourceType enum or valid string")
+        source_type = _parse_source_type(alert_data)
 
         # Generate alert_id
-        alert_id = await generate_alert_id(source_type, db)
+        alert_id = await alert_id_allocator.next(source_type, db)
 
-        # Get default severity based on source_type
-        default_severity = DEFAULT_SEVERITY_MAP.get(
-            source_type, AlertSeverity.INFO
+        # Create alert document
+        alert_doc = _build_alert_doc(
+            alert_data, source_type, alert_id, _utcnow(), expiration_days
         )
 
-        # Get severity from alert_data or use default
-        severity = alert_data.get("severity", default_severity)
-        if isinstance(severity, str):
-            severity = AlertSeverity(severity)
-        elif not isinstance(severity, AlertSeverity):
-            severity = default_severity
+        # Insert into alerts collection
+        alerts_collection = db["alerts"]
+        result = await alerts_collection.insert_one(alert_doc)
+        await _apply_follow_up_writes(
+            record_alert_events(
+                [build_alert_event(alert_doc, alert_doc["state_history"][0])], db
+            ),
+            apply_counter_delta(creation_delta([alert_doc]), db),
+            apply_trend_deltas(trend_creation_deltas([alert_doc]), db),
+        )
 
-        # Get metadata
-        metadata_dict = alert_data.get("metadata", {})
-        metadata = AlertMetadata(**metadata_dict)
+        # insert_one stamped _id on alert_doc, so it already holds the stored alert
+        alert_doc["_id"] = result.inserted_id
+        alert = _alert_from_doc(alert_doc)
+        _alert_cache.set(alert_id, alert)
+        return alert
 
-        # Current timestamp
-        now = datetime.utcnow()
-
-        # Calculate expires_at
-        expires_at = now + timedelta(days=expiration_days)
-
-        # Create initial state transition
-        initial_transition = AlertStateTransition(
-            from_status=AlertStatus.OPEN,
-            to_status=AlertStatus.OPEN,
-            timestamp=now,
-            reason="Alert created",
-            triggered_by="system",
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
+    except PyMongoError as e:
+        raise RuntimeError(f"Database error creating alert: {str(e)}") from e
 
-        # Create alert document
-        alert_doc = {
-            "alert_id": alert_id,
-            "source_type": source_type.value,
-            "severity": severity.value,
-            "status": AlertStatus.OPEN.value,
-            "timestamp": now,
-            "metadata": _pydantic_to_dict(metadata),
-            "state_history": [_pydantic_to_dict(initial_transition)],
-            "escalated_at": None,
-            "closed_at": None,
-            "resolved_at": None,
-            "auto_close_reason": None,
-            "expires_at": expires_at,
-            "resolved_by": None,
-            "resolution_notes": None,
-            "created_at": now,
-            "updated_at": None,
-        }
 
-        # Insert into alerts collection
-        alerts_collection = db["alerts"]
-        result = await alerts_collection.insert_one(alert_doc)
+async def create_alerts_bulk(
+    alerts_data: List[dict],
+    db: AsyncIOMotorDatabase,
+    expiration_days: int = DEFAULT_EXPIRATION_DAYS,
+) -> List[AlertModel]:
+    """
+    Create several alerts with a single insert_many.
 
-        # Fetch the created alert
-        created_alert_doc = await alerts_collection.find_one({"_id": result.inserted_id})
-        if not created_alert_doc:
-            raise RuntimeError("Failed to retrieve created alert")
+    All alerts are validated before anything is written, so invalid input
+    creates nothing. The insert is unordered; with no alert_id collisions
+    every document is written.
 
-        # Convert to AlertModel
-        alert = AlertModel(**created_alert_doc)
-        return alert
+    Args:
+        alerts_data: List of alert data dictionaries, as taken by create_alert
+        db: MongoDB database instance
+        expiration_days: Number of days until alerts expire (default: 7)
+
+    Returns:
+        List[AlertModel]: Created alert models, in input order
+
+    Raises:
+        HTTPException: 400 if any alert data is invalid
+        RuntimeError: If alert creation fails
+    """
+    if not alerts_data:
+        return []
+
+    try:
+        source_types = [_parse_source_type(alert_data) for alert_data in alerts_data]
+
+        # Generate alert_ids; mostly served from the allocator's reserved block
+        alert_ids = await asyncio.gather(
+            *(alert_id_allocator.next(source_type, db) for source_type in source_types)
+        )
+
+        now = _utcnow()
+        alert_docs = [
+            _build_alert_doc(alert_data, source_type, alert_id, now, expiration_days)
+            for alert_data, source_type, alert_id in zip(alerts_data, source_types, alert_ids)
+        ]
+
+        # insert_many stamps _id on every document
+        await db["alerts"].insert_many(alert_docs, ordered=False)
+        await _apply_follow_up_writes(
+            record_alert_events(
+                [build_alert_event(doc, doc["state_history"][0]) for doc in alert_docs], db
+            ),
+            apply_counter_delta(creation_delta(alert_docs), db),
+            apply_trend_deltas(trend_creation_deltas(alert_docs), db),
+        )
+
+        alerts = docs_to_alerts(alert_docs)
+        for alert in alerts:
+            _alert_cache.set(alert.alert_id, alert)
+        return alerts
 
-    except HTTPException:
-        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except PyMongoError as e:
-        raise RuntimeError(f"Database error creating alert: {str(e)}") from e
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error creating alert: {str(e)}") from e
+        raise RuntimeError(f"Database error creating alerts: {str(e)}") from e
 
 
 async def get_alert_by_id(alert_id: str, db: AsyncIOMotorDatabase) -> Optional[AlertModel]:
     """
     Get an alert by its alert_id.
 
+    Found alerts are cached for ALERT_CACHE_TTL_SECONDS.
+
     Args:
         alert_id: The alert ID to search for
         db: MongoDB database instance
@@ -209,6 +676,10 @@ async def get_alert_by_id(alert_id: str, db: AsyncIOMotorDatabase) -> Optional[A
     Raises:
         RuntimeError: If database query fails
     """
+    cached = _alert_cache.get(alert_id)
+    if cached is not None:
+        return cached
+
     try:
         alerts_collection = db["alerts"]
         alert_doc = await alerts_collection.find_one({"alert_id": alert_id})
@@ -216,115 +687,112 @@ async def get_alert_by_id(alert_id: str, db: AsyncIOMotorDatabase) -> Optional[A
         if not alert_doc:
             return None
 
-        return AlertModel(**alert_doc)
+        alert = _alert_from_doc(alert_doc)
+        _alert_cache.set(alert_id, alert)
+        return alert
 
     except PyMongoError as e:
         raise RuntimeError(f"Database error retrieving alert: {str(e)}") from e
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error retrieving alert: {str(e)}") from e
 
 
-async def list_alerts(
+def _build_match_filter(filters: dict) -> Dict:
+    """
+    Build the alerts $match filter for list queries.
+
+    Args:
+        filters: Dictionary of filter criteria (status, source_type, severity,
+            driver_id, date_range)
+
+    Returns:
+        Dict: MongoDB filter document
+    """
+    match_filter: Dict = {}
+
+    # Status, source type, severity and driver ID filters
+    for key, field, coerce in _FILTER_SPECS:
+        value = filters.get(key)
+        if value:
+            match_filter[field] = coerce(value)
+
+    # Date range filter
+    if "date_range" in filters and filters["date_range"]:
+        date_range = filters["date_range"]
+        if isinstance(date_range, dict):
+            if "start_date" in date_range:
+                match_filter.setdefault("timestamp", {})["$gte"] = date_range["start_date"]
+            if "end_date" in date_range:
+                match_filter.setdefault("timestamp", {})["$lte"] = date_range["end_date"]
+
+    return match_filter
+
+
+def _count_alerts(
+    alerts_collection: AsyncIOMotorCollection, match_filter: Dict
+) -> Awaitable[int]:
+    """
+    Count alerts matching a list filter.
+
+    Args:
+        alerts_collection: Alerts collection
+        match_filter: Filter built by _build_match_filter
+
+    Returns:
+        Awaitable[int]: Count query; unfiltered totals come from collection metadata
+    """
+    if match_filter:
+        return alerts_collection.count_documents(match_filter)
+    return alerts_collection.estimated_document_count()
+
+
+@single_flight()
+async def list_alert_documents(
     filters: dict,
     skip: int,
     limit: int,
+    projection: Dict,
     db: AsyncIOMotorDatabase,
-) -> Tuple[List[AlertModel], int]:
+) -> Tuple[List[dict], int]:
     """
-    List alerts with filtering, sorting, and pagination.
+    List alerts as documents shaped by a projection, without building models.
 
     Supports filters: status, source_type, severity, driver_id, date_range.
+    Concurrent calls with the same filters and page share one query. The
+    projection runs on the server, so callers that serialize the documents
+    as they are skip model construction entirely, and can leave out the
+    state history; get_alert_by_id serves it in full.
 
     Args:
         filters: Dictionary of filter criteria
         skip: Number of documents to skip (for pagination)
         limit: Maximum number of documents to return
+        projection: $project stage specification applied to each alert
         db: MongoDB database instance
 
     Returns:
-        Tuple of (list of AlertModel, total count)
+        Tuple of (list of projected documents, total count)
 
     Raises:
         RuntimeError: If database query fails
     """
     try:
         alerts_collection = db["alerts"]
+        match_filter = _build_match_filter(filters)
 
-        # Build match filter
-        match_filter: Dict = {}
-
-        # Status filter
-        if "status" in filters and filters["status"]:
-            if isinstance(filters["status"], str):
-                match_filter["status"] = filters["status"]
-            elif isinstance(filters["status"], AlertStatus):
-                match_filter["status"] = filters["status"].value
-
-        # Source type filter
-        if "source_type" in filters and filters["source_type"]:
-            if isinstance(filters["source_type"], str):
-                match_filter["source_type"] = filters["source_type"]
-            elif isinstance(filters["source_type"], SourceType):
-                match_filter["source_type"] = filters["source_type"].value
-
-        # Severity filter
-        if "severity" in filters and filters["severity"]:
-            if isinstance(filters["severity"], str):
-                match_filter["severity"] = filters["severity"]
-            elif isinstance(filters["severity"], AlertSeverity):
-                match_filter["severity"] = filters["severity"].value
-
-        # Driver ID filter (from metadata)
-        if "driver_id" in filters and filters["driver_id"]:
-            match_filter["metadata.driver_id"] = filters["driver_id"]
-
-        # Date range filter
-        if "date_range" in filters and filters["date_range"]:
-            date_range = filters["date_range"]
-            if isinstance(date_range, dict):
-                if "start_date" in date_range:
-                    match_filter.setdefault("timestamp", {})["$gte"] = date_range["start_date"]
-                if "end_date" in date_range:
-                    match_filter.setdefault("timestamp", {})["$lte"] = date_range["end_date"]
-
-        # Build aggregation pipeline
         pipeline = [
-            {"$match": match_filter} if match_filter else {"$match": {}},
-            {"$sort": {"timestamp": -1}},  # Sort by timestamp descending
-            {
-                "$facet": {
-                    "data": [
-                        {"$skip": skip},
-                        {"$limit": limit},
-                    ],
-                    "total": [{"$count": "count"}],
-                }
-            },
+            {"$match": match_filter},
+            {"$sort": {"timestamp": -1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": projection},
         ]
-
-        # Execute aggregation
-        cursor = alerts_collection.aggregate(pipeline)
-        result = await cursor.to_list(length=1)
-        if not result:
-            return [], 0
-
-        aggregation_result = result[0]
-        alert_docs = aggregation_result.get("data", [])
-        total_count = (
-            aggregation_result.get("total", [{}])[0].get("count", 0)
-            if aggregation_result.get("total")
-            else 0
+        docs, total_count = await asyncio.gather(
+            alerts_collection.aggregate(pipeline).to_list(length=limit),
+            _count_alerts(alerts_collection, match_filter),
         )
-
-        # Convert to AlertModel list
-        alerts = [AlertModel(**doc) for doc in alert_docs]
-
-        return alerts, total_count
+        return docs, total_count
 
     except PyMongoError as e:
         raise RuntimeError(f"Database error listing alerts: {str(e)}") from e
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error listing alerts: {str(e)}") from e
 
 
 async def update_alert_status(
@@ -353,87 +821,39 @@ async def update_alert_status(
         AlertModel: Updated alert model
 
     Raises:
-        HTTPException: 400 if transition is invalid, 404 if alert not found
+        HTTPException: 400 if transition is invalid, 404 if alert not found,
+            409 if the alert changed status concurrently
         RuntimeError: If database update fails
     """
     try:
-        alerts_collection = db["alerts"]
-
-        # Get current alert
-        alert_doc = await alerts_collection.find_one({"alert_id": alert_id})
-        if not alert_doc:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Alert with ID {alert_id} not found",
-            )
+        now = _utcnow()
 
-        alert = AlertModel(**alert_doc)
-        current_status = alert.status
-
-        # Validate state transition
-        _validate_state_transition(current_status, new_status)
-
-        # Current timestamp
-        now = datetime.utcnow()
-
-        # Create state transition entry
-        transition = AlertStateTransition(
-            from_status=current_status,
-            to_status=new_status,
-            timestamp=now,
+        # Validate and apply the transition, getting the updated alert back
+        previous_alert_doc, updated_alert_doc = await _transition_alert(
+            alert_id=alert_id,
+            new_status=new_status,
+            set_fields=_status_set_fields(new_status, now, reason),
             reason=reason,
             triggered_by=triggered_by,
-            rule_triggered=rule_id,
+            rule_id=rule_id,
+            now=now,
+            db=db,
         )
-
-        # Build $set fields
-        set_fields: Dict = {
-            "status": new_status.value,
-            "updated_at": now,
-        }
-
-        # Update timestamps based on status
-        if new_status == AlertStatus.ESCALATED:
-            set_fields["escalated_at"] = now
-            set_fields["severity"] = AlertSeverity.CRITICAL.value
-        elif new_status == AlertStatus.AUTO_CLOSED:
-            set_fields["closed_at"] = now
-            if reason:
-                set_fields["auto_close_reason"] = reason
-        elif new_status == AlertStatus.RESOLVED:
-            set_fields["resolved_at"] = now
-
-        # Build update document
-        update_doc: Dict = {
-            "$set": set_fields,
-            "$push": {"state_history": _pydantic_to_dict(transition)},
-        }
-
-        # Update alert in database
-        result = await alerts_collection.update_one(
-            {"alert_id": alert_id},
-            update_doc,
+        await _apply_follow_up_writes(
+            record_alert_events(
+                [build_alert_event(updated_alert_doc, updated_alert_doc["state_history"][-1])],
+                db,
+            ),
+            apply_counter_delta(change_delta(previous_alert_doc, updated_alert_doc), db),
+            apply_trend_deltas(trend_change_deltas(previous_alert_doc, updated_alert_doc), db),
         )
 
-        if result.matched_count == 0:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Alert with ID {alert_id} not found",
-            )
-
-        # Fetch updated alert
-        updated_alert_doc = await alerts_collection.find_one({"alert_id": alert_id})
-        if not updated_alert_doc:
-            raise RuntimeError("Failed to retrieve updated alert")
-
-        return AlertModel(**updated_alert_doc)
+        alert = _alert_from_doc(updated_alert_doc)
+        _alert_cache.set(alert_id, alert)
+        return alert
 
-    except HTTPException:
-        raise
     except PyMongoError as e:
         raise RuntimeError(f"Database error updating alert status: {str(e)}") from e
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error updating alert status: {str(e)}") from e
 
 
 async def add_resolution(
@@ -458,72 +878,136 @@ async def add_resolution(
         AlertModel: Updated alert model
 
     Raises:
-        HTTPException: 400 if alert cannot be resolved, 404 if alert not found
+        HTTPException: 400 if alert cannot be resolved, 404 if alert not found,
+            409 if the alert changed status concurrently
         RuntimeError: If database update fails
     """
     try:
-        alerts_collection = db["alerts"]
+        # Current timestamp
+        now = _utcnow()
+        reason = f"Alert resolved by user {user_id}"
+
+        set_fields = _status_set_fields(AlertStatus.RESOLVED, now, reason)
+        set_fields["resolved_by"] = user_id
+        set_fields["resolution_notes"] = notes
+
+        # Validate and apply the transition to RESOLVED
+        previous_alert_doc, updated_alert_doc = await _transition_alert(
+            alert_id=alert_id,
+            new_status=AlertStatus.RESOLVED,
+            set_fields=set_fields,
+            reason=reason,
+            triggered_by=user_id,
+            rule_id=None,
+            now=now,
+            db=db,
+        )
+        await _apply_follow_up_writes(
+            record_alert_events(
+                [build_alert_event(updated_alert_doc, updated_alert_doc["state_history"][-1])],
+                db,
+            ),
+            apply_counter_delta(change_delta(previous_alert_doc, updated_alert_doc), db),
+            apply_trend_deltas(trend_change_deltas(previous_alert_doc, updated_alert_doc), db),
+        )
 
-        # Get current alert
-        alert_doc = await alerts_collection.find_one({"alert_id": alert_id})
-        if not alert_doc:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Alert with ID {alert_id} not found",
-            )
+        alert = _alert_from_doc(updated_alert_doc)
+        _alert_cache.set(alert_id, alert)
+        return alert
 
-        alert = AlertModel(**alert_doc)
-        current_status = alert.status
+    except PyMongoError as e:
+        raise RuntimeError(f"Database error adding resolution: {str(e)}") from e
 
-        # Validate state transition to RESOLVED
-        _validate_state_transition(current_status, AlertStatus.RESOLVED)
 
-        # Current timestamp
-        now = datetime.utcnow()
-
-        # Create state transition entry
-        transition = AlertStateTransition(
-            from_status=current_status,
-            to_status=AlertStatus.RESOLVED,
-            timestamp=now,
-            reason=f"Alert resolved by user {user_id}",
-            triggered_by=user_id,
-        )
+async def auto_close_alerts(
+    closures: List[Tuple[dict, str]],
+    db: AsyncIOMotorDatabase,
+) -> int:
+    """
+    Auto-close a batch of alerts with a single unordered bulk write.
 
-        # Update alert
-        update_doc = {
-            "$set": {
-                "status": AlertStatus.RESOLVED.value,
-                "resolved_by": user_id,
-                "resolved_at": now,
-                "resolution_notes": notes,
-                "updated_at": now,
-            },
-            "$push": {"state_history": _pydantic_to_dict(transition)},
-        }
+    Each update is guarded on the alert's current status, so an alert that
+    changed state since it was read is left untouched, and gets no event
+    or counter change.
 
-        result = await alerts_collection.update_one(
-            {"alert_id": alert_id},
-            update_doc,
-        )
+    Args:
+        closures: List of (alert document, reason) pairs; each document must
+            contain at least _id, alert_id, status and timestamp, plus
+            source_type, severity and metadata.driver_id for the event log
+        db: MongoDB database instance
+
+    Returns:
+        int: Number of alerts auto-closed
+
+    Raises:
+        RuntimeError: If the bulk write fails
+    """
+    if not closures:
+        return 0
 
-        if result.matched_count == 0:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Alert with ID {alert_id} not found",
+    try:
+        now = _utcnow()
+        updates = [
+            (
+                alert_doc,
+                _build_status_update(
+                    current_status=AlertStatus(alert_doc["status"]),
+                    new_status=AlertStatus.AUTO_CLOSED,
+                    now=now,
+                    reason=reason,
+                    triggered_by="system",
+                    rule_id=None,
+                ),
             )
+            for alert_doc, reason in closures
+        ]
+        operations = [
+            UpdateOne({"_id": alert_doc["_id"], "status": alert_doc["status"]}, update_doc)
+            for alert_doc, update_doc in updates
+        ]
 
-        # Fetch updated alert
-        updated_alert_doc = await alerts_collection.find_one({"alert_id": alert_id})
-        if not updated_alert_doc:
-            raise RuntimeError("Failed to retrieve updated alert")
+        alerts_collection = db["alerts"]
+        result = await alerts_collection.bulk_write(operations, ordered=False)
+        for alert_doc, _ in closures:
+            _alert_cache.pop(alert_doc.get("alert_id"))
+
+        if result.modified_count != len(operations):
+            # Some alerts changed state since they were read. The applied
+            # updates are the ones carrying this batch's closed_at
+            cursor = alerts_collection.find(
+                {
+                    "_id": {"$in": [alert_doc["_id"] for alert_doc, _ in updates]},
+                    "status": _STATUS_VALUES[AlertStatus.AUTO_CLOSED],
+                    "closed_at": now,
+                },
+                {"_id": 1},
+            )
+            closed_ids = {doc["_id"] for doc in await cursor.to_list(length=None)}
+            updates = [
+                (alert_doc, update_doc)
+                for alert_doc, update_doc in updates
+                if alert_doc["_id"] in closed_ids
+            ]
+
+        delta: Dict[str, int] = {}
+        trend_deltas: Dict[str, Dict[str, int]] = {}
+        for alert_doc, update_doc in updates:
+            for key, value in change_delta(alert_doc, update_doc["$set"]).items():
+                delta[key] = delta.get(key, 0) + value
+            for day, day_delta in trend_change_deltas(alert_doc, update_doc["$set"]).items():
+                day_total = trend_deltas.setdefault(day, {})
+                for key, value in day_delta.items():
+                    day_total[key] = day_total.get(key, 0) + value
+        await _apply_follow_up_writes(
+            record_alert_events(
+                [_status_update_event(alert_doc, update_doc) for alert_doc, update_doc in updates],
+                db,
+            ),
+            apply_counter_delta({key: value for key, value in delta.items() if value}, db),
+            apply_trend_deltas(trend_deltas, db),
+        )
 
-        return AlertModel(**updated_alert_doc)
+        return result.modified_count
 
-    except HTTPException:
-        raise
     except PyMongoError as e:
-        raise RuntimeError(f"Database error adding resolution: {str(e)}") from e
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error adding resolution: {str(e)}") from e
-
+        raise RuntimeError(f"Database error auto-closing alerts: {str(e)}") from e
@@ -0,0 +1,264 @@
+"""
+Alert summary counter service.
+
+Alert totals per severity and per status are kept in a single counters
+document that the alert service adjusts with $inc on every create and
+status change, so the dashboard summary is one find_one instead of a scan
+over every alert. The counters are rebuilt from the alerts collection
+periodically, which also corrects drift from TTL deletions and from
+counter writes that failed.
+
+The per-day counts behind the dashboard trends get the same $inc updates
+in the daily rollup collection, keyed by the day each alert was raised,
+so days outside the rollup refresh window stay exact as their alerts
+change state.
+
+Auto-closed alerts are deleted by a TTL index after their retention
+period. The global counters count stored alerts, so they drop those
+alerts at the next rebuild. The daily rollup deliberately keeps them:
+retention (30 days by default) is longer than the rollup refresh
+window, so deleted alerts belong to days that are no longer recomputed,
+and trends keep showing what was raised on each day.
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from src.database.models import AlertStatus
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+ALERT_COUNTERS_COLLECTION = "alert_counters"
+
+# _id of the document holding the counts over all alerts
+GLOBAL_COUNTERS_ID = "global"
+
+# Per-day alert counts for /trends, one document per "YYYY-MM-DD" _id
+DAILY_ROLLUP_COLLECTION = "alerts_daily_rollup"
+
+# Daily rollup field counting alerts per current status; other statuses
+# only count towards total_alerts
+_TREND_STATUS_FIELDS = {
+    AlertStatus.ESCALATED.value: "escalated",
+    AlertStatus.AUTO_CLOSED.value: "auto_closed",
+    AlertStatus.RESOLVED.value: "resolved",
+}
+
+# Counts of alerts by (status, severity), the basis of every counter
+_COUNTS_PIPELINE = [
+    {
+        "$group": {
+            "_id": {"status": "$status", "severity": "$severity"},
+            "count": {"$sum": 1},
+        }
+    }
+]
+
+
+def creation_delta(alert_docs: Iterable[dict]) -> Dict[str, int]:
+    """
+    Build the counter increments for newly created alerts.
+
+    Args:
+        alert_docs: Inserted alert documents
+
+    Returns:
+        Dict[str, int]: $inc document
+    """
+    delta: Counter = Counter()
+    for alert_doc in alert_docs:
+        delta["total"] += 1
+        delta[f"severity.{alert_doc['severity']}"] += 1
+        delta[f"status.{alert_doc['status']}"] += 1
+    return dict(delta)
+
+
+def change_delta(before: dict, after: dict) -> Dict[str, int]:
+    """
+    Build the counter increments for one alert's status/severity change.
+
+    Args:
+        before: Alert status and severity before the change
+        after: Alert fields after the change; a missing field is unchanged
+
+    Returns:
+        Dict[str, int]: $inc document, empty if nothing counted changed
+    """
+    delta: Counter = Counter()
+    for field in ("status", "severity"):
+        old_value = before[field]
+        new_value = after.get(field, old_value)
+        if old_value != new_value:
+            delta[f"{field}.{old_value}"] -= 1
+            delta[f"{field}.{new_value}"] += 1
+    return {key: value for key, value in delta.items() if value}
+
+
+async def apply_counter_delta(delta: Dict[str, int], db: AsyncIOMotorDatabase) -> None:
+    """
+    Apply increments to the global alert counters.
+
+    The alerts stay the source of truth and the counters are rebuilt
+    periodically, so a failed write is logged and does not fail the alert
+    operation that produced it.
+
+    Args:
+        delta: $inc document built with creation_delta or change_delta
+        db: MongoDB database instance
+    """
+    if not delta:
+        return
+
+    try:
+        await db[ALERT_COUNTERS_COLLECTION].update_one(
+            {"_id": GLOBAL_COUNTERS_ID}, {"$inc": delta}, upsert=True
+        )
+    except PyMongoError as e:
+        logger.warning(f"Failed to update alert counters: {str(e)}")
+
+
+def _trend_day(alert_doc: dict) -> str:
+    """Return the daily rollup _id of the day an alert was raised."""
+    return alert_doc["timestamp"].strftime("%Y-%m-%d")
+
+
+def trend_creation_deltas(alert_docs: Iterable[dict]) -> Dict[str, Dict[str, int]]:
+    """
+    Build the daily rollup increments for newly created alerts.
+
+    Args:
+        alert_docs: Inserted alert documents
+
+    Returns:
+        Dict[str, Dict[str, int]]: $inc document per day
+    """
+    deltas: Dict[str, Counter] = {}
+    for alert_doc in alert_docs:
+        delta = deltas.setdefault(_trend_day(alert_doc), Counter())
+        delta["total_alerts"] += 1
+        status_field = _TREND_STATUS_FIELDS.get(alert_doc["status"])
+        if status_field:
+            delta[status_field] += 1
+    return {day: dict(delta) for day, delta in deltas.items()}
+
+
+def trend_change_deltas(before: dict, after: dict) -> Dict[str, Dict[str, int]]:
+    """
+    Build the daily rollup increments for one alert's status change.
+
+    Args:
+        before: Alert status and timestamp before the change
+        after: Alert fields after the change; a missing status is unchanged
+
+    Returns:
+        Dict[str, Dict[str, int]]: $inc document per day, empty if nothing
+            counted changed
+    """
+    old_field = _TREND_STATUS_FIELDS.get(before["status"])
+    new_field = _TREND_STATUS_FIELDS.get(after.get("status", before["status"]))
+    if old_field == new_field:
+        return {}
+
+    delta: Dict[str, int] = {}
+    if old_field:
+        delta[old_field] = -1
+    if new_field:
+        delta[new_field] = 1
+    return {_trend_day(before): delta}
+
+
+async def apply_trend_deltas(
+    deltas: Dict[str, Dict[str, int]], db: AsyncIOMotorDatabase
+) -> None:
+    """
+    Apply increments to the daily rollup, one upsert per day.
+
+    Like the global counters, a failed write is logged and left for the
+    next rollup refresh.
+
+    Args:
+        deltas: $inc documents per day built with trend_creation_deltas or
+            trend_change_deltas
+        db: MongoDB database instance
+    """
+    operations = [
+        UpdateOne({"_id": day}, {"$inc": delta}, upsert=True)
+        for day, delta in deltas.items()
+        if delta
+    ]
+    if not operations:
+        return
+
+    try:
+        await db[DAILY_ROLLUP_COLLECTION].bulk_write(operations, ordered=False)
+    except PyMongoError as e:
+        logger.warning(f"Failed to update daily alert rollup: {str(e)}")
+
+
+async def rebuild_alert_counters(db: AsyncIOMotorDatabase) -> dict:
+    """
+    Recount every alert and replace the global counters document.
+
+    Increments applied between the count and the replace are lost until
+    the next rebuild; the counters are approximate between rebuilds.
+
+    Args:
+        db: MongoDB database instance
+
+    Returns:
+        dict: The new counters document
+
+    Raises:
+        RuntimeError: If the aggregation or the write fails
+    """
+    try:
+        cursor = db["alerts"].aggregate(_COUNTS_PIPELINE)
+        docs = await cursor.to_list(length=None)
+
+        total = 0
+        by_severity: Counter = Counter()
+        by_status: Counter = Counter()
+        for doc in docs:
+            total += doc["count"]
+            by_status[doc["_id"].get("status")] += doc["count"]
+            by_severity[doc["_id"].get("severity")] += doc["count"]
+
+        counters = {
+            "_id": GLOBAL_COUNTERS_ID,
+            "total": total,
+            "severity": {key: count for key, count in by_severity.items() if key},
+            "status": {key: count for key, count in by_status.items() if key},
+        }
+        await db[ALERT_COUNTERS_COLLECTION].replace_one(
+            {"_id": GLOBAL_COUNTERS_ID}, counters, upsert=True
+        )
+        return counters
+
+    except PyMongoError as e:
+        raise RuntimeError(f"Failed to rebuild alert counters: {str(e)}") from e
+
+
+async def get_alert_counters(db: AsyncIOMotorDatabase) -> Optional[dict]:
+    """
+    Read the global counters document.
+
+    Args:
+        db: MongoDB database instance
+
+    Returns:
+        dict if the counters exist, None otherwise
+
+    Raises:
+        RuntimeError: If the read fails
+    """
+    try:
+        return await db[ALERT_COUNTERS_COLLECTION].find_one({"_id": GLOBAL_COUNTERS_ID})
+    except PyMongoError as e:
+        raise RuntimeError(f"Failed to read alert counters: {str(e)}") from e
@@ -2,27 +2,39 @@
 Dashboard service for aggregating alert analytics and statistics.
 
 This module provides efficient MongoDB aggregation pipelines for dashboard data,
-including summaries, trends, top offenders, and activity feeds.
+including summaries, trends, top offenders, and activity feeds, plus a combined
+bundle query that returns every widget at once.
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Optional
 
+from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo.errors import PyMongoError
+from pymongo.errors import ExecutionTimeout, PyMongoError
 
 from src.database.models import (
     AlertModel,
     AlertSeverity,
     AlertStatus,
     AlertSummary,
+    DashboardBundle,
     RecentActivity,
     SourceType,
     TopOffender,
     TrendDataPoint,
 )
+from app.services.alert_service import docs_to_alerts
+from app.services.counter_service import (
+    DAILY_ROLLUP_COLLECTION,
+    get_alert_counters,
+    rebuild_alert_counters,
+)
+from app.services.event_service import ALERT_EVENTS_COLLECTION
+from app.utils.async_cache import async_ttl_cache, single_flight
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -31,6 +43,24 @@ logger.setLevel(logging.INFO)
 # Performance threshold for logging slow queries (in seconds)
 SLOW_QUERY_THRESHOLD = 1.0
 
+# Aggregate dashboard results are served from memory for this long, then
+# served stale for up to DASHBOARD_STALE_SECONDS while refreshed in background
+DASHBOARD_CACHE_SECONDS = 30
+DASHBOARD_STALE_SECONDS = 30
+
+# Server-side time limit for dashboard reads; queries that would run longer
+# or spill a sort/group to disk fail fast instead of holding a worker
+DASHBOARD_MAX_TIME_MS = 1500
+_READ_OPTIONS = {"maxTimeMS": DASHBOARD_MAX_TIME_MS, "allowDiskUse": False}
+
+# Documents per round trip when streaming activity feeds
+STREAM_BATCH_SIZE = 50
+
+# Days recomputed on each rollup refresh (DAILY_ROLLUP_COLLECTION, read for
+# days before today; today is always counted live). Status changes are also
+# applied to the rollup incrementally; the refresh corrects missed updates.
+ROLLUP_REFRESH_DAYS = 7
+
 
 def _log_query_performance(query_name: str, start_time: float) -> None:
     """Log query execution time if it exceeds threshold."""
@@ -44,97 +74,325 @@ def _log_query_performance(query_name: str, start_time: float) -> None:
         logger.debug(f"Query {query_name} completed in {execution_time:.2f}s")
 
 
+def _timeout_error(what: str) -> HTTPException:
+    """Build the 503 returned when a dashboard query exceeds DASHBOARD_MAX_TIME_MS."""
+    logger.warning(f"Dashboard query timed out: {what}")
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"Timed out getting {what}; try a smaller time window or limit",
+    )
+
+
+# ============================================================================
+# PIPELINE BUILDERS AND RESULT PARSERS
+# ============================================================================
+# Shared by the individual dashboard queries and the combined bundle query.
+
+# Map status transitions to action names
+_ACTION_MAP = {
+    AlertStatus.OPEN.value: "created",
+    AlertStatus.ESCALATED.value: "escalated",
+    AlertStatus.AUTO_CLOSED.value: "auto_closed",
+    AlertStatus.RESOLVED.value: "resolved",
+}
+
+# Enum members by stored value, for parsing activity rows without raising
+_SOURCE_TYPE_BY_VALUE: Dict[str, SourceType] = {member.value: member for member in SourceType}
+_SEVERITY_BY_VALUE: Dict[str, AlertSeverity] = {member.value: member for member in AlertSeverity}
+_STATUS_BY_VALUE: Dict[str, AlertStatus] = {member.value: member for member in AlertStatus}
+
+
+def _parse_summary(counters: dict) -> AlertSummary:
+    """Build AlertSummary from the global alert counters document."""
+    severity_counts = counters.get("severity") or {}
+    status_counts = counters.get("status") or {}
+
+    return AlertSummary(
+        total_alerts=counters.get("total", 0),
+        critical_count=severity_counts.get(AlertSeverity.CRITICAL.value, 0),
+        warning_count=severity_counts.get(AlertSeverity.WARNING.value, 0),
+        info_count=severity_counts.get(AlertSeverity.INFO.value, 0),
+        open_count=status_counts.get(AlertStatus.OPEN.value, 0),
+        escalated_count=status_counts.get(AlertStatus.ESCALATED.value, 0),
+        auto_closed_count=status_counts.get(AlertStatus.AUTO_CLOSED.value, 0),
+        resolved_count=status_counts.get(AlertStatus.RESOLVED.value, 0),
+    )
+
+
+async def _load_counters(db: AsyncIOMotorDatabase) -> dict:
+    """Read the global alert counters, building them on first use."""
+    counters = await get_alert_counters(db)
+    if counters is None:
+        counters = await rebuild_alert_counters(db)
+    return counters
+
+
+def _top_offenders_pipeline(limit: int) -> List[dict]:
+    """
+    Build the pipeline ranking drivers by escalated, then open alerts.
+
+    The adjacent $sort and $limit are coalesced by MongoDB into a top-K
+    sort, so memory is bounded by ``limit`` rather than the number of
+    drivers. Only status, driver_id and timestamp are read, which the
+    partial (status, metadata.driver_id, timestamp) index over open and
+    escalated alerts covers; the $match must keep implying its filter.
+    """
+    return [
+        # Match only active alerts
+        {
+            "$match": {
+                "status": {"$in": [AlertStatus.OPEN.value, AlertStatus.ESCALATED.value]},
+                "metadata.driver_id": {"$exists": True, "$ne": None}
+            }
+        },
+        # Group by driver_id (every matched alert is open or escalated,
+        # so the plain count is the total)
+        {
+            "$group": {
+                "_id": "$metadata.driver_id",
+                "open_alerts": {
+                    "$sum": {
+                        "$cond": [{"$eq": ["$status", AlertStatus.OPEN.value]}, 1, 0]
+                    }
+                },
+                "escalated_alerts": {
+                    "$sum": {
+                        "$cond": [{"$eq": ["$status", AlertStatus.ESCALATED.value]}, 1, 0]
+                    }
+                },
+                "total_alerts": {"$sum": 1},
+                "last_alert_time": {"$max": "$timestamp"}
+            }
+        },
+        # Sort by escalated first, then open (driver_id breaks ties)
+        {
+            "$sort": {
+                "escalated_alerts": -1,
+                "open_alerts": -1,
+                "_id": 1
+            }
+        },
+        # Limit results
+        {"$limit": limit}
+    ]
+
+
+def _parse_top_offenders(docs: List[dict]) -> List[TopOffender]:
+    """Build TopOffender entries from top offenders pipeline output."""
+    offenders = []
+    for doc in docs:
+        driver_id = doc["_id"]
+        if not driver_id:  # Filter out null driver_ids
+            continue
+
+        offenders.append(
+            TopOffender(
+                driver_id=driver_id,
+                driver_name=None,  # TODO: Join with drivers collection if available
+                open_alerts=doc.get("open_alerts", 0),
+                escalated_alerts=doc.get("escalated_alerts", 0),
+                total_alerts=doc.get("total_alerts", 0),
+                last_alert_time=doc.get("last_alert_time", datetime.utcnow())
+            )
+        )
+    return offenders
+
+
+def _recent_activities_pipeline(limit: int) -> List[dict]:
+    """
+    Build the alert_events pipeline returning the latest state transitions.
+
+    The $sort + $limit run first on the timestamp index, so only ``limit``
+    events are read.
+    """
+    return [
+        # Sort by timestamp descending
+        {"$sort": {"timestamp": -1}},
+        # Limit results
+        {"$limit": limit},
+        # Project required fields
+        {
+            "$project": {
+                "alert_id": 1,
+                "source_type": 1,
+                "severity": 1,
+                "status": "$to_status",
+                "driver_id": 1,
+                "timestamp": 1,
+                "to_status": 1,
+                "reason": 1
+            }
+        }
+    ]
+
+
+def _parse_recent_activities(docs: List[dict]) -> List[RecentActivity]:
+    """
+    Build RecentActivity entries from recent activities pipeline output.
+
+    Status and severity are the alert's values as of each transition.
+    """
+    activities = []
+    for doc in docs:
+        to_status = doc.get("to_status", "")
+        action = _ACTION_MAP.get(to_status, to_status.lower())
+
+        activities.append(
+            RecentActivity(
+                alert_id=doc.get("alert_id", ""),
+                # Unknown or missing enum values fall back to a default
+                source_type=_SOURCE_TYPE_BY_VALUE.get(
+                    doc.get("source_type"), SourceType.OVERSPEEDING
+                ),
+                severity=_SEVERITY_BY_VALUE.get(doc.get("severity"), AlertSeverity.INFO),
+                status=_STATUS_BY_VALUE.get(doc.get("status"), AlertStatus.OPEN),
+                driver_id=doc.get("driver_id"),
+                timestamp=doc.get("timestamp", datetime.utcnow()),
+                action=action,
+                reason=doc.get("reason")
+            )
+        )
+    return activities
+
+
+# Auto-closed alerts are returned without their state history, the bulk of
+# each document and not shown by the dashboard
+_AUTO_CLOSED_PROJECTION = {"state_history": 0}
+
+
+def _auto_closed_query(hours: int) -> dict:
+    """Build the filter for alerts auto-closed within the last ``hours`` hours."""
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    return {
+        "status": AlertStatus.AUTO_CLOSED.value,
+        "closed_at": {"$gte": cutoff_time}
+    }
+
+
+def _utc_midnight(days_ago: int = 0) -> datetime:
+    """Return UTC midnight ``days_ago`` days before today."""
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=days_ago)
+
+
+def _daily_counts_pipeline(start_date: Optional[datetime]) -> List[dict]:
+    """
+    Build the pipeline counting alerts per day from ``start_date`` onwards.
+
+    Output documents have the date string as _id, which is also the shape
+    stored in the daily rollup collection. With no start date every alert
+    is counted.
+    """
+    pipeline = []
+    if start_date is not None:
+        # Match alerts within date range
+        pipeline.append({"$match": {"timestamp": {"$gte": start_date}}})
+    pipeline.append(
+        # Group by date
+        {
+            "$group": {
+                "_id": {
+                    "$dateToString": {
+                        "format": "%Y-%m-%d",
+                        "date": "$timestamp"
+                    }
+                },
+                "total_alerts": {"$sum": 1},
+                "escalated": {
+                    "$sum": {
+                        "$cond": [{"$eq": ["$status", AlertStatus.ESCALATED.value]}, 1, 0]
+                    }
+                },
+                "auto_closed": {
+                    "$sum": {
+                        "$cond": [{"$eq": ["$status", AlertStatus.AUTO_CLOSED.value]}, 1, 0]
+                    }
+                },
+                "resolved": {
+                    "$sum": {
+                        "$cond": [{"$eq": ["$status", AlertStatus.RESOLVED.value]}, 1, 0]
+                    }
+                }
+            }
+        }
+    )
+    return pipeline
+
+
+async def _get_trend_docs(
+    days: int, today_docs: List[dict], db: AsyncIOMotorDatabase
+) -> List[dict]:
+    """
+    Combine rolled-up daily counts before today with today's live counts.
+
+    Args:
+        days: Number of days to look back
+        today_docs: Output of the daily counts pipeline started at today's midnight
+        db: MongoDB database instance
+
+    Returns:
+        List[dict]: Daily count documents sorted by date ascending
+    """
+    today = _utc_midnight()
+    start_day = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+    cursor = db[DAILY_ROLLUP_COLLECTION].find(
+        {"_id": {"$gte": start_day, "$lt": today.strftime("%Y-%m-%d")}}
+    ).sort("_id", 1).max_time_ms(DASHBOARD_MAX_TIME_MS)
+    past_docs = await cursor.to_list(length=None)
+    return past_docs + today_docs
+
+
+def _parse_trends(docs: List[dict]) -> List[TrendDataPoint]:
+    """Build TrendDataPoint entries from daily count documents."""
+    return [
+        TrendDataPoint(
+            date=doc["_id"],
+            total_alerts=doc.get("total_alerts", 0),
+            escalated=doc.get("escalated", 0),
+            auto_closed=doc.get("auto_closed", 0),
+            resolved=doc.get("resolved", 0)
+        )
+        for doc in docs
+    ]
+
+
+# Counts alerts per source type
+_SOURCE_DISTRIBUTION_PIPELINE: List[dict] = [
+    {
+        "$group": {
+            "_id": "$source_type",
+            "count": {"$sum": 1}
+        }
+    }
+]
+
+
+@async_ttl_cache(ttl=DASHBOARD_CACHE_SECONDS, stale_ttl=DASHBOARD_STALE_SECONDS)
 async def get_alert_summary(db: AsyncIOMotorDatabase) -> AlertSummary:
     """
-    Get overall alert statistics using efficient aggregation.
-    
-    Uses MongoDB $facet stage to get all counts in a single query for performance.
-    
+    Get overall alert statistics from the precomputed alert counters.
+
+    The counters are maintained incrementally by the alert service, so this
+    is a single document read instead of a scan over every alert.
+
     Args:
         db: MongoDB database instance
-        
+
     Returns:
         AlertSummary: Summary statistics with all counts
-        
+
     Raises:
-        RuntimeError: If aggregation fails
+        RuntimeError: If reading the counters fails
     """
     start_time = time.time()
-    
-    try:
-        alerts_collection = db["alerts"]
-        
-        # Use $facet to get all counts in one query
-        pipeline = [
-            {
-                "$facet": {
-                    "total": [{"$count": "count"}],
-                    "by_severity": [
-                        {
-                            "$group": {
-                                "_id": "$severity",
-                                "count": {"$sum": 1}
-                            }
-                        }
-                    ],
-                    "by_status": [
-                        {
-                            "$group": {
-                                "_id": "$status",
-                                "count": {"$sum": 1}
-                            }
-                        }
-                    ]
-                }
-            }
-        ]
-        
-        cursor = alerts_collection.aggregate(pipeline)
-        result = await cursor.to_list(length=1)
-        
-        if not result or not result[0]:
-            return AlertSummary()
-        
-        data = result[0]
-        
-        # Extract total count
-        total_alerts = data["total"][0]["count"] if data["total"] else 0
-        
-        # Extract severity counts
-        severity_counts = {item["_id"]: item["count"] for item in data["by_severity"]}
-        critical_count = severity_counts.get(AlertSeverity.CRITICAL.value, 0)
-        warning_count = severity_counts.get(AlertSeverity.WARNING.value, 0)
-        info_count = severity_counts.get(AlertSeverity.INFO.value, 0)
-        
-        # Extract status counts
-        status_counts = {item["_id"]: item["count"] for item in data["by_status"]}
-        open_count = status_counts.get(AlertStatus.OPEN.value, 0)
-        escalated_count = status_counts.get(AlertStatus.ESCALATED.value, 0)
-        auto_closed_count = status_counts.get(AlertStatus.AUTO_CLOSED.value, 0)
-        resolved_count = status_counts.get(AlertStatus.RESOLVED.value, 0)
-        
-        summary = AlertSummary(
-            total_alerts=total_alerts,
-            critical_count=critical_count,
-            warning_count=warning_count,
-            info_count=info_count,
-            open_count=open_count,
-            escalated_count=escalated_count,
-            auto_closed_count=auto_closed_count,
-            resolved_count=resolved_count,
-        )
-        
-        _log_query_performance("get_alert_summary", start_time)
-        return summary
-        
-    except PyMongoError as e:
-        logger.error(f"Database error getting alert summary: {str(e)}")
-        raise RuntimeError(f"Failed to get alert summary: {str(e)}") from e
-    except Exception as e:
-        logger.error(f"Unexpected error getting alert summary: {str(e)}")
-        raise RuntimeError(f"Failed to get alert summary: {str(e)}") from e
 
+    summary = _parse_summary(await _load_counters(db))
+
+    _log_query_performance("get_alert_summary", start_time)
+    return summary
 
+
+@async_ttl_cache(ttl=DASHBOARD_CACHE_SECONDS, stale_ttl=DASHBOARD_STALE_SECONDS)
 async def get_top_offenders(
     limit: int, db: AsyncIOMotorDatabase
 ) -> List[TopOffender]:
@@ -159,73 +417,19 @@ async def get_top_offenders(
     try:
         alerts_collection = db["alerts"]
         
-        pipeline = [
-            # Match only active alerts
-            {
-                "$match": {
-                    "status": {"$in": [AlertStatus.OPEN.value, AlertStatus.ESCALATED.value]},
-                    "metadata.driver_id": {"$exists": True, "$ne": None}
-                }
-            },
-            # Group by driver_id
-            {
-                "$group": {
-                    "_id": "$metadata.driver_id",
-                    "open_alerts": {
-                        "$sum": {
-                            "$cond": [{"$eq": ["$status", AlertStatus.OPEN.value]}, 1, 0]
-                        }
-                    },
-                    "escalated_alerts": {
-                        "$sum": {
-                            "$cond": [{"$eq": ["$status", AlertStatus.ESCALATED.value]}, 1, 0]
-                        }
-                    },
-                    "total_alerts": {"$sum": 1},
-                    "last_alert_time": {"$max": "$timestamp"}
-                }
-            },
-            # Calculate total alerts
-            {
-                "$addFields": {
-                    "total_alerts": {
-                        "$add": ["$open_alerts", "$escalated_alerts"]
-                    }
-                }
-            },
-            # Sort by escalated first, then open
-            {
-                "$sort": {
-                    "escalated_alerts": -1,
-                    "open_alerts": -1
-                }
-            },
-            # Limit results
-            {"$limit": limit}
-        ]
+        pipeline = _top_offenders_pipeline(limit)
         
-        cursor = alerts_collection.aggregate(pipeline)
+        # The top-K sort fits in memory, never spill to disk
+        cursor = alerts_collection.aggregate(pipeline, **_READ_OPTIONS)
         results = await cursor.to_list(length=limit)
         
-        offenders = []
-        for doc in results:
-            driver_id = doc["_id"]
-            if not driver_id:  # Filter out null driver_ids
-                continue
-                
-            offender = TopOffender(
-                driver_id=driver_id,
-                driver_name=None,  # TODO: Join with drivers collection if available
-                open_alerts=doc.get("open_alerts", 0),
-                escalated_alerts=doc.get("escalated_alerts", 0),
-                total_alerts=doc.get("total_alerts", 0),
-                last_alert_time=doc.get("last_alert_time", datetime.utcnow())
-            )
-            offenders.append(offender)
+        offenders = _parse_top_offenders(results)
         
         _log_query_performance("get_top_offenders", start_time)
         return offenders
         
+    except ExecutionTimeout as e:
+        raise _timeout_error("top offenders") from e
     except PyMongoError as e:
         logger.error(f"Database error getting top offenders: {str(e)}")
         raise RuntimeError(f"Failed to get top offenders: {str(e)}") from e
@@ -234,14 +438,15 @@ async def get_top_offenders(
         raise RuntimeError(f"Failed to get top offenders: {str(e)}") from e
 
 
+@single_flight()
 async def get_recent_activities(
     limit: int, db: AsyncIOMotorDatabase
 ) -> List[RecentActivity]:
     """
     Get recent alert state transitions.
     
-    Unwinds the state_history array and returns the most recent transitions
-    across all alerts.
+    Reads the most recent transitions across all alerts from the alert
+    event log.
     
     Args:
         limit: Maximum number of activities to return
@@ -256,89 +461,20 @@ async def get_recent_activities(
     start_time = time.time()
     
     try:
-        alerts_collection = db["alerts"]
-        
-        # Map status transitions to action names
-        def map_action(to_status: str) -> str:
-            """Map status to action name."""
-            status_map = {
-                AlertStatus.OPEN.value: "created",
-                AlertStatus.ESCALATED.value: "escalated",
-                AlertStatus.AUTO_CLOSED.value: "auto_closed",
-                AlertStatus.RESOLVED.value: "resolved",
-            }
-            return status_map.get(to_status, to_status.lower())
+        events_collection = db[ALERT_EVENTS_COLLECTION]
         
-        pipeline = [
-            # Match alerts with state history
-            {
-                "$match": {
-                    "state_history": {"$exists": True, "$ne": []}
-                }
-            },
-            # Unwind state_history array
-            {"$unwind": "$state_history"},
-            # Project required fields
-            {
-                "$project": {
-                    "alert_id": 1,
-                    "source_type": 1,
-                    "severity": 1,
-                    "status": 1,
-                    "driver_id": "$metadata.driver_id",
-                    "timestamp": "$state_history.timestamp",
-                    "to_status": "$state_history.to_status",
-                    "reason": "$state_history.reason"
-                }
-            },
-            # Sort by timestamp descending
-            {"$sort": {"timestamp": -1}},
-            # Limit results
-            {"$limit": limit}
-        ]
+        pipeline = _recent_activities_pipeline(limit)
         
-        cursor = alerts_collection.aggregate(pipeline)
+        cursor = events_collection.aggregate(pipeline, **_READ_OPTIONS)
         results = await cursor.to_list(length=limit)
         
-        activities = []
-        for doc in results:
-            to_status = doc.get("to_status", "")
-            action = map_action(to_status)
-            
-            # Parse enums safely
-            source_type_str = doc.get("source_type", "")
-            try:
-                source_type = SourceType(source_type_str)
-            except ValueError:
-                source_type = SourceType.OVERSPEEDING  # Default fallback
-            
-            severity_str = doc.get("severity", AlertSeverity.INFO.value)
-            try:
-                severity = AlertSeverity(severity_str)
-            except ValueError:
-                severity = AlertSeverity.INFO  # Default fallback
-            
-            status_str = doc.get("status", AlertStatus.OPEN.value)
-            try:
-                status = AlertStatus(status_str)
-            except ValueError:
-                status = AlertStatus.OPEN  # Default fallback
-            
-            activity = RecentActivity(
-                alert_id=doc.get("alert_id", ""),
-                source_type=source_type,
-                severity=severity,
-                status=status,
-                driver_id=doc.get("driver_id"),
-                timestamp=doc.get("timestamp", datetime.utcnow()),
-                action=action,
-                reason=doc.get("reason")
-            )
-            activities.append(activity)
+        activities = _parse_recent_activities(results)
         
         _log_query_performance("get_recent_activities", start_time)
         return activities
         
+    except ExecutionTimeout as e:
+        raise _timeout_error("recent activities") from e
     except PyMongoError as e:
         logger.error(f"Database error getting recent activities: {str(e)}")
         raise RuntimeError(f"Failed to get recent activities: {str(e)}") from e
@@ -347,6 +483,45 @@ async def get_recent_activities(
         raise RuntimeError(f"Failed to get recent activities: {str(e)}") from e
 
 
+async def iter_recent_activities(
+    limit: int, db: AsyncIOMotorDatabase
+) -> AsyncIterator[RecentActivity]:
+    """
+    Stream recent alert state transitions as they arrive from MongoDB.
+    
+    Same results as get_recent_activities, fetched in batches of
+    STREAM_BATCH_SIZE so the first entries can be sent before the rest
+    are read.
+    
+    Args:
+        limit: Maximum number of activities to return
+        db: MongoDB database instance
+        
+    Yields:
+        RecentActivity: Next state transition, most recent first
+        
+    Raises:
+        RuntimeError: If aggregation fails
+    """
+    start_time = time.time()
+    
+    try:
+        cursor = db[ALERT_EVENTS_COLLECTION].aggregate(
+            _recent_activities_pipeline(limit), batchSize=STREAM_BATCH_SIZE, **_READ_OPTIONS
+        )
+        async for doc in cursor:
+            yield _parse_recent_activities([doc])[0]
+        
+        _log_query_performance("iter_recent_activities", start_time)
+        
+    except ExecutionTimeout as e:
+        raise _timeout_error("recent activities") from e
+    except PyMongoError as e:
+        logger.error(f"Database error streaming recent activities: {str(e)}")
+        raise RuntimeError(f"Failed to stream recent activities: {str(e)}") from e
+
+
+@single_flight()
 async def get_auto_closed_alerts(
     hours: int, db: AsyncIOMotorDatabase
 ) -> List[AlertModel]:
@@ -354,6 +529,8 @@ async def get_auto_closed_alerts(
     Get recently auto-closed alerts.
     
     Queries alerts that were auto-closed within the specified time window.
+    State history is not read (it is returned empty) and the stored
+    documents are not revalidated.
     
     Args:
         hours: Number of hours to look back
@@ -370,24 +547,24 @@ async def get_auto_closed_alerts(
     try:
         alerts_collection = db["alerts"]
         
-        # Calculate cutoff time
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        
-        # Query auto-closed alerts
-        query = {
-            "status": AlertStatus.AUTO_CLOSED.value,
-            "closed_at": {"$gte": cutoff_time}
-        }
+        # Query auto-closed alerts within the window
+        query = _auto_closed_query(hours)
         
         # Sort by closed_at descending
-        cursor = alerts_collection.find(query).sort("closed_at", -1)
+        cursor = (
+            alerts_collection.find(query, _AUTO_CLOSED_PROJECTION)
+            .sort("closed_at", -1)
+            .max_time_ms(DASHBOARD_MAX_TIME_MS)
+        )
         results = await cursor.to_list(length=None)
         
-        alerts = [AlertModel(**doc) for doc in results]
+        alerts = docs_to_alerts(results)
         
         _log_query_performance("get_auto_closed_alerts", start_time)
         return alerts
         
+    except ExecutionTimeout as e:
+        raise _timeout_error("auto-closed alerts") from e
     except PyMongoError as e:
         logger.error(f"Database error getting auto-closed alerts: {str(e)}")
         raise RuntimeError(f"Failed to get auto-closed alerts: {str(e)}") from e
@@ -396,13 +573,57 @@ async def get_auto_closed_alerts(
         raise RuntimeError(f"Failed to get auto-closed alerts: {str(e)}") from e
 
 
+async def iter_auto_closed_alerts(
+    hours: int, db: AsyncIOMotorDatabase
+) -> AsyncIterator[AlertModel]:
+    """
+    Stream recently auto-closed alerts as they arrive from MongoDB.
+    
+    Same results as get_auto_closed_alerts, fetched in batches of
+    STREAM_BATCH_SIZE instead of buffering the whole window.
+    
+    Args:
+        hours: Number of hours to look back
+        db: MongoDB database instance
+        
+    Yields:
+        AlertModel: Next auto-closed alert, most recently closed first
+        
+    Raises:
+        RuntimeError: If query fails
+    """
+    start_time = time.time()
+    
+    try:
+        cursor = (
+            db["alerts"]
+            .find(_auto_closed_query(hours), _AUTO_CLOSED_PROJECTION)
+            .sort("closed_at", -1)
+            .batch_size(STREAM_BATCH_SIZE)
+            .max_time_ms(DASHBOARD_MAX_TIME_MS)
+        )
+        async for doc in cursor:
+            yield docs_to_alerts([doc])[0]
+        
+        _log_query_performance("iter_auto_closed_alerts", start_time)
+        
+    except ExecutionTimeout as e:
+        raise _timeout_error("auto-closed alerts") from e
+    except PyMongoError as e:
+        logger.error(f"Database error streaming auto-closed alerts: {str(e)}")
+        raise RuntimeError(f"Failed to stream auto-closed alerts: {str(e)}") from e
+
+
+@async_ttl_cache(ttl=DASHBOARD_CACHE_SECONDS, stale_ttl=DASHBOARD_STALE_SECONDS)
 async def get_trend_data(
     days: int, db: AsyncIOMotorDatabase
 ) -> List[TrendDataPoint]:
     """
     Get daily alert trends.
     
-    Aggregates alerts by date and counts total, escalated, auto-closed, and resolved.
+    Counts total, escalated, auto-closed, and resolved alerts per day. Past
+    days come from the daily rollup collection (see refresh_daily_rollup);
+    only today is aggregated from raw alerts.
     
     Args:
         days: Number of days to look back
@@ -419,64 +640,20 @@ async def get_trend_data(
     try:
         alerts_collection = db["alerts"]
         
-        # Calculate date range
-        start_date = datetime.utcnow() - timedelta(days=days)
-        
-        pipeline = [
-            # Match alerts within date range
-            {
-                "$match": {
-                    "timestamp": {"$gte": start_date}
-                }
-            },
-            # Group by date
-            {
-                "$group": {
-                    "_id": {
-                        "$dateToString": {
-                            "format": "%Y-%m-%d",
-                            "date": "$timestamp"
-                        }
-                    },
-                    "total_alerts": {"$sum": 1},
-                    "escalated": {
-                        "$sum": {
-                            "$cond": [{"$eq": ["$status", AlertStatus.ESCALATED.value]}, 1, 0]
-                        }
-                    },
-                    "auto_closed": {
-                        "$sum": {
-                            "$cond": [{"$eq": ["$status", AlertStatus.AUTO_CLOSED.value]}, 1, 0]
-                        }
-                    },
-                    "resolved": {
-                        "$sum": {
-                            "$cond": [{"$eq": ["$status", AlertStatus.RESOLVED.value]}, 1, 0]
-                        }
-                    }
-                }
-            },
-            # Sort by date ascending
-            {"$sort": {"_id": 1}}
-        ]
-        
-        cursor = alerts_collection.aggregate(pipeline)
-        results = await cursor.to_list(length=None)
+        # Only today is aggregated from raw alerts
+        cursor = alerts_collection.aggregate(
+            _daily_counts_pipeline(_utc_midnight()), **_READ_OPTIONS
+        )
+        today_docs = await cursor.to_list(length=None)
+        results = await _get_trend_docs(days, today_docs, db)
         
-        trend_points = []
-        for doc in results:
-            trend_point = TrendDataPoint(
-                date=doc["_id"],
-                total_alerts=doc.get("total_alerts", 0),
-                escalated=doc.get("escalated", 0),
-                auto_closed=doc.get("auto_closed", 0),
-                resolved=doc.get("resolved", 0)
-            )
-            trend_points.append(trend_point)
+        trend_points = _parse_trends(results)
         
         _log_query_performance("get_trend_data", start_time)
         return trend_points
         
+    except ExecutionTimeout as e:
+        raise _timeout_error("trend data") from e
     except PyMongoError as e:
         logger.error(f"Database error getting trend data: {str(e)}")
         raise RuntimeError(f"Failed to get trend data: {str(e)}") from e
@@ -485,6 +662,7 @@ async def get_trend_data(
         raise RuntimeError(f"Failed to get trend data: {str(e)}") from e
 
 
+@async_ttl_cache(ttl=DASHBOARD_CACHE_SECONDS, stale_ttl=DASHBOARD_STALE_SECONDS)
 async def get_source_distribution(
     db: AsyncIOMotorDatabase
 ) -> Dict[str, int]:
@@ -507,16 +685,7 @@ async def get_source_distribution(
     try:
         alerts_collection = db["alerts"]
         
-        pipeline = [
-            {
-                "$group": {
-                    "_id": "$source_type",
-                    "count": {"$sum": 1}
-                }
-            }
-        ]
-        
-        cursor = alerts_collection.aggregate(pipeline)
+        cursor = alerts_collection.aggregate(_SOURCE_DISTRIBUTION_PIPELINE, **_READ_OPTIONS)
         results = await cursor.to_list(length=None)
         
         distribution = {doc["_id"]: doc["count"] for doc in results}
@@ -524,6 +693,8 @@ async def get_source_distribution(
         _log_query_performance("get_source_distribution", start_time)
         return distribution
         
+    except ExecutionTimeout as e:
+        raise _timeout_error("source distribution") from e
     except PyMongoError as e:
         logger.error(f"Database error getting source distribution: {str(e)}")
         raise RuntimeError(f"Failed to get source distribution: {str(e)}") from e
@@ -531,3 +702,137 @@ async def get_source_distribution(
         logger.error(f"Unexpected error getting source distribution: {str(e)}")
         raise RuntimeError(f"Failed to get source distribution: {str(e)}") from e
 
+
+@async_ttl_cache(ttl=DASHBOARD_CACHE_SECONDS, stale_ttl=DASHBOARD_STALE_SECONDS)
+async def get_dashboard_bundle(
+    offenders_limit: int,
+    activities_limit: int,
+    auto_closed_hours: int,
+    trend_days: int,
+    db: AsyncIOMotorDatabase,
+) -> DashboardBundle:
+    """
+    Get all dashboard widgets with one concurrent round of queries.
+
+    Every widget runs as its own query, so each can use its index: the
+    partial index for top offenders, closed_at for the auto-closed window
+    and timestamp for today's trend counts. Only the source distribution
+    covers all alerts. The summary comes from the alert counters and
+    recent activities from the alert event log; trends for days before
+    today come from the daily rollup collection.
+
+    Args:
+        offenders_limit: Maximum number of top offenders to return
+        activities_limit: Maximum number of recent activities to return
+        auto_closed_hours: Number of hours to look back for auto-closed alerts
+        trend_days: Number of days of trend data to return
+        db: MongoDB database instance
+
+    Returns:
+        DashboardBundle: Data for every dashboard widget
+
+    Raises:
+        RuntimeError: If aggregation fails
+    """
+    start_time = time.time()
+
+    try:
+        alerts_collection = db["alerts"]
+
+        (
+            offender_docs,
+            auto_closed_docs,
+            today_docs,
+            source_docs,
+            activity_docs,
+            counters,
+        ) = await asyncio.gather(
+            alerts_collection.aggregate(
+                _top_offenders_pipeline(offenders_limit), **_READ_OPTIONS
+            ).to_list(length=offenders_limit),
+            alerts_collection.find(
+                _auto_closed_query(auto_closed_hours), _AUTO_CLOSED_PROJECTION
+            )
+            .sort("closed_at", -1)
+            .max_time_ms(DASHBOARD_MAX_TIME_MS)
+            .to_list(length=None),
+            alerts_collection.aggregate(
+                _daily_counts_pipeline(_utc_midnight()), **_READ_OPTIONS
+            ).to_list(length=None),
+            alerts_collection.aggregate(
+                _SOURCE_DISTRIBUTION_PIPELINE, **_READ_OPTIONS
+            ).to_list(length=None),
+            db[ALERT_EVENTS_COLLECTION]
+            .aggregate(_recent_activities_pipeline(activities_limit), **_READ_OPTIONS)
+            .to_list(length=activities_limit),
+            _load_counters(db),
+        )
+        trend_docs = await _get_trend_docs(trend_days, today_docs, db)
+
+        bundle = DashboardBundle(
+            summary=_parse_summary(counters),
+            top_offenders=_parse_top_offenders(offender_docs),
+            recent_activities=_parse_recent_activities(activity_docs),
+            auto_closed=docs_to_alerts(auto_closed_docs),
+            trends=_parse_trends(trend_docs),
+            source_distribution={doc["_id"]: doc["count"] for doc in source_docs},
+        )
+
+        _log_query_performance("get_dashboard_bundle", start_time)
+        return bundle
+
+    except ExecutionTimeout as e:
+        raise _timeout_error("dashboard bundle") from e
+    except PyMongoError as e:
+        logger.error(f"Database error getting dashboard bundle: {str(e)}")
+        raise RuntimeError(f"Failed to get dashboard bundle: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error getting dashboard bundle: {str(e)}")
+        raise RuntimeError(f"Failed to get dashboard bundle: {str(e)}") from e
+
+
+# ============================================================================
+# DAILY ROLLUP
+# ============================================================================
+
+
+async def refresh_daily_rollup(
+    db: AsyncIOMotorDatabase, days: Optional[int] = ROLLUP_REFRESH_DAYS
+) -> None:
+    """
+    Recompute per-day alert counts into the daily rollup collection.
+
+    Counts for every day from ``days - 1`` days ago through today are
+    recomputed from raw alerts and written with $merge, replacing the
+    previous values for those days.
+
+    Args:
+        db: MongoDB database instance
+        days: Number of most recent days to recompute, or None to rebuild every day
+
+    Raises:
+        RuntimeError: If the aggregation fails
+    """
+    start_time = time.time()
+
+    try:
+        start_date = _utc_midnight(days - 1) if days is not None else None
+        pipeline = _daily_counts_pipeline(start_date) + [
+            {
+                "$merge": {
+                    "into": DAILY_ROLLUP_COLLECTION,
+                    "on": "_id",
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert",
+                }
+            }
+        ]
+
+        cursor = db["alerts"].aggregate(pipeline)
+        await cursor.to_list(length=None)
+
+        _log_query_performance("refresh_daily_rollup", start_time)
+
+    except PyMongoError as e:
+        logger.error(f"Database error refreshing daily rollup: {str(e)}")
+        raise RuntimeError(f"Failed to refresh daily rollup: {str(e)}") from e
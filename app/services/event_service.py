@@ -0,0 +1,137 @@
+"""
+Alert event log service.
+
+Every alert state transition is also appended to the alert_events
+collection, one document per transition, so the dashboard activity feed
+reads the newest events from an index instead of unwinding the
+state_history of every alert.
+
+Events are written after the alert itself and a failed insert is only
+logged, so the feed can miss a transition until the next backfill copies
+it from the alert's state history (hourly, for recent transitions).
+"""
+
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+ALERT_EVENTS_COLLECTION = "alert_events"
+
+
+def build_alert_event(
+    alert_doc: dict, transition: dict, severity: Optional[str] = None
+) -> dict:
+    """
+    Build the event document for one alert state transition.
+
+    Args:
+        alert_doc: Alert document; needs alert_id, source_type, severity and
+            metadata.driver_id
+        transition: State history entry pushed for the transition
+        severity: Alert severity after the transition, if the transition changed it
+
+    Returns:
+        dict: Event document
+    """
+    return {
+        "alert_id": alert_doc.get("alert_id"),
+        "source_type": alert_doc.get("source_type"),
+        "severity": severity or alert_doc.get("severity"),
+        "driver_id": (alert_doc.get("metadata") or {}).get("driver_id"),
+        "from_status": transition["from_status"],
+        "to_status": transition["to_status"],
+        "timestamp": transition["timestamp"],
+        "reason": transition.get("reason"),
+        "triggered_by": transition.get("triggered_by"),
+    }
+
+
+async def record_alert_events(events: List[dict], db: AsyncIOMotorDatabase) -> None:
+    """
+    Append events to the alert event log.
+
+    The alert document stays the source of truth, so a failed write is
+    logged and does not fail the transition that produced it.
+
+    Args:
+        events: Event documents built with build_alert_event
+        db: MongoDB database instance
+    """
+    if not events:
+        return
+
+    try:
+        await db[ALERT_EVENTS_COLLECTION].insert_many(events, ordered=False)
+    except PyMongoError as e:
+        logger.warning(f"Failed to record {len(events)} alert event(s): {str(e)}")
+
+
+async def backfill_alert_events(
+    db: AsyncIOMotorDatabase, since: Optional[datetime] = None
+) -> None:
+    """
+    Copy alert state history into the alert event log.
+
+    Idempotent: events are matched on (alert_id, timestamp, to_status),
+    which is unique-indexed, and existing events are kept as they are.
+
+    Args:
+        db: MongoDB database instance
+        since: Only copy transitions from this time on, read from alerts
+            created or updated since then; None copies every transition
+
+    Raises:
+        RuntimeError: If the aggregation fails
+    """
+    pipeline: List[dict] = []
+    if since is not None:
+        pipeline.append(
+            {
+                "$match": {
+                    "$or": [
+                        {"timestamp": {"$gte": since}},
+                        {"updated_at": {"$gte": since}},
+                    ]
+                }
+            }
+        )
+    pipeline.append({"$unwind": "$state_history"})
+    if since is not None:
+        pipeline.append({"$match": {"state_history.timestamp": {"$gte": since}}})
+    pipeline += [
+        {
+            "$project": {
+                "_id": 0,
+                "alert_id": 1,
+                "source_type": 1,
+                "severity": 1,
+                "driver_id": "$metadata.driver_id",
+                "from_status": "$state_history.from_status",
+                "to_status": "$state_history.to_status",
+                "timestamp": "$state_history.timestamp",
+                "reason": "$state_history.reason",
+                "triggered_by": "$state_history.triggered_by",
+            }
+        },
+        {
+            "$merge": {
+                "into": ALERT_EVENTS_COLLECTION,
+                "on": ["alert_id", "timestamp", "to_status"],
+                "whenMatched": "keepExisting",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
+
+    try:
+        cursor = db["alerts"].aggregate(pipeline)
+        await cursor.to_list(length=None)
+    except PyMongoError as e:
+        raise RuntimeError(f"Failed to backfill alert events: {str(e)}") from e
@@ -1,5 +1,6 @@
 """Rule engine for evaluating rules and triggering escalations/auto-closures."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
@@ -8,8 +9,8 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo.errors import PyMongoError
 
 from src.database.models import AlertModel, AlertStatus, SourceType
-from app.services.alert_service import update_alert_status
-from app.services.rule_service import get_active_rules_for_source
+from app.services.alert_service import auto_close_alerts, update_alert_status
+from app.services.rule_service import get_active_rules_for_source, get_all_active_rules
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -323,8 +324,9 @@ async def evaluate_all_pending_alerts(
     """
     Evaluate all pending alerts for auto-closure conditions.
 
-    Queries all alerts with status OPEN or ESCALATED, checks auto-close
-    conditions, and applies auto-close if needed.
+    Pushes the auto-close conditions (rule-based "document_valid" and
+    expiration) down to MongoDB so only closable alerts are returned, then
+    closes them all with a single bulk write.
 
     Args:
         db: MongoDB database instance
@@ -335,41 +337,68 @@ async def evaluate_all_pending_alerts(
     try:
         alerts_collection = db["alerts"]
 
-        # Query all pending alerts
-        query = {
+        # Map source types with a "document_valid" auto-close rule to the
+        # highest-priority such rule (rules are sorted by priority descending)
+        rules_by_source = await get_all_active_rules(db)
+        document_valid_rules: Dict[str, str] = {}
+        for source_type, rules in rules_by_source.items():
+            for rule in rules:
+                if rule.conditions.auto_close_if == "document_valid":
+                    document_valid_rules[source_type.value] = rule.rule_id
+                    break
+
+        now = datetime.utcnow()
+        pending_query = {
             "status": {"$in": [AlertStatus.OPEN.value, AlertStatus.ESCALATED.value]}
         }
 
-        cursor = alerts_collection.find(query)
-        alert_docs = await cursor.to_list(length=None)
+        # Closable alerts: expired, or document renewed for a matching rule
+        closable_conditions = [{"expires_at": {"$lte": now}}]
+        if document_valid_rules:
+            closable_conditions.append(
+                {
+                    "source_type": {"$in": list(document_valid_rules)},
+                    "metadata.document_valid": True,
+                }
+            )
 
-        total_checked = len(alert_docs)
-        auto_closed = 0
+        pipeline = [
+            {"$match": {**pending_query, "$or": closable_conditions}},
+            {
+                "$project": {
+                    "alert_id": 1,
+                    "status": 1,
+                    "source_type": 1,
+                    "severity": 1,
+                    "timestamp": 1,
+                    "expires_at": 1,
+                    "metadata.document_valid": 1,
+                    "metadata.driver_id": 1,
+                }
+            },
+        ]
+
+        total_checked, candidates = await asyncio.gather(
+            alerts_collection.count_documents(pending_query),
+            alerts_collection.aggregate(pipeline).to_list(length=None),
+        )
 
-        logger.info(f"Evaluating {total_checked} pending alerts for auto-close conditions")
+        logger.info(
+            f"Evaluating {total_checked} pending alerts: "
+            f"{len(candidates)} eligible for auto-close"
+        )
 
-        # Process each alert
-        for alert_doc in alert_docs:
-            try:
-                alert = AlertModel(**alert_doc)
+        # Rule-based conditions take precedence over expiration
+        closures = []
+        for alert_doc in candidates:
+            rule_id = document_valid_rules.get(alert_doc.get("source_type"))
+            if rule_id and alert_doc.get("metadata", {}).get("document_valid") is True:
+                reason = f"Document renewed (rule: {rule_id})"
+            else:
+                reason = f"Time window expired (expired at: {alert_doc.get('expires_at')})"
+            closures.append((alert_doc, reason))
 
-                # Check auto-close conditions
-                should_close, reason = await check_auto_close_conditions(alert, db)
-
-                if should_close and reason:
-                    # Apply auto-close
-                    await apply_auto_close(alert.alert_id, reason, db)
-                    auto_closed += 1
-                    logger.info(
-                        f"Auto-closed alert {alert.alert_id}: {reason}"
-                    )
-
-            except Exception as e:
-                # Log error but continue with other alerts
-                logger.error(
-                    f"Error processing alert {alert_doc.get('alert_id', 'unknown')}: {str(e)}"
-                )
-                continue
+        auto_closed = await auto_close_alerts(closures, db)
 
         stats = {
             "total_checked": total_checked,
@@ -388,4 +417,3 @@ async def evaluate_all_pending_alerts(
     except Exception as e:
         logger.error(f"Unexpected error evaluating pending alerts: {str(e)}")
         raise RuntimeError(f"Failed to evaluate pending alerts: {str(e)}") from e
-
@@ -7,7 +7,9 @@ from typing import Dict, List, Optional
 
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo.errors import PyMongoError
+from pydantic import TypeAdapter
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
 from src.database.models import EscalationCondition, RuleModel, SourceType
 
@@ -16,6 +18,9 @@ _active_rules_cache: Optional[Dict[SourceType, List[RuleModel]]] = None
 _cache_timestamp: Optional[datetime] = None
 CACHE_TTL_MINUTES = 5
 
+# Validates a whole list of rule documents in one call
+_RULE_LIST_ADAPTER = TypeAdapter(List[RuleModel])
+
 
 def _clear_cache() -> None:
     """Clear the active rules cache."""
@@ -37,7 +42,8 @@ async def load_default_rules(db: AsyncIOMotorDatabase) -> int:
     Load default rules from JSON file into database.
 
     Reads app/config/default_rules.json, parses JSON, and inserts rules
-    that don't already exist in the database.
+    that don't already exist in the database with a single unordered
+    bulk upsert.
 
     Args:
         db: MongoDB database instance
@@ -68,23 +74,14 @@ async def load_default_rules(db: AsyncIOMotorDatabase) -> int:
         if not isinstance(rules_data, list):
             raise ValueError("Invalid JSON structure: 'rules' must be an array")
 
-        # Get rules collection
-        rules_collection = db["rules"]
-
-        inserted_count = 0
-
-        # Process each rule
+        # Build one upsert per valid rule; $setOnInsert leaves existing rules untouched
+        operations = []
         for rule_dict in rules_data:
             try:
                 rule_id = rule_dict.get("rule_id")
                 if not rule_id:
                     continue  # Skip rules without rule_id
 
-                # Check if rule already exists
-                existing_rule = await rules_collection.find_one({"rule_id": rule_id})
-                if existing_rule:
-                    continue  # Skip if already exists
-
                 # Convert source_type string to enum
                 source_type_str = rule_dict.get("source_type")
                 if isinstance(source_type_str, str):
@@ -109,16 +106,23 @@ async def load_default_rules(db: AsyncIOMotorDatabase) -> int:
                     "updated_at": None,
                 }
 
-                # Insert into database
-                await rules_collection.insert_one(rule_doc)
-                inserted_count += 1
+                operations.append(
+                    UpdateOne({"rule_id": rule_id}, {"$setOnInsert": rule_doc}, upsert=True)
+                )
 
-            except (ValueError, KeyError) as e:
+            except (ValueError, KeyError):
                 # Skip invalid rule entries
                 continue
-            except PyMongoError as e:
-                # Log error but continue with other rules
-                continue
+
+        inserted_count = 0
+        if operations:
+            # Insert every missing rule in one round trip
+            try:
+                result = await db["rules"].bulk_write(operations, ordered=False)
+                inserted_count = result.upserted_count
+            except BulkWriteError as e:
+                # Keep the rules that were inserted; failed ones are skipped
+                inserted_count = e.details.get("nUpserted", 0)
 
         # Clear cache after loading
         _clear_cache()
@@ -163,7 +167,7 @@ async def get_active_rules_for_source(
         rule_docs = await cursor.to_list(length=None)
 
         # Convert to RuleModel list
-        rules = [RuleModel(**doc) for doc in rule_docs]
+        rules = _RULE_LIST_ADAPTER.validate_python(rule_docs)
 
         return rules
 
@@ -206,7 +210,7 @@ async def get_all_active_rules(
         rule_docs = await cursor.to_list(length=None)
 
         # Convert to RuleModel list
-        rules = [RuleModel(**doc) for doc in rule_docs]
+        rules = _RULE_LIST_ADAPTER.validate_python(rule_docs)
 
         # Group by source_type
         grouped_rules: Dict[SourceType, List[RuleModel]] = {}
@@ -232,7 +236,8 @@ async def create_rule(rule_data: RuleModel, db: AsyncIOMotorDatabase) -> RuleMod
     """
     Create a new rule in the database.
 
-    Checks if rule_id already exists and raises error if duplicate.
+    Relies on the unique rule_id index to reject duplicates, and builds the
+    returned model from the inserted document instead of reading it back.
 
     Args:
         rule_data: RuleModel instance to create
@@ -248,14 +253,6 @@ async def create_rule(rule_data: RuleModel, db: AsyncIOMotorDatabase) -> RuleMod
     try:
         rules_collection = db["rules"]
 
-        # Check if rule_id already exists
-        existing_rule = await rules_collection.find_one({"rule_id": rule_data.rule_id})
-        if existing_rule:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Rule with ID {rule_data.rule_id} already exists",
-            )
-
         # Create rule document
         rule_doc = {
             "rule_id": rule_data.rule_id,
@@ -269,18 +266,31 @@ async def create_rule(rule_data: RuleModel, db: AsyncIOMotorDatabase) -> RuleMod
             "updated_at": None,
         }
 
-        # Insert into database
-        result = await rules_collection.insert_one(rule_doc)
-
-        # Fetch the created rule
-        created_rule_doc = await rules_collection.find_one({"_id": result.inserted_id})
-        if not created_rule_doc:
-            raise RuntimeError("Failed to retrieve created rule")
+        # Insert into database; the unique rule_id index rejects duplicates
+        try:
+            result = await rules_collection.insert_one(rule_doc)
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Rule with ID {rule_data.rule_id} already exists",
+            )
 
         # Clear cache
         _clear_cache()
 
-        return RuleModel(**created_rule_doc)
+        # The document was built from validated fields, no need to re-read it
+        return RuleModel.model_construct(
+            id=result.inserted_id,
+            rule_id=rule_doc["rule_id"],
+            source_type=rule_data.source_type,
+            name=rule_doc["name"],
+            description=rule_doc["description"],
+            conditions=rule_data.conditions,
+            is_active=rule_doc["is_active"],
+            priority=rule_doc["priority"],
+            created_at=rule_doc["created_at"],
+            updated_at=None,
+        )
 
     except HTTPException:
         raise
@@ -1,9 +1,11 @@
 """Alert ID generator using MongoDB atomic counters."""
 
-from datetime import datetime
-from typing import Dict
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 from pymongo.errors import PyMongoError
 
 from src.database.models import SourceType
@@ -19,76 +21,114 @@ SOURCE_PREFIX_MAP: Dict[SourceType, str] = {
     SourceType.SAFETY: "SAF",
 }
 
+# Sequence numbers reserved per counter round trip by AlertIdAllocator
+ID_BLOCK_SIZE = 100
 
-async def generate_alert_id(source_type: SourceType, db: AsyncIOMotorDatabase) -> str:
-    """
-    Generate a unique alert ID using atomic MongoDB counter operations.
-
-    Format: {PREFIX}-{YEAR}-{SEQUENCE}
-    Example: "OSP-2025-00001" for OVERSPEEDING
 
-    Uses MongoDB's find_one_and_update for thread-safe atomic sequence generation.
+def _counter_for(source_type: SourceType) -> Tuple[str, int, str]:
+    """
+    Resolve the ID prefix, current year and counter document ID for a source type.
 
     Args:
         source_type: The source type of the alert
-        db: MongoDB database instance (AsyncIOMotorDatabase)
 
     Returns:
-        str: Generated alert ID in format {PREFIX}-{YEAR}-{SEQUENCE}
+        Tuple of (prefix, year, counter document ID)
 
     Raises:
         ValueError: If source_type is not in the prefix mapping
-        RuntimeError: If counter operation fails
     """
-    # Validate source type
     if source_type not in SOURCE_PREFIX_MAP:
         raise ValueError(f"Unknown source type: {source_type}")
 
-    # Get prefix for source type
     prefix = SOURCE_PREFIX_MAP[source_type]
+    current_year = datetime.now(timezone.utc).year
+    return prefix, current_year, f"alert_{prefix}_{current_year}"
+
 
-    # Get current year
-    current_year = datetime.utcnow().year
-
-    # Create counter document ID
-    counter_id = f"alert_{prefix}_{current_year}"
-
-    # Get counters collection
-    counters_collection = db["counters"]
-
-    try:
-        # Atomic increment operation using find_one_and_update
-        # This ensures thread-safety even with concurrent requests
-        # $inc will create the document with sequence=1 if it doesn't exist,
-        # or increment the existing sequence if it does
-        result = await counters_collection.find_one_and_update(
-            {"_id": counter_id},
-            {"$inc": {"sequence": 1}},  # Increment sequence atomically
-            upsert=True,  # Create document if it doesn't exist
-            return_document=True,  # Return the updated document
-        )
-
-        # Extract sequence number
-        # result should never be None with upsert=True, but handle it defensively
-        if result is None:
-            # Fallback: try to get the document directly
-            result = await counters_collection.find_one({"_id": counter_id})
-            if result is None:
-                raise RuntimeError("Failed to create or retrieve counter document")
-            sequence = result.get("sequence", 1)
-        else:
-            sequence = result.get("sequence", 1)
-
-        # Zero-pad sequence to 5 digits
-        sequence_str = str(sequence).zfill(5)
-
-        # Generate alert ID
-        alert_id = f"{prefix}-{current_year}-{sequence_str}"
-
-        return alert_id
-
-    except PyMongoError as e:
-        raise RuntimeError(f"Failed to generate alert ID: {str(e)}") from e
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error generating alert ID: {str(e)}") from e
+class AlertIdAllocator:
+    """
+    Hand out alert IDs from blocks reserved on the MongoDB counters.
+
+    Each counter round trip reserves ``block_size`` sequence numbers with a
+    single atomic $inc; IDs are then served from memory until the block
+    runs out. IDs stay unique across workers, since every block comes from
+    the shared counter, but they are only increasing within one process,
+    and numbers left in a block when the process stops are never used.
+    """
 
+    def __init__(self, block_size: int = ID_BLOCK_SIZE) -> None:
+        """
+        Initialize the allocator.
+
+        Args:
+            block_size: Sequence numbers reserved per counter round trip
+        """
+        self.block_size = block_size
+        # counter ID -> [next sequence, last reserved sequence]
+        self._blocks: Dict[str, List[int]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def _reserve_block(self, counter_id: str, db: AsyncIOMotorDatabase) -> List[int]:
+        """
+        Reserve the next block of sequence numbers on a counter.
+
+        Args:
+            counter_id: Counter document ID
+            db: MongoDB database instance
+
+        Returns:
+            List of [first sequence, last sequence] of the block
+
+        Raises:
+            RuntimeError: If counter operation fails
+        """
+        try:
+            result = await db["counters"].find_one_and_update(
+                {"_id": counter_id},
+                {"$inc": {"sequence": self.block_size}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except PyMongoError as e:
+            raise RuntimeError(f"Failed to generate alert ID: {str(e)}") from e
+
+        last = result["sequence"]
+        return [last - self.block_size + 1, last]
+
+    async def next(self, source_type: SourceType, db: AsyncIOMotorDatabase) -> str:
+        """
+        Get the next alert ID for a source type.
+
+        Format: {PREFIX}-{YEAR}-{SEQUENCE}
+        Example: "OSP-2025-00001" for OVERSPEEDING
+
+        Args:
+            source_type: The source type of the alert
+            db: MongoDB database instance (AsyncIOMotorDatabase)
+
+        Returns:
+            str: Generated alert ID
+
+        Raises:
+            ValueError: If source_type is not in the prefix mapping
+            RuntimeError: If counter operation fails
+        """
+        prefix, year, counter_id = _counter_for(source_type)
+
+        block = self._blocks.get(counter_id)
+        if block is None or block[0] > block[1]:
+            async with self._locks.setdefault(counter_id, asyncio.Lock()):
+                # Another caller may have refilled the block while we waited
+                block = self._blocks.get(counter_id)
+                if block is None or block[0] > block[1]:
+                    block = await self._reserve_block(counter_id, db)
+                    self._blocks[counter_id] = block
+
+        sequence = block[0]
+        block[0] += 1
+        return f"{prefix}-{year}-{str(sequence).zfill(5)}"
+
+
+# Process-wide allocator used by the alert service
+alert_id_allocator = AlertIdAllocator()
@@ -0,0 +1,168 @@
+"""TTL cache and single-flight decorators for async functions."""
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Set, Tuple
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Strong references to in-flight background refreshes
+_REFRESH_TASKS: Set[asyncio.Task] = set()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Make dict and list arguments hashable so they can be part of a key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _key_maker(func: Callable, ignore: Iterable[str]) -> Callable[[tuple, dict], Hashable]:
+    """Build a function mapping call arguments to a key, minus ignored parameters."""
+    signature = inspect.signature(func)
+    ignored = frozenset(ignore)
+
+    def make_key(args: tuple, kwargs: dict) -> Hashable:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tuple(
+            (name, _freeze(value))
+            for name, value in bound.arguments.items()
+            if name not in ignored
+        )
+
+    return make_key
+
+
+def async_ttl_cache(
+    ttl: float,
+    stale_ttl: float = 0.0,
+    maxsize: int = 256,
+    ignore: Iterable[str] = ("db",),
+) -> Callable:
+    """
+    Cache results of an async function per argument set for ``ttl`` seconds.
+
+    Concurrent misses for the same key share a single call. For
+    ``stale_ttl`` seconds after an entry expires, callers get the stale
+    value immediately while one background call refreshes it
+    (stale-while-revalidate). Exceptions are never cached.
+
+    Args:
+        ttl: Seconds a result is served as fresh
+        stale_ttl: Extra seconds an expired result may be served while refreshing
+        maxsize: Maximum number of cached argument sets
+        ignore: Parameter names excluded from the cache key (e.g. the database handle)
+
+    Returns:
+        Callable: Decorator for an async function
+    """
+    def decorator(func: Callable) -> Callable:
+        make_key = _key_maker(func, ignore)
+        # key -> (fresh_until, stale_until, value)
+        entries: "OrderedDict[Hashable, Tuple[float, float, Any]]" = OrderedDict()
+        locks: Dict[Hashable, asyncio.Lock] = {}
+        refreshing: Set[Hashable] = set()
+
+        async def load(key: Hashable, args: tuple, kwargs: dict) -> Any:
+            value = await func(*args, **kwargs)
+            now = time.monotonic()
+            entries[key] = (now + ttl, now + ttl + stale_ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+            return value
+
+        async def refresh(key: Hashable, args: tuple, kwargs: dict) -> None:
+            try:
+                await load(key, args, kwargs)
+            except Exception as e:
+                logger.warning(f"Background refresh of {func.__name__} failed: {str(e)}")
+            finally:
+                refreshing.discard(key)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            entry = entries.get(key)
+            if entry is not None:
+                fresh_until, stale_until, value = entry
+                now = time.monotonic()
+                if now < fresh_until:
+                    return value
+                if now < stale_until:
+                    if key not in refreshing:
+                        refreshing.add(key)
+                        task = asyncio.create_task(refresh(key, args, kwargs))
+                        _REFRESH_TASKS.add(task)
+                        task.add_done_callback(_REFRESH_TASKS.discard)
+                    return value
+
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = asyncio.Lock()
+            try:
+                async with lock:
+                    # Another caller may have filled the entry while we waited
+                    entry = entries.get(key)
+                    if entry is not None and time.monotonic() < entry[0]:
+                        return entry[2]
+                    return await load(key, args, kwargs)
+            finally:
+                # Drop the lock once no other caller holds or awaits it, so
+                # locks only exist for keys with a miss in progress
+                if not lock.locked() and locks.get(key) is lock:
+                    del locks[key]
+
+        def cache_clear() -> None:
+            entries.clear()
+            locks.clear()
+            refreshing.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def single_flight(ignore: Iterable[str] = ("db",)) -> Callable:
+    """
+    Collapse concurrent calls of an async function with the same arguments.
+
+    While a call is in flight, callers with the same arguments await its
+    result instead of starting their own. Nothing is kept once it
+    finishes; use async_ttl_cache to also reuse results. The shared call
+    runs as its own task, so one caller being cancelled does not cancel
+    it for the others.
+
+    Args:
+        ignore: Parameter names excluded from the key (e.g. the database handle)
+
+    Returns:
+        Callable: Decorator for an async function
+    """
+    def decorator(func: Callable) -> Callable:
+        make_key = _key_maker(func, ignore)
+        inflight: Dict[Hashable, asyncio.Task] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(func(*args, **kwargs))
+                inflight[key] = task
+                task.add_done_callback(lambda _: inflight.pop(key, None))
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,114 @@
+"""HTTP caching middleware for read-only API responses."""
+
+import hashlib
+from typing import List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Cache-Control for cacheable responses. Responses depend on the caller's
+# token, so only the browser may cache them, never a shared proxy.
+DEFAULT_CACHE_CONTROL = "private, max-age=15, stale-while-revalidate=60"
+
+
+def _etag(body: bytes) -> bytes:
+    """Build a weak ETag from a response body."""
+    return b'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+
+
+def _matches(if_none_match: bytes, etag: bytes) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if if_none_match.strip() == b"*":
+        return True
+    candidates = [value.strip() for value in if_none_match.split(b",")]
+    # Weak comparison: W/"x" and "x" match
+    return etag in candidates or etag[2:] in candidates
+
+
+class ETagMiddleware:
+    """
+    Add ETag and Cache-Control to successful GET responses under a path prefix.
+
+    The ETag is a hash of the response body, so it changes exactly when
+    the data does. A request whose If-None-Match matches gets an empty
+    304 instead of the body. Streamed NDJSON responses are passed through
+    untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefix: str,
+        cache_control: str = DEFAULT_CACHE_CONTROL,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            path_prefix: Only GET requests whose path starts with this are handled
+            cache_control: Cache-Control header value for handled responses
+        """
+        self.app = app
+        self.path_prefix = path_prefix
+        self.cache_control = cache_control.encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Buffer matching responses to tag them, pass everything else through."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = b""
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value
+                break
+
+        start: Message = {}
+        body_parts: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+
+            if message["type"] == "http.response.start":
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                if message["status"] != 200 or content_type.startswith(b"application/x-ndjson"):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = _etag(body)
+            headers: List[Tuple[bytes, bytes]] = [
+                (name, value)
+                for name, value in start.get("headers", [])
+                if name not in (b"etag", b"cache-control")
+            ]
+            headers.append((b"etag", etag))
+            headers.append((b"cache-control", self.cache_control))
+
+            if if_none_match and _matches(if_none_match, etag):
+                headers = [(name, value) for name, value in headers if name != b"content-length"]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
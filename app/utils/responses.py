@@ -0,0 +1,79 @@
+"""Response classes shared by the API routes."""
+
+from typing import Any, AsyncIterable, AsyncIterator, Sequence, Union
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson.
+
+    Returning this directly from an endpoint bypasses FastAPI's
+    jsonable_encoder; values orjson does not know (e.g. ObjectId) are
+    rendered with str().
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize content to JSON bytes.
+
+        Args:
+            content: JSON-compatible content (datetimes and enums are supported natively)
+
+        Returns:
+            bytes: Serialized JSON
+        """
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_response(
+    content: Union[BaseModel, Sequence[BaseModel]], status_code: int = 200
+) -> ORJSONResponse:
+    """
+    Render a model, or a list of models, straight to an ORJSONResponse.
+
+    Each model is dumped once, with the same field names FastAPI would
+    emit for it as a response_model, and FastAPI skips re-validating it.
+
+    Args:
+        content: Pydantic model or sequence of models
+        status_code: HTTP status code
+
+    Returns:
+        ORJSONResponse: JSON response
+    """
+    if isinstance(content, BaseModel):
+        payload = content.model_dump(by_alias=True)
+    else:
+        payload = [item.model_dump(by_alias=True) for item in content]
+    return ORJSONResponse(payload, status_code=status_code)
+
+
+async def _ndjson_lines(items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    """Serialize each model to one JSON line."""
+    async for item in items:
+        yield orjson.dumps(item.model_dump(by_alias=True), default=str) + b"\n"
+
+
+def ndjson_response(items: AsyncIterable[BaseModel]) -> StreamingResponse:
+    """
+    Stream models as newline-delimited JSON.
+
+    Each model is rendered as it is produced, using the same field names
+    FastAPI would emit for the model as a response_model.
+
+    Args:
+        items: Async iterable of pydantic models
+
+    Returns:
+        StreamingResponse: application/x-ndjson response
+    """
+    return StreamingResponse(_ndjson_lines(items), media_type=NDJSON_MEDIA_TYPE)
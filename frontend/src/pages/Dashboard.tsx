@@ -65,118 +65,40 @@ const Dashboard: React.FC = () => {
         setIsRefreshing(true);
       }
 
-      // Fetch summary
-      try {
-        setLoading((prev) => ({ ...prev, summary: true }));
-        setErrors((prev) => ({ ...prev, summary: null }));
-        const response = await dashboardAPI.getSummary();
-        setSummary(response.data);
-      } catch (error: any) {
-        const errorMessage = error.response?.data?.detail || error.message || 'Failed to load summary';
-        const errorText = Array.isArray(errorMessage) 
-          ? errorMessage.map((e: any) => e.msg || JSON.stringify(e)).join(', ')
-          : (typeof errorMessage === 'string' ? errorMessage : JSON.stringify(errorMessage));
-        setErrors((prev) => ({
-          ...prev,
-          summary: new Error(errorText),
-        }));
-      } finally {
-        setLoading((prev) => ({ ...prev, summary: false }));
-      }
-
-      // Fetch top offenders
-      try {
-        setLoading((prev) => ({ ...prev, topOffenders: true }));
-        setErrors((prev) => ({ ...prev, topOffenders: null }));
-        const response = await dashboardAPI.getTopOffenders(5);
-        setTopOffenders(response.data);
-      } catch (error: any) {
-        const errorMessage = error.response?.data?.detail || error.message || 'Failed to load top offenders';
-        const errorText = Array.isArray(errorMessage) 
-          ? errorMessage.map((e: any) => e.msg || JSON.stringify(e)).join(', ')
-          : (typeof errorMessage === 'string' ? errorMessage : JSON.stringify(errorMessage));
-        setErrors((prev) => ({
-          ...prev,
-          topOffenders: new Error(errorText),
-        }));
-      } finally {
-        setLoading((prev) => ({ ...prev, topOffenders: false }));
-      }
-
-      // Fetch recent activities
-      try {
-        setLoading((prev) => ({ ...prev, recentActivities: true }));
-        setErrors((prev) => ({ ...prev, recentActivities: null }));
-        const response = await dashboardAPI.getRecentActivities(20);
-        setRecentActivities(response.data);
-      } catch (error: any) {
-        const errorMessage = error.response?.data?.detail || error.message || 'Failed to load activities';
-        const errorText = Array.isArray(errorMessage) 
-          ? errorMessage.map((e: any) => e.msg || JSON.stringify(e)).join(', ')
-          : (typeof errorMessage === 'string' ? errorMessage : JSON.stringify(errorMessage));
-        setErrors((prev) => ({
-          ...prev,
-          recentActivities: new Error(errorText),
-        }));
-      } finally {
-        setLoading((prev) => ({ ...prev, recentActivities: false }));
-      }
-
-      // Fetch trends
-      try {
-        setLoading((prev) => ({ ...prev, trends: true }));
-        setErrors((prev) => ({ ...prev, trends: null }));
-        const response = await dashboardAPI.getTrends(trendDays);
-        setTrends(response.data);
-      } catch (error: any) {
-        const errorMessage = error.response?.data?.detail || error.message || 'Failed to load trends';
-        const errorText = Array.isArray(errorMessage) 
-          ? errorMessage.map((e: any) => e.msg || JSON.stringify(e)).join(', ')
-          : (typeof errorMessage === 'string' ? errorMessage : JSON.stringify(errorMessage));
-        setErrors((prev) => ({
-          ...prev,
-          trends: new Error(errorText),
-        }));
-      } finally {
-        setLoading((prev) => ({ ...prev, trends: false }));
-      }
-
-      // Fetch source distribution
-      try {
-        setLoading((prev) => ({ ...prev, sourceDistribution: true }));
-        setErrors((prev) => ({ ...prev, sourceDistribution: null }));
-        const response = await dashboardAPI.getSourceDistribution();
-        setSourceDistribution(response.data);
-      } catch (error: any) {
-        const errorMessage = error.response?.data?.detail || error.message || 'Failed to load distribution';
-        const errorText = Array.isArray(errorMessage) 
-          ? errorMessage.map((e: any) => e.msg || JSON.stringify(e)).join(', ')
-          : (typeof errorMessage === 'string' ? errorMessage : JSON.stringify(errorMessage));
-        setErrors((prev) => ({
-          ...prev,
-          sourceDistribution: new Error(errorText),
-        }));
-      } finally {
-        setLoading((prev) => ({ ...prev, sourceDistribution: false }));
-      }
+      // Fetch every widget in one request
+      const forAllWidgets = <T,>(value: T) => ({
+        summary: value,
+        topOffenders: value,
+        recentActivities: value,
+        trends: value,
+        sourceDistribution: value,
+        autoClosed: value,
+      });
 
-      // Fetch auto-closed alerts
       try {
-        setLoading((prev) => ({ ...prev, autoClosed: true }));
-        setErrors((prev) => ({ ...prev, autoClosed: null }));
-        const response = await dashboardAPI.getAutoClosedAlerts(autoClosedHours);
-        setAutoClosed(response.data);
+        setLoading(forAllWidgets(true));
+        setErrors(forAllWidgets<Error | null>(null));
+        const response = await dashboardAPI.getBundle({
+          offenders_limit: 5,
+          activities_limit: 20,
+          auto_closed_hours: autoClosedHours,
+          trend_days: trendDays,
+        });
+        const bundle = response.data;
+        setSummary(bundle.summary);
+        setTopOffenders(bundle.top_offenders);
+        setRecentActivities(bundle.recent_activities);
+        setTrends(bundle.trends);
+        setSourceDistribution(bundle.source_distribution);
+        setAutoClosed(bundle.auto_closed);
       } catch (error: any) {
-        const errorMessage = error.response?.data?.detail || error.message || 'Failed to load auto-closed alerts';
+        const errorMessage = error.response?.data?.detail || error.message || 'Failed to load dashboard';
         const errorText = Array.isArray(errorMessage) 
           ? errorMessage.map((e: any) => e.msg || JSON.stringify(e)).join(', ')
           : (typeof errorMessage === 'string' ? errorMessage : JSON.stringify(errorMessage));
-        setErrors((prev) => ({
-          ...prev,
-          autoClosed: new Error(errorText),
-        }));
+        setErrors(forAllWidgets<Error | null>(new Error(errorText)));
       } finally {
-        setLoading((prev) => ({ ...prev, autoClosed: false }));
+        setLoading(forAllWidgets(false));
       }
 
       if (showRefreshing) {
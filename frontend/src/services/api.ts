@@ -9,6 +9,7 @@ import type {
   RecentActivity,
   TrendDataPoint,
   Alert,
+  DashboardBundle,
 } from '../types';
 
 // Prefer environment variable in production (Vercel), fallback to same-origin or localhost in dev
@@ -69,7 +70,13 @@ export const dashboardAPI = {
   getRecentActivities: (limit = 20) => api.get<RecentActivity[]>(`/api/dashboard/recent-activities?limit=${limit}`),
   getAutoClosedAlerts: (hours = 24) => api.get<Alert[]>(`/api/dashboard/auto-closed?hours=${hours}`),
   getTrends: (days = 7) => api.get<TrendDataPoint[]>(`/api/dashboard/trends?days=${days}`),
-  getSourceDistribution: () => api.get<{ [key: string]: number }>('/api/dashboard/source-distribution')
+  getSourceDistribution: () => api.get<{ [key: string]: number }>('/api/dashboard/source-distribution'),
+  getBundle: (params: {
+    offenders_limit?: number;
+    activities_limit?: number;
+    auto_closed_hours?: number;
+    trend_days?: number;
+  } = {}) => api.get<DashboardBundle>('/api/dashboard/bundle', { params })
 };
 
 export const alertsAPI = {
@@ -87,6 +94,7 @@ export type {
   RecentActivity,
   TrendDataPoint,
   Alert,
+  DashboardBundle,
 } from '../types';
 
 export default api;
@@ -65,3 +65,12 @@ export interface StateTransition {
   triggered_by?: string;
 }
 
+
+export interface DashboardBundle {
+  summary: AlertSummary;
+  top_offenders: TopOffender[];
+  recent_activities: RecentActivity[];
+  auto_closed: Alert[];
+  trends: TrendDataPoint[];
+  source_distribution: { [key: string]: number };
+}
@@ -1,13 +1,15 @@
 """MongoDB database connection module."""
 
 import os
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import ConnectionFailure
 
 from dotenv import load_dotenv
 
+from src.database.indexes import ensure_indexes
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -47,25 +49,51 @@ class Database:
         """
         return os.getenv("MONGODB_DATABASE", "moveinsync_db")
 
+    @classmethod
+    def get_pool_options(cls) -> Dict[str, Any]:
+        """
+        Get Motor connection pool options from environment variables.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for AsyncIOMotorClient
+        """
+        return {
+            "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+            "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "10")),
+            "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000")),
+            "waitQueueTimeoutMS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "10000")),
+            "retryWrites": os.getenv("MONGO_RETRY_WRITES", "true").lower() == "true",
+        }
+
     @classmethod
     async def connect(cls) -> None:
         """
         Connect to MongoDB database.
 
+        The client is a process-wide singleton: every request and background
+        job shares its connection pool. Calling connect() again while
+        connected is a no-op rather than opening a second pool.
+
         Raises:
             ConnectionFailure: If connection to MongoDB fails
         """
+        if cls.client is not None:
+            return
+
         try:
             connection_string = cls.get_connection_string()
             database_name = cls.get_database_name()
 
-            cls.client = AsyncIOMotorClient(connection_string)
+            cls.client = AsyncIOMotorClient(connection_string, **cls.get_pool_options())
             cls.database = cls.client[database_name]
 
-            # Verify connection by pinging the database
+            # Verify connection by pinging the database (also warms up the pool)
             await cls.client.admin.command("ping")
             print(f"Successfully connected to MongoDB database: {database_name}")
 
+            # Make sure the indexes used by hot queries exist
+            await ensure_indexes(cls.database)
+
         except ConnectionFailure as e:
             print(f"Failed to connect to MongoDB: {e}")
             raise
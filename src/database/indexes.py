@@ -0,0 +1,140 @@
+"""MongoDB index definitions and creation."""
+
+import logging
+import os
+from typing import Any, Dict, List, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import PyMongoError
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Configure logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Auto-closed alerts are kept this long after closure before MongoDB's TTL
+# monitor deletes them
+ALERT_RETENTION_SECONDS = int(os.getenv("ALERT_RETENTION_DAYS", "30")) * 24 * 60 * 60
+
+# (collection, keys, options) for every index the application relies on
+INDEXES: List[Tuple[str, List[Tuple[str, int]], Dict[str, Any]]] = [
+    # Users: login/auth lookups and registration uniqueness
+    ("users", [("username", ASCENDING)], {"unique": True}),
+    ("users", [("email", ASCENDING)], {"unique": True}),
+    # Alerts: alert_id lookups and filtered/sorted listing
+    ("alerts", [("alert_id", ASCENDING)], {"unique": True}),
+    ("alerts", [("timestamp", DESCENDING)], {}),
+    ("alerts", [("status", ASCENDING), ("timestamp", DESCENDING)], {}),
+    (
+        "alerts",
+        [("status", ASCENDING), ("source_type", ASCENDING), ("timestamp", DESCENDING)],
+        {},
+    ),
+    (
+        "alerts",
+        [
+            ("status", ASCENDING),
+            ("source_type", ASCENDING),
+            ("severity", ASCENDING),
+            ("timestamp", DESCENDING),
+        ],
+        {},
+    ),
+    ("alerts", [("source_type", ASCENDING), ("timestamp", DESCENDING)], {}),
+    ("alerts", [("severity", ASCENDING), ("timestamp", DESCENDING)], {}),
+    ("alerts", [("metadata.driver_id", ASCENDING), ("timestamp", DESCENDING)], {}),
+    # Alerts: recently changed alerts for the periodic event log repair
+    ("alerts", [("updated_at", DESCENDING)], {}),
+    # Alerts: auto-close scan on expires_at
+    ("alerts", [("expires_at", ASCENDING)], {}),
+    # Alerts: TTL deletion of auto-closed alerts after retention. Partial, so
+    # open, escalated and resolved alerts are never deleted
+    (
+        "alerts",
+        [("closed_at", ASCENDING)],
+        {
+            "name": "auto_closed_ttl",
+            "expireAfterSeconds": ALERT_RETENTION_SECONDS,
+            "partialFilterExpression": {"status": "AUTO_CLOSED"},
+        },
+    ),
+    # Alerts: covers the top-offenders aggregation over active alerts. Partial,
+    # so it only holds open and escalated alerts
+    (
+        "alerts",
+        [
+            ("status", ASCENDING),
+            ("metadata.driver_id", ASCENDING),
+            ("timestamp", DESCENDING),
+        ],
+        {
+            "name": "offenders_cov",
+            "partialFilterExpression": {"status": {"$in": ["OPEN", "ESCALATED"]}},
+        },
+    ),
+    # Alert events: newest-first activity feed, idempotent history backfill
+    ("alert_events", [("timestamp", DESCENDING)], {}),
+    (
+        "alert_events",
+        [("alert_id", ASCENDING), ("timestamp", ASCENDING), ("to_status", ASCENDING)],
+        {"unique": True},
+    ),
+    # Rules: rule_id lookups and upserts, filtered listing sorted by priority
+    ("rules", [("rule_id", ASCENDING)], {"unique": True}),
+    (
+        "rules",
+        [("is_active", ASCENDING), ("source_type", ASCENDING), ("priority", DESCENDING)],
+        {"name": "rules_list_idx"},
+    ),
+]
+
+
+async def _drop_legacy_expires_at_ttl(db: AsyncIOMotorDatabase) -> None:
+    """
+    Drop the former TTL index on alerts.expires_at, if present.
+
+    It deleted alerts of any status once expires_at had passed, including
+    escalated ones; the plain expires_at index replaces it.
+
+    Args:
+        db: MongoDB database instance
+    """
+    try:
+        index_info = await db["alerts"].index_information()
+        if "expireAfterSeconds" in index_info.get("expires_at_1", {}):
+            await db["alerts"].drop_index("expires_at_1")
+    except PyMongoError as e:
+        logger.warning(f"Failed to drop legacy TTL index on alerts.expires_at: {e}")
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Create all application indexes if they do not already exist.
+
+    Index creation is idempotent. Unique indexes are what keep usernames,
+    emails, alert IDs and other keys unique, so failing to build one (e.g.
+    over existing duplicate data) stops startup. A failure on any other
+    index only costs performance; it is logged and startup continues.
+
+    Args:
+        db: MongoDB database instance
+
+    Raises:
+        RuntimeError: If a unique index cannot be created
+    """
+    await _drop_legacy_expires_at_ttl(db)
+
+    for collection_name, keys, options in INDEXES:
+        try:
+            await db[collection_name].create_index(keys, background=True, **options)
+        except PyMongoError as e:
+            if options.get("unique"):
+                raise RuntimeError(
+                    f"Failed to create unique index {keys} on {collection_name}: {e}"
+                ) from e
+            logger.warning(f"Failed to create index {keys} on {collection_name}: {e}")
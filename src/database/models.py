@@ -384,4 +384,14 @@ class TrendDataPoint(BaseModel):
     total_alerts: int
     escalated: int
     auto_closed: int
-    resolved: int
\ No newline at end of file
+    resolved: int
+
+
+class DashboardBundle(BaseModel):
+    """All dashboard widgets returned by a single request."""
+    summary: AlertSummary
+    top_offenders: List[TopOffender]
+    recent_activities: List[RecentActivity]
+    auto_closed: List[AlertModel]
+    trends: List[TrendDataPoint]
+    source_distribution: Dict[str, int]
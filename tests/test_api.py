@@ -4,9 +4,10 @@ Comprehensive API test suite for FastAPI Alert Management System.
 This module contains test cases for:
 - Authentication
 - Rule management
-- Alert creation and management
+- Alert creation and management, including bulk creation
 - Escalation scenarios
-- Dashboard endpoints
+- Dashboard endpoints, the combined bundle and conditional GET (ETag/304)
+- Dashboard summary counters across alert state changes
 
 Test Execution:
     # Run all tests
@@ -585,3 +586,358 @@ def test_top_offenders(
     except Exception as e:
         pytest.fail(f"Unexpected error during top offenders test: {str(e)}")
 
+
+
+# ============================================================================
+# BULK ALERT CREATION TESTS
+# ============================================================================
+
+# Must match MAX_BULK_ALERTS in app/routes/alert_routes.py
+MAX_BULK_ALERTS = 500
+
+
+@pytest.mark.order(9)
+@pytest.mark.alerts
+def test_create_alerts_bulk(
+    base_url: str, authenticated_headers: Dict[str, str]
+) -> None:
+    """
+    Test bulk alert creation, its size limit and all-or-nothing validation.
+    
+    Verifies:
+    - POST /api/alerts/bulk creates every alert, in request order
+    - More than MAX_BULK_ALERTS alerts are rejected with 400
+    - A request with one invalid alert is rejected and creates no alert
+    
+    Args:
+        base_url: Base URL of the API server
+        authenticated_headers: Headers with auth token
+    """
+    url = f"{base_url}/api/alerts/bulk"
+    driver_id = f"DRVBULK{int(time.time())}"
+    
+    def alert_data(index: int) -> Dict[str, Any]:
+        return {
+            "source_type": "COMPLIANCE",
+            "metadata": {"driver_id": driver_id, "location": f"Bulk {index}"},
+        }
+    
+    try:
+        response = requests.post(
+            url,
+            json=[alert_data(i) for i in range(3)],
+            headers=authenticated_headers,
+            timeout=10,
+        )
+        
+        if response.status_code == 404:
+            pytest.skip("Bulk alerts endpoint not found. Route might not be registered yet.")
+        
+        assert response.status_code == 201, (
+            f"Bulk create failed with status {response.status_code}. "
+            f"Response: {response.text}"
+        )
+        
+        alerts = response.json()
+        assert len(alerts) == 3, f"Expected 3 alerts, got: {len(alerts)}"
+        assert [alert["metadata"]["location"] for alert in alerts] == [
+            "Bulk 0", "Bulk 1", "Bulk 2"
+        ], "Alerts not returned in request order"
+        assert len({alert["alert_id"] for alert in alerts}) == 3, "Alert IDs are not unique"
+        assert all(alert["status"] == "OPEN" for alert in alerts), "Bulk alerts should be OPEN"
+        
+        print(f"✅ Bulk created {len(alerts)} alerts for {driver_id}")
+        
+        # Over the limit: rejected before anything is written
+        too_many = requests.post(
+            url,
+            json=[alert_data(i) for i in range(MAX_BULK_ALERTS + 1)],
+            headers=authenticated_headers,
+            timeout=30,
+        )
+        assert too_many.status_code == 400, (
+            f"Expected 400 for {MAX_BULK_ALERTS + 1} alerts, got {too_many.status_code}"
+        )
+        
+        # One invalid entry fails the whole request
+        invalid_driver_id = f"{driver_id}X"
+        mixed = [
+            {"source_type": "COMPLIANCE", "metadata": {"driver_id": invalid_driver_id}},
+            {"source_type": "NOT_A_SOURCE", "metadata": {"driver_id": invalid_driver_id}},
+        ]
+        partial = requests.post(url, json=mixed, headers=authenticated_headers, timeout=10)
+        assert partial.status_code in (400, 422), (
+            f"Expected a validation error for an invalid entry, got {partial.status_code}"
+        )
+        
+        list_response = requests.get(
+            f"{base_url}/api/alerts?driver_id={invalid_driver_id}",
+            headers=authenticated_headers,
+            timeout=10,
+        )
+        assert list_response.status_code == 200, (
+            f"List alerts failed with status {list_response.status_code}"
+        )
+        assert list_response.json()["total"] == 0, (
+            "A rejected bulk request must not create any of its alerts"
+        )
+        
+        print("✅ Bulk limit and all-or-nothing validation enforced")
+        
+    except requests.exceptions.ConnectionError:
+        pytest.skip(f"Could not connect to {base_url}. Is the server running?")
+    except Exception as e:
+        pytest.fail(f"Unexpected error during bulk create test: {str(e)}")
+
+
+# ============================================================================
+# DASHBOARD BUNDLE AND CACHING TESTS
+# ============================================================================
+
+
+@pytest.mark.order(10)
+@pytest.mark.dashboard
+def test_dashboard_bundle(
+    base_url: str, authenticated_headers: Dict[str, str]
+) -> None:
+    """
+    Test that the dashboard bundle matches the individual widget endpoints.
+    
+    Verifies:
+    - GET /api/dashboard/bundle returns every widget
+    - Each widget has the same shape as its separate endpoint's response
+    
+    Args:
+        base_url: Base URL of the API server
+        authenticated_headers: Headers with auth token
+    """
+    dashboard_url = f"{base_url}/api/dashboard"
+    widget_endpoints = {
+        "summary": "summary",
+        "top_offenders": "top-offenders",
+        "recent_activities": "recent-activities",
+        "auto_closed": "auto-closed",
+        "trends": "trends",
+        "source_distribution": "source-distribution",
+    }
+    
+    try:
+        response = requests.get(
+            f"{dashboard_url}/bundle", headers=authenticated_headers, timeout=10
+        )
+        
+        if response.status_code == 404:
+            pytest.skip("Dashboard bundle endpoint not found. Route might not be implemented yet.")
+        
+        assert response.status_code == 200, (
+            f"Dashboard bundle failed with status {response.status_code}. "
+            f"Response: {response.text}"
+        )
+        
+        bundle = response.json()
+        assert set(bundle) == set(widget_endpoints), (
+            f"Unexpected bundle widgets: {sorted(bundle)}"
+        )
+        
+        for widget, path in widget_endpoints.items():
+            widget_response = requests.get(
+                f"{dashboard_url}/{path}", headers=authenticated_headers, timeout=10
+            )
+            assert widget_response.status_code == 200, (
+                f"GET /api/dashboard/{path} failed with status {widget_response.status_code}"
+            )
+            expected = widget_response.json()
+            actual = bundle[widget]
+            
+            assert type(actual) is type(expected), (
+                f"{widget}: bundle has {type(actual).__name__}, "
+                f"endpoint has {type(expected).__name__}"
+            )
+            if isinstance(expected, dict) and widget != "source_distribution":
+                assert set(actual) == set(expected), (
+                    f"{widget}: bundle fields {sorted(actual)} != endpoint fields {sorted(expected)}"
+                )
+            elif isinstance(expected, list) and actual and expected:
+                assert set(actual[0]) == set(expected[0]), (
+                    f"{widget}: bundle item fields {sorted(actual[0])} "
+                    f"!= endpoint item fields {sorted(expected[0])}"
+                )
+        
+        print(f"✅ Dashboard bundle matches {len(widget_endpoints)} widget endpoints")
+        
+    except requests.exceptions.ConnectionError:
+        pytest.skip(f"Could not connect to {base_url}. Is the server running?")
+    except Exception as e:
+        pytest.fail(f"Unexpected error during dashboard bundle test: {str(e)}")
+
+
+@pytest.mark.order(11)
+@pytest.mark.dashboard
+def test_dashboard_etag_not_modified(
+    base_url: str, authenticated_headers: Dict[str, str]
+) -> None:
+    """
+    Test conditional GET on dashboard endpoints.
+    
+    Verifies:
+    - Dashboard responses carry an ETag
+    - Repeating the request with If-None-Match returns an empty 304
+    
+    Args:
+        base_url: Base URL of the API server
+        authenticated_headers: Headers with auth token
+    """
+    url = f"{base_url}/api/dashboard/summary"
+    
+    try:
+        response = requests.get(url, headers=authenticated_headers, timeout=10)
+        
+        if response.status_code == 404:
+            pytest.skip("Dashboard summary endpoint not found. Route might not be implemented yet.")
+        
+        assert response.status_code == 200, (
+            f"Dashboard summary failed with status {response.status_code}"
+        )
+        etag = response.headers.get("ETag")
+        assert etag, f"Response missing ETag header: {dict(response.headers)}"
+        
+        conditional = requests.get(
+            url,
+            headers={**authenticated_headers, "If-None-Match": etag},
+            timeout=10,
+        )
+        assert conditional.status_code == 304, (
+            f"Expected 304 for a matching If-None-Match, got {conditional.status_code}"
+        )
+        assert conditional.content == b"", "304 response should have an empty body"
+        assert conditional.headers.get("ETag") == etag, "304 response should repeat the ETag"
+        
+        print(f"✅ If-None-Match {etag} returned 304")
+        
+    except requests.exceptions.ConnectionError:
+        pytest.skip(f"Could not connect to {base_url}. Is the server running?")
+    except Exception as e:
+        pytest.fail(f"Unexpected error during ETag test: {str(e)}")
+
+
+# ============================================================================
+# DASHBOARD SUMMARY COUNTER TESTS
+# ============================================================================
+
+# Dashboard results are cached for up to 30s fresh plus 30s stale
+SUMMARY_SETTLE_SECONDS = 75
+
+
+def _alert_total(base_url: str, headers: Dict[str, str], query: str = "") -> int:
+    """Count alerts through the uncached list endpoint."""
+    response = requests.get(
+        f"{base_url}/api/alerts?limit=1{query}", headers=headers, timeout=10
+    )
+    assert response.status_code == 200, f"List alerts failed: {response.status_code}"
+    return response.json()["total"]
+
+
+def _summary_mismatches(base_url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    """Compare the dashboard summary with counts from the list endpoint."""
+    response = requests.get(f"{base_url}/api/dashboard/summary", headers=headers, timeout=10)
+    assert response.status_code == 200, f"Dashboard summary failed: {response.status_code}"
+    summary = response.json()
+    
+    expected = {
+        "total_alerts": _alert_total(base_url, headers),
+        "open_count": _alert_total(base_url, headers, "&status=OPEN"),
+        "escalated_count": _alert_total(base_url, headers, "&status=ESCALATED"),
+        "auto_closed_count": _alert_total(base_url, headers, "&status=AUTO_CLOSED"),
+        "resolved_count": _alert_total(base_url, headers, "&status=RESOLVED"),
+        "critical_count": _alert_total(base_url, headers, "&severity=CRITICAL"),
+        "warning_count": _alert_total(base_url, headers, "&severity=WARNING"),
+        "info_count": _alert_total(base_url, headers, "&severity=INFO"),
+    }
+    return {
+        field: (summary.get(field), count)
+        for field, count in expected.items()
+        if summary.get(field) != count
+    }
+
+
+@pytest.mark.order(12)
+@pytest.mark.dashboard
+@pytest.mark.integration
+@pytest.mark.slow
+def test_dashboard_summary_counters(
+    base_url: str, authenticated_headers: Dict[str, str]
+) -> None:
+    """
+    Test that summary counts stay correct as alerts change state.
+    
+    The summary is served from counters maintained on every alert write,
+    behind the dashboard cache. This test creates an alert, escalates it,
+    creates and resolves a second one, then waits for the summary to match
+    the counts the uncached list endpoint reports.
+    
+    Verifies:
+    - Counters follow create, status change and resolve
+    - Total, status and severity counts all match the stored alerts
+    
+    Args:
+        base_url: Base URL of the API server
+        authenticated_headers: Headers with auth token
+    """
+    alerts_url = f"{base_url}/api/alerts"
+    alert_data = {
+        "source_type": "COMPLIANCE",
+        "metadata": {"driver_id": f"DRVSUM{int(time.time())}", "location": "Counter test"},
+    }
+    
+    try:
+        # Create, then escalate
+        created = requests.post(
+            alerts_url, json=alert_data, headers=authenticated_headers, timeout=10
+        )
+        if created.status_code == 404:
+            pytest.skip("Alerts endpoint not found. Route might not be registered yet.")
+        assert created.status_code == 201, f"Create alert failed: {created.text}"
+        escalated_id = created.json()["alert_id"]
+        
+        escalated = requests.patch(
+            f"{alerts_url}/{escalated_id}/status",
+            json={"new_status": "ESCALATED", "reason": "Counter test escalation"},
+            headers=authenticated_headers,
+            timeout=10,
+        )
+        assert escalated.status_code == 200, f"Escalate alert failed: {escalated.text}"
+        assert escalated.json()["severity"] == "CRITICAL", "Escalation should set CRITICAL"
+        
+        # Create, then resolve
+        created = requests.post(
+            alerts_url, json=alert_data, headers=authenticated_headers, timeout=10
+        )
+        assert created.status_code == 201, f"Create alert failed: {created.text}"
+        resolved_id = created.json()["alert_id"]
+        
+        resolved = requests.post(
+            f"{alerts_url}/{resolved_id}/resolve",
+            json={"resolution_notes": "Counter test resolution"},
+            headers=authenticated_headers,
+            timeout=10,
+        )
+        assert resolved.status_code == 200, f"Resolve alert failed: {resolved.text}"
+        
+        # The summary may be served from cache; poll until it catches up
+        deadline = time.time() + SUMMARY_SETTLE_SECONDS
+        mismatches = _summary_mismatches(base_url, authenticated_headers)
+        while mismatches and time.time() < deadline:
+            time.sleep(5)
+            mismatches = _summary_mismatches(base_url, authenticated_headers)
+        
+        assert not mismatches, (
+            f"Summary (summary, stored) counts still differ after "
+            f"{SUMMARY_SETTLE_SECONDS}s: {mismatches}"
+        )
+        
+        print("✅ Dashboard summary counts match stored alerts")
+        
+    except requests.exceptions.ConnectionError:
+        pytest.skip(f"Could not connect to {base_url}. Is the server running?")
+    except Exception as e:
+        pytest.fail(f"Unexpected error during summary counter test: {str(e)}")